@@ -12,6 +12,9 @@ from sqlmodel import SQLModel
 from tuitask.models.project import Project
 from tuitask.models.phase import Phase
 from tuitask.models.task import Task
+from tuitask.models.tag import Tag, TaskTag
+from tuitask.models.stats import PhaseStats, ProjectStats
+from tuitask.models.changes import ChangeClock, DeletedRow
 from tuitask.db.engine import DATABASE_URL
 
 # this is the Alembic Config object, which provides
@@ -86,9 +89,16 @@ async def run_async_migrations() -> None:
 
 
 def run_migrations_online() -> None:
-    """Run migrations in 'online' mode."""
+    """Run migrations in 'online' mode.
 
-    asyncio.run(run_async_migrations())
+    tuitask.db.engine.init_db hands over its own connection through
+    config.attributes; the alembic command line gets a fresh engine.
+    """
+    connection = config.attributes.get("connection")
+    if connection is None:
+        asyncio.run(run_async_migrations())
+    else:
+        do_run_migrations(connection)
 
 
 if context.is_offline_mode():
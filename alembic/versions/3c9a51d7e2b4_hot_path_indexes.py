@@ -0,0 +1,36 @@
+"""Hot path indexes for task and phase queries
+
+Revision ID: 3c9a51d7e2b4
+Revises: fab8ecee73a0
+Create Date: 2026-10-17 09:12:44.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9a51d7e2b4'
+down_revision: Union[str, Sequence[str], None] = 'fab8ecee73a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_phase_project_id', 'phase', ['project_id'], unique=False)
+    op.create_index('ix_task_assignee', 'task', ['assignee'], unique=False)
+    op.create_index('ix_task_due_date', 'task', ['due_date'], unique=False)
+    op.create_index('ix_task_phase_id_due_date', 'task', ['phase_id', 'due_date'], unique=False)
+    op.create_index('ix_task_status_due_date', 'task', ['status', 'due_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_status_due_date', table_name='task')
+    op.drop_index('ix_task_phase_id_due_date', table_name='task')
+    op.drop_index('ix_task_due_date', table_name='task')
+    op.drop_index('ix_task_assignee', table_name='task')
+    op.drop_index('ix_phase_project_id', table_name='phase')
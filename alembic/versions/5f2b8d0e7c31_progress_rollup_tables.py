@@ -0,0 +1,109 @@
+"""Trigger-maintained phase_stats / project_stats progress rollups
+
+Revision ID: 5f2b8d0e7c31
+Revises: c47d2e9b6a18
+Create Date: 2026-10-17 13:48:51.026397
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f2b8d0e7c31'
+down_revision: Union[str, Sequence[str], None] = 'c47d2e9b6a18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# This revision's own copy of tuitask.db.rollups as it stood then, so later
+# edits there do not change what it creates. task_archive arrives in a
+# later revision, so the rebuild counts live tasks only.
+
+ROLLUP_TRIGGERS = (
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_stats_ai AFTER INSERT ON task BEGIN '
+        'INSERT INTO phase_stats (phase_id, status, task_count) SELECT id, new.status, 1 FROM phase WHERE id = new.phase_id ON CONFLICT (phase_id, status) DO UPDATE SET task_count = task_count + 1; '
+        'INSERT INTO project_stats (project_id, status, task_count) SELECT project_id, new.status, 1 FROM phase WHERE id = new.phase_id AND project_id IS NOT NULL ON CONFLICT (project_id, status) DO UPDATE SET task_count = task_count + 1; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_stats_ad AFTER DELETE ON task BEGIN '
+        'UPDATE phase_stats SET task_count = task_count - 1 WHERE phase_id = old.phase_id AND status = old.status; '
+        'DELETE FROM phase_stats WHERE phase_id = old.phase_id AND status = old.status AND task_count <= 0; '
+        'UPDATE project_stats SET task_count = task_count - 1 WHERE status = old.status AND project_id = (SELECT project_id FROM phase WHERE id = old.phase_id); '
+        'DELETE FROM project_stats WHERE status = old.status AND task_count <= 0 AND project_id = (SELECT project_id FROM phase WHERE id = old.phase_id); '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_stats_au AFTER UPDATE OF status, phase_id ON task BEGIN '
+        'UPDATE phase_stats SET task_count = task_count - 1 WHERE phase_id = old.phase_id AND status = old.status; '
+        'DELETE FROM phase_stats WHERE phase_id = old.phase_id AND status = old.status AND task_count <= 0; '
+        'UPDATE project_stats SET task_count = task_count - 1 WHERE status = old.status AND project_id = (SELECT project_id FROM phase WHERE id = old.phase_id); '
+        'DELETE FROM project_stats WHERE status = old.status AND task_count <= 0 AND project_id = (SELECT project_id FROM phase WHERE id = old.phase_id); '
+        'INSERT INTO phase_stats (phase_id, status, task_count) SELECT id, new.status, 1 FROM phase WHERE id = new.phase_id ON CONFLICT (phase_id, status) DO UPDATE SET task_count = task_count + 1; '
+        'INSERT INTO project_stats (project_id, status, task_count) SELECT project_id, new.status, 1 FROM phase WHERE id = new.phase_id AND project_id IS NOT NULL ON CONFLICT (project_id, status) DO UPDATE SET task_count = task_count + 1; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS phase_stats_au AFTER UPDATE OF project_id ON phase BEGIN '
+        'UPDATE project_stats SET task_count = task_count - (SELECT s.task_count FROM phase_stats s WHERE s.phase_id = old.id AND s.status = project_stats.status) WHERE project_id = old.project_id AND status IN (SELECT status FROM phase_stats WHERE phase_id = old.id); '
+        'DELETE FROM project_stats WHERE project_id = old.project_id AND task_count <= 0; '
+        'INSERT INTO project_stats (project_id, status, task_count) SELECT new.project_id, status, task_count FROM phase_stats WHERE phase_id = new.id AND new.project_id IS NOT NULL ON CONFLICT (project_id, status) DO UPDATE SET task_count = task_count + excluded.task_count; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS phase_stats_ad AFTER DELETE ON phase BEGIN '
+        'UPDATE project_stats SET task_count = task_count - (SELECT s.task_count FROM phase_stats s WHERE s.phase_id = old.id AND s.status = project_stats.status) WHERE project_id = old.project_id AND status IN (SELECT status FROM phase_stats WHERE phase_id = old.id); '
+        'DELETE FROM project_stats WHERE project_id = old.project_id AND task_count <= 0; '
+        'DELETE FROM phase_stats WHERE phase_id = old.id; '
+        'END'
+    ),
+)
+
+REBUILD_SQL = (
+    'DELETE FROM phase_stats',
+    'DELETE FROM project_stats',
+    (
+        'INSERT INTO phase_stats (phase_id, status, task_count) '
+        'SELECT task.phase_id, task.status, count(*) FROM task '
+        'JOIN phase ON phase.id = task.phase_id GROUP BY task.phase_id, task.status'
+    ),
+    (
+        'INSERT INTO project_stats (project_id, status, task_count) '
+        'SELECT phase.project_id, task.status, count(*) FROM task '
+        'JOIN phase ON phase.id = task.phase_id WHERE phase.project_id IS NOT NULL '
+        'GROUP BY phase.project_id, task.status'
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'phase_stats',
+        sa.Column('phase_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('task_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['phase_id'], ['phase.id']),
+        sa.PrimaryKeyConstraint('phase_id', 'status'),
+    )
+    op.create_table(
+        'project_stats',
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('task_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['project.id']),
+        sa.PrimaryKeyConstraint('project_id', 'status'),
+    )
+    for statement in ROLLUP_TRIGGERS + REBUILD_SQL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for trigger in ('task_stats_ai', 'task_stats_ad', 'task_stats_au', 'phase_stats_au', 'phase_stats_ad'):
+        op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+    op.drop_table('project_stats')
+    op.drop_table('phase_stats')
@@ -0,0 +1,193 @@
+"""task_archive table, task_all view and AUTOINCREMENT task ids
+
+Revision ID: 7c0e5a9f3d62
+Revises: d2b7f4a8c015
+Create Date: 2026-10-17 16:27:45.903316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c0e5a9f3d62'
+down_revision: Union[str, Sequence[str], None] = 'd2b7f4a8c015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The DDL below is this revision's own copy, as tuitask.db.archive, fts,
+# rollups and versioning defined it at the time; later edits there must
+# not change what this revision creates.
+
+TASK_COLUMNS = (
+    'id, title, status, assignee, priority, phase_id, start_date, due_date, '
+    'tags_str, links_str, requires_signoff, row_version, updated_at'
+)
+
+VIEW_DDL = (
+    'CREATE VIEW IF NOT EXISTS task_all AS '
+    f'SELECT {TASK_COLUMNS}, 0 AS archived FROM task '
+    f'UNION ALL SELECT {TASK_COLUMNS}, 1 AS archived FROM task_archive'
+)
+
+FTS_DDL = (
+    (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS task_fts USING fts5("
+        "title, tags_str, content='task', content_rowid='id', tokenize='unicode61', prefix='2 3')"
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_fts_ai AFTER INSERT ON task BEGIN '
+        'INSERT INTO task_fts(rowid, title, tags_str) VALUES (new.id, new.title, new.tags_str); '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_fts_ad AFTER DELETE ON task BEGIN '
+        "INSERT INTO task_fts(task_fts, rowid, title, tags_str) VALUES ('delete', old.id, old.title, old.tags_str); "
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_fts_au AFTER UPDATE OF title, tags_str ON task BEGIN '
+        "INSERT INTO task_fts(task_fts, rowid, title, tags_str) VALUES ('delete', old.id, old.title, old.tags_str); "
+        'INSERT INTO task_fts(rowid, title, tags_str) VALUES (new.id, new.title, new.tags_str); '
+        'END'
+    ),
+    (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS task_archive_fts USING fts5("
+        "title, tags_str, content='task_archive', content_rowid='id', tokenize='unicode61', prefix='2 3')"
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_archive_fts_ai AFTER INSERT ON task_archive BEGIN '
+        'INSERT INTO task_archive_fts(rowid, title, tags_str) VALUES (new.id, new.title, new.tags_str); '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_archive_fts_ad AFTER DELETE ON task_archive BEGIN '
+        "INSERT INTO task_archive_fts(task_archive_fts, rowid, title, tags_str) VALUES ('delete', old.id, old.title, old.tags_str); "
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_archive_fts_au AFTER UPDATE OF title, tags_str ON task_archive BEGIN '
+        "INSERT INTO task_archive_fts(task_archive_fts, rowid, title, tags_str) VALUES ('delete', old.id, old.title, old.tags_str); "
+        'INSERT INTO task_archive_fts(rowid, title, tags_str) VALUES (new.id, new.title, new.tags_str); '
+        'END'
+    ),
+)
+
+# Every trigger on task, which the AUTOINCREMENT rebuild drops.
+TASK_TRIGGERS = (
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_stats_ai AFTER INSERT ON task BEGIN '
+        'INSERT INTO phase_stats (phase_id, status, task_count) SELECT id, new.status, 1 FROM phase WHERE id = new.phase_id ON CONFLICT (phase_id, status) DO UPDATE SET task_count = task_count + 1; '
+        'INSERT INTO project_stats (project_id, status, task_count) SELECT project_id, new.status, 1 FROM phase WHERE id = new.phase_id AND project_id IS NOT NULL ON CONFLICT (project_id, status) DO UPDATE SET task_count = task_count + 1; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_stats_ad AFTER DELETE ON task BEGIN '
+        'UPDATE phase_stats SET task_count = task_count - 1 WHERE phase_id = old.phase_id AND status = old.status; '
+        'DELETE FROM phase_stats WHERE phase_id = old.phase_id AND status = old.status AND task_count <= 0; '
+        'UPDATE project_stats SET task_count = task_count - 1 WHERE status = old.status AND project_id = (SELECT project_id FROM phase WHERE id = old.phase_id); '
+        'DELETE FROM project_stats WHERE status = old.status AND task_count <= 0 AND project_id = (SELECT project_id FROM phase WHERE id = old.phase_id); '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_stats_au AFTER UPDATE OF status, phase_id ON task BEGIN '
+        'UPDATE phase_stats SET task_count = task_count - 1 WHERE phase_id = old.phase_id AND status = old.status; '
+        'DELETE FROM phase_stats WHERE phase_id = old.phase_id AND status = old.status AND task_count <= 0; '
+        'UPDATE project_stats SET task_count = task_count - 1 WHERE status = old.status AND project_id = (SELECT project_id FROM phase WHERE id = old.phase_id); '
+        'DELETE FROM project_stats WHERE status = old.status AND task_count <= 0 AND project_id = (SELECT project_id FROM phase WHERE id = old.phase_id); '
+        'INSERT INTO phase_stats (phase_id, status, task_count) SELECT id, new.status, 1 FROM phase WHERE id = new.phase_id ON CONFLICT (phase_id, status) DO UPDATE SET task_count = task_count + 1; '
+        'INSERT INTO project_stats (project_id, status, task_count) SELECT project_id, new.status, 1 FROM phase WHERE id = new.phase_id AND project_id IS NOT NULL ON CONFLICT (project_id, status) DO UPDATE SET task_count = task_count + 1; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_version_ai AFTER INSERT ON task BEGIN '
+        'UPDATE change_clock SET version = version + 1 WHERE id = 1; '
+        'UPDATE task SET row_version = (SELECT version FROM change_clock WHERE id = 1), updated_at = CURRENT_TIMESTAMP WHERE id = new.id; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_version_au AFTER UPDATE ON task WHEN new.row_version IS old.row_version BEGIN '
+        'UPDATE change_clock SET version = version + 1 WHERE id = 1; '
+        'UPDATE task SET row_version = (SELECT version FROM change_clock WHERE id = 1), updated_at = CURRENT_TIMESTAMP WHERE id = new.id; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_version_claim AFTER UPDATE OF row_version ON task WHEN new.row_version IS NOT old.row_version BEGIN '
+        'UPDATE change_clock SET version = max(version, new.row_version) WHERE id = 1; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_version_ad AFTER DELETE ON task BEGIN '
+        'UPDATE change_clock SET version = version + 1 WHERE id = 1; '
+        "INSERT INTO deleted_row (kind, row_id, row_version) SELECT 'task', old.id, version FROM change_clock WHERE id = 1; "
+        'END'
+    ),
+)
+
+ARCHIVE_TRIGGERS = (
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_archive_stats_ai AFTER INSERT ON task_archive BEGIN '
+        'INSERT INTO phase_stats (phase_id, status, task_count) SELECT id, new.status, 1 FROM phase WHERE id = new.phase_id ON CONFLICT (phase_id, status) DO UPDATE SET task_count = task_count + 1; '
+        'INSERT INTO project_stats (project_id, status, task_count) SELECT project_id, new.status, 1 FROM phase WHERE id = new.phase_id AND project_id IS NOT NULL ON CONFLICT (project_id, status) DO UPDATE SET task_count = task_count + 1; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_archive_stats_ad AFTER DELETE ON task_archive BEGIN '
+        'UPDATE phase_stats SET task_count = task_count - 1 WHERE phase_id = old.phase_id AND status = old.status; '
+        'DELETE FROM phase_stats WHERE phase_id = old.phase_id AND status = old.status AND task_count <= 0; '
+        'UPDATE project_stats SET task_count = task_count - 1 WHERE status = old.status AND project_id = (SELECT project_id FROM phase WHERE id = old.phase_id); '
+        'DELETE FROM project_stats WHERE status = old.status AND task_count <= 0 AND project_id = (SELECT project_id FROM phase WHERE id = old.phase_id); '
+        'END'
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'task_archive',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('assignee', sa.String(), nullable=False),
+        sa.Column('priority', sa.Integer(), nullable=False),
+        sa.Column('phase_id', sa.Integer(), nullable=True),
+        sa.Column('start_date', sa.Date(), nullable=False),
+        sa.Column('due_date', sa.Date(), nullable=False),
+        sa.Column('tags_str', sa.String(), nullable=False),
+        sa.Column('links_str', sa.String(), nullable=False),
+        sa.Column('requires_signoff', sa.Boolean(), nullable=False),
+        sa.Column('row_version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('archived_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    for column in ('assignee', 'due_date', 'row_version'):
+        op.create_index(op.f(f'ix_task_archive_{column}'), 'task_archive', [column], unique=False)
+
+    # Archived rows keep their ids, so task ids must never be reused: rebuild
+    # task as AUTOINCREMENT. The rebuild drops the triggers on task, which are
+    # all re-created below.
+    with op.batch_alter_table('task', recreate='always', table_kwargs={'sqlite_autoincrement': True}):
+        pass
+
+    for statement in FTS_DDL + TASK_TRIGGERS + ARCHIVE_TRIGGERS:
+        op.execute(statement)
+    op.execute(VIEW_DDL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP VIEW IF EXISTS task_all')
+    # Archived rows go back to the live table rather than being dropped.
+    op.execute(f'INSERT INTO task ({TASK_COLUMNS}) SELECT {TASK_COLUMNS} FROM task_archive')
+    for trigger in ('task_archive_stats_ai', 'task_archive_stats_ad',
+                    'task_archive_fts_ai', 'task_archive_fts_ad', 'task_archive_fts_au'):
+        op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+    op.execute('DROP TABLE IF EXISTS task_archive_fts')
+    for column in ('assignee', 'due_date', 'row_version'):
+        op.drop_index(op.f(f'ix_task_archive_{column}'), table_name='task_archive')
+    op.drop_table('task_archive')
+    # task keeps AUTOINCREMENT; it only affects how new ids are chosen.
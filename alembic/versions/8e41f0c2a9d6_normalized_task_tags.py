@@ -0,0 +1,63 @@
+"""Normalized tag and task_tag tables backfilled from task.tags_str
+
+Revision ID: 8e41f0c2a9d6
+Revises: 3c9a51d7e2b4
+Create Date: 2026-10-17 10:03:27.114950
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e41f0c2a9d6'
+down_revision: Union[str, Sequence[str], None] = '3c9a51d7e2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'tag',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_tag_name', 'tag', ['name'], unique=True)
+    op.create_table(
+        'tasktag',
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('tag_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['tag_id'], ['tag.id']),
+        sa.ForeignKeyConstraint(['task_id'], ['task.id']),
+        sa.PrimaryKeyConstraint('task_id', 'tag_id'),
+    )
+    op.create_index('ix_tasktag_tag_id', 'tasktag', ['tag_id'], unique=False)
+
+    # Backfill: split every task's comma string into tag + link rows.
+    bind = op.get_bind()
+    tag_ids: dict[str, int] = {}
+    links: list[dict] = []
+    for task_id, tags_str in bind.execute(sa.text("SELECT id, tags_str FROM task WHERE tags_str != ''")):
+        names = dict.fromkeys(part.strip().lower() for part in tags_str.split(","))
+        for name in names:
+            if not name:
+                continue
+            if name not in tag_ids:
+                tag_ids[name] = bind.execute(
+                    sa.text("INSERT INTO tag (name) VALUES (:name) RETURNING id"), {"name": name}
+                ).scalar_one()
+            links.append({"task_id": task_id, "tag_id": tag_ids[name]})
+    if links:
+        bind.execute(sa.text("INSERT INTO tasktag (task_id, tag_id) VALUES (:task_id, :tag_id)"), links)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasktag_tag_id', table_name='tasktag')
+    op.drop_table('tasktag')
+    op.drop_index('ix_tag_name', table_name='tag')
+    op.drop_table('tag')
@@ -0,0 +1,124 @@
+"""Row versions, change clock and delete tombstones for the change feed
+
+Revision ID: a93e6c1d4b27
+Revises: 5f2b8d0e7c31
+Create Date: 2026-10-17 15:02:37.514820
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a93e6c1d4b27'
+down_revision: Union[str, Sequence[str], None] = '5f2b8d0e7c31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# This revision's own copy of tuitask.db.versioning as it stood then; the
+# claim triggers came later (d2b7f4a8c015) and are not created here.
+
+VERSIONED_TABLES = ('task', 'phase', 'project')
+
+SEED_CLOCK = 'INSERT OR IGNORE INTO change_clock (id, version) VALUES (1, 0)'
+
+VERSION_TRIGGERS = (
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_version_ai AFTER INSERT ON task BEGIN '
+        'UPDATE change_clock SET version = version + 1 WHERE id = 1; '
+        'UPDATE task SET row_version = (SELECT version FROM change_clock WHERE id = 1), updated_at = CURRENT_TIMESTAMP WHERE id = new.id; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_version_au AFTER UPDATE ON task WHEN new.row_version IS old.row_version BEGIN '
+        'UPDATE change_clock SET version = version + 1 WHERE id = 1; '
+        'UPDATE task SET row_version = (SELECT version FROM change_clock WHERE id = 1), updated_at = CURRENT_TIMESTAMP WHERE id = new.id; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_version_ad AFTER DELETE ON task BEGIN '
+        'UPDATE change_clock SET version = version + 1 WHERE id = 1; '
+        "INSERT INTO deleted_row (kind, row_id, row_version) SELECT 'task', old.id, version FROM change_clock WHERE id = 1; "
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS phase_version_ai AFTER INSERT ON phase BEGIN '
+        'UPDATE change_clock SET version = version + 1 WHERE id = 1; '
+        'UPDATE phase SET row_version = (SELECT version FROM change_clock WHERE id = 1), updated_at = CURRENT_TIMESTAMP WHERE id = new.id; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS phase_version_au AFTER UPDATE ON phase WHEN new.row_version IS old.row_version BEGIN '
+        'UPDATE change_clock SET version = version + 1 WHERE id = 1; '
+        'UPDATE phase SET row_version = (SELECT version FROM change_clock WHERE id = 1), updated_at = CURRENT_TIMESTAMP WHERE id = new.id; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS phase_version_ad AFTER DELETE ON phase BEGIN '
+        'UPDATE change_clock SET version = version + 1 WHERE id = 1; '
+        "INSERT INTO deleted_row (kind, row_id, row_version) SELECT 'phase', old.id, version FROM change_clock WHERE id = 1; "
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS project_version_ai AFTER INSERT ON project BEGIN '
+        'UPDATE change_clock SET version = version + 1 WHERE id = 1; '
+        'UPDATE project SET row_version = (SELECT version FROM change_clock WHERE id = 1), updated_at = CURRENT_TIMESTAMP WHERE id = new.id; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS project_version_au AFTER UPDATE ON project WHEN new.row_version IS old.row_version BEGIN '
+        'UPDATE change_clock SET version = version + 1 WHERE id = 1; '
+        'UPDATE project SET row_version = (SELECT version FROM change_clock WHERE id = 1), updated_at = CURRENT_TIMESTAMP WHERE id = new.id; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS project_version_ad AFTER DELETE ON project BEGIN '
+        'UPDATE change_clock SET version = version + 1 WHERE id = 1; '
+        "INSERT INTO deleted_row (kind, row_id, row_version) SELECT 'project', old.id, version FROM change_clock WHERE id = 1; "
+        'END'
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'change_clock',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_table(
+        'deleted_row',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('row_id', sa.Integer(), nullable=False),
+        sa.Column('row_version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_deleted_row_row_version'), 'deleted_row', ['row_version'], unique=False)
+    # Plain ADD COLUMN: a batch (copy-and-rename) rebuild would drop the
+    # FTS and rollup triggers already defined on these tables.
+    for table in VERSIONED_TABLES:
+        op.add_column(table, sa.Column('row_version', sa.Integer(), nullable=False, server_default='0'))
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.create_index(op.f(f'ix_{table}_row_version'), table, ['row_version'], unique=False)
+    op.execute(SEED_CLOCK)
+    for statement in VERSION_TRIGGERS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in VERSIONED_TABLES:
+        for suffix in ('ai', 'au', 'ad'):
+            op.execute(f'DROP TRIGGER IF EXISTS {table}_version_{suffix}')
+        op.drop_index(op.f(f'ix_{table}_row_version'), table_name=table)
+        # Native DROP COLUMN (SQLite 3.35+) keeps the other triggers intact.
+        op.execute(f'ALTER TABLE {table} DROP COLUMN updated_at')
+        op.execute(f'ALTER TABLE {table} DROP COLUMN row_version')
+    op.drop_index(op.f('ix_deleted_row_row_version'), table_name='deleted_row')
+    op.drop_table('deleted_row')
+    op.drop_table('change_clock')
@@ -0,0 +1,33 @@
+"""Drop the status and assignee indexes the substring filters never use
+
+Revision ID: b5d3e7a1c904
+Revises: 7c0e5a9f3d62
+Create Date: 2026-10-17 18:05:12.330471
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d3e7a1c904'
+down_revision: Union[str, Sequence[str], None] = '7c0e5a9f3d62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_task_status_due_date', table_name='task')
+    op.drop_index('ix_task_assignee', table_name='task')
+    # task_archive copies task's column indexes, so it loses this one too.
+    op.drop_index('ix_task_archive_assignee', table_name='task_archive')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_task_archive_assignee', 'task_archive', ['assignee'], unique=False)
+    op.create_index('ix_task_assignee', 'task', ['assignee'], unique=False)
+    op.create_index('ix_task_status_due_date', 'task', ['status', 'due_date'], unique=False)
@@ -0,0 +1,51 @@
+"""FTS5 search tables over task, phase and project with sync triggers
+
+Revision ID: c47d2e9b6a18
+Revises: 8e41f0c2a9d6
+Create Date: 2026-10-17 11:26:05.730412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47d2e9b6a18'
+down_revision: Union[str, Sequence[str], None] = '8e41f0c2a9d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FTS_SOURCES = {
+    'task': ('title', 'tags_str'),
+    'phase': ('name', 'description'),
+    'project': ('name', 'description'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for source, columns in FTS_SOURCES.items():
+        fts = f'{source}_fts'
+        cols = ', '.join(columns)
+        new_vals = ', '.join(f'new.{c}' for c in columns)
+        old_vals = ', '.join(f'old.{c}' for c in columns)
+        insert_new = f'INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_vals});'
+        delete_old = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_vals});"
+        op.execute(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5("
+            f"{cols}, content='{source}', content_rowid='id', tokenize='unicode61', prefix='2 3')"
+        )
+        op.execute(f'CREATE TRIGGER {fts}_ai AFTER INSERT ON {source} BEGIN {insert_new} END')
+        op.execute(f'CREATE TRIGGER {fts}_ad AFTER DELETE ON {source} BEGIN {delete_old} END')
+        op.execute(f'CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {source} BEGIN {delete_old} {insert_new} END')
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for source in FTS_SOURCES:
+        for suffix in ('ai', 'ad', 'au'):
+            op.execute(f'DROP TRIGGER IF EXISTS {source}_fts_{suffix}')
+        op.execute(f'DROP TABLE IF EXISTS {source}_fts')
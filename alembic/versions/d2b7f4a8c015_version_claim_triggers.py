@@ -0,0 +1,53 @@
+"""Catch the change clock up when an UPDATE assigns row_version itself
+
+Revision ID: d2b7f4a8c015
+Revises: a93e6c1d4b27
+Create Date: 2026-10-17 15:41:09.287164
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b7f4a8c015'
+down_revision: Union[str, Sequence[str], None] = 'a93e6c1d4b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# This revision's own copy of the claim triggers from tuitask.db.versioning;
+# the other version triggers come from a93e6c1d4b27.
+
+VERSIONED_TABLES = ('task', 'phase', 'project')
+
+CLAIM_TRIGGERS = (
+    (
+        'CREATE TRIGGER IF NOT EXISTS task_version_claim AFTER UPDATE OF row_version ON task WHEN new.row_version IS NOT old.row_version BEGIN '
+        'UPDATE change_clock SET version = max(version, new.row_version) WHERE id = 1; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS phase_version_claim AFTER UPDATE OF row_version ON phase WHEN new.row_version IS NOT old.row_version BEGIN '
+        'UPDATE change_clock SET version = max(version, new.row_version) WHERE id = 1; '
+        'END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS project_version_claim AFTER UPDATE OF row_version ON project WHEN new.row_version IS NOT old.row_version BEGIN '
+        'UPDATE change_clock SET version = max(version, new.row_version) WHERE id = 1; '
+        'END'
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for statement in CLAIM_TRIGGERS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in VERSIONED_TABLES:
+        op.execute(f'DROP TRIGGER IF EXISTS {table}_version_claim')
@@ -0,0 +1,274 @@
+"""Headless benchmarks for the crud, filtering and rendering paths.
+
+Each size gets a synthetic database (tuitask.db.synthetic, seed 0) in a
+temporary directory; the rendering cases mount the task views in a bare App
+driven by Textual's run_test() pilot. Results go to a JSON file so runs can
+be compared across commits:
+
+    python benchmark.py --output before.json
+    python benchmark.py --output after.json --baseline before.json
+
+Exit status is 1 when a case exceeds its threshold or regresses against the
+baseline.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+SIZES = (1_000, 10_000, 100_000)
+
+# A run slower than the baseline by more than this share (and by at least
+# REGRESSION_MIN_MS) counts as a regression.
+REGRESSION_TOLERANCE = 0.25
+REGRESSION_MIN_MS = 5.0
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    # Threshold in ms: fixed_ms + per_task_us * size / 1000, set at two to
+    # three times the measured time so a real slowdown trips it.
+    fixed_ms: float = 0.0
+    per_task_us: float = 0.0
+    # Thresholds by size, for cases whose cost does not follow a straight line.
+    size_ms: dict[int, float] = field(default_factory=dict)
+
+    def threshold_ms(self, size: int) -> float:
+        if size in self.size_ms:
+            return self.size_ms[size]
+        return self.fixed_ms + self.per_task_us * size / 1000
+
+
+CASES = {
+    case.name: case for case in (
+        # Projects, phases, rollup progress and the first page: the screen's load.
+        Case("vm.load_snapshot", fixed_ms=40),
+        Case("crud.get_all_tasks", fixed_ms=0, per_task_us=65),
+        Case("crud.update_task", fixed_ms=10),
+        Case("pager.filter_first_page", fixed_ms=5, per_task_us=0.5),
+        Case("screen.build_task_items", fixed_ms=0, per_task_us=14),
+        # Measured at about 0.4 s, 3.3 s and 32 s; 100k gets one and a half
+        # times rather than two, or a doubling there would still pass.
+        Case("table.set_tasks", size_ms={1_000: 1_000, 10_000: 8_000, 100_000: 50_000}),
+        # One edited task re-set on a full table: a keyed diff, not a refill.
+        Case("table.set_tasks_one_edit", fixed_ms=250, per_task_us=18),
+        # The card grid is windowed: its cost follows the screen, not the list.
+        Case("cards.set_tasks", fixed_ms=1_000),
+    )
+}
+
+
+async def timed(
+    run: Callable[[], Awaitable[object]],
+    repeat: int,
+    setup: Callable[[], Awaitable[object]] | None = None,
+) -> float:
+    """Median wall time of `repeat` runs, in ms; `setup` runs untimed before each."""
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            await setup()
+        start = time.perf_counter()
+        await run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def measure(size: int, repeat: int) -> dict[str, float]:
+    """Times for every case at one size.
+
+    Imports happen here, after main() has pointed TUITASK_DB_PATH at the
+    benchmark database.
+    """
+    from textual.app import App, ComposeResult
+
+    from tuitask.db.crud import tasks as task_crud
+    from tuitask.db.engine import async_session, engine, init_db, unit_of_work
+    from tuitask.db.synthetic import SeedPlan, seed_synthetic
+    from tuitask.models.task_filter import TaskFilter
+    from tuitask.ui.screens.tasks import TasksScreen
+    from tuitask.ui.widgets.tasks_cards import TasksCardsView
+    from tuitask.ui.widgets.tasks_table import TasksTableView
+    from tuitask.viewmodels.tasks_viewmodel import TasksViewModel
+
+    await init_db()
+    async with unit_of_work() as session:
+        await seed_synthetic(session, SeedPlan(projects=20, phases=100, tasks=size))
+
+    vm = TasksViewModel()
+    snapshot = await vm.load_snapshot(TaskFilter(), page_size=size)
+    screen = TasksScreen()
+    screen.snapshot = snapshot
+    items = screen.build_task_items(snapshot.tasks)
+    target = snapshot.tasks[len(snapshot.tasks) // 2]
+
+    async def load_snapshot():
+        await vm.load_snapshot(TaskFilter(), page_size=200)
+
+    async def all_tasks():
+        async with async_session() as session:
+            await task_crud.get_all_tasks(session)
+
+    async def update_task():
+        async with unit_of_work() as session:
+            await task_crud.update_task(session, target.id, {"priority": target.priority % 5 + 1})
+
+    async def filter_first_page():
+        await vm.pager(TaskFilter(status="started", title="login"), page_size=200).next_page()
+
+    async def build_task_items():
+        screen.build_task_items(snapshot.tasks)
+
+    results: dict[str, float] = {
+        "vm.load_snapshot": await timed(load_snapshot, repeat),
+        "crud.get_all_tasks": await timed(all_tasks, repeat),
+        "crud.update_task": await timed(update_task, repeat),
+        "pager.filter_first_page": await timed(filter_first_page, repeat),
+        "screen.build_task_items": await timed(build_task_items, repeat),
+    }
+
+    class BenchmarkApp(App):
+        CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tuitask", "styles.tcss")
+
+        def compose(self) -> ComposeResult:
+            yield TasksTableView(id="TasksTableView")
+            yield TasksCardsView(id="TasksCardsView")
+
+    app = BenchmarkApp()
+    async with app.run_test(size=(160, 50)) as pilot:
+        for name, view in (("table.set_tasks", TasksTableView), ("cards.set_tasks", TasksCardsView)):
+            async def empty(view=view):
+                # set_tasks diffs against what is shown, so start each fill empty.
+                app.query_one(view).set_tasks([])
+                await pilot.pause()
+
+            async def render(view=view):
+                app.query_one(view).set_tasks(items)
+                # Let the mounts, layout and first paint finish.
+                await pilot.pause()
+
+            results[name] = await timed(render, repeat, setup=empty)
+
+        table_view = app.query_one(TasksTableView)
+        table_view.set_tasks(items)
+        await pilot.pause()
+        edited = list(items)
+        middle = len(edited) // 2
+
+        async def edit_one():
+            task = edited[middle].task
+            edited[middle] = replace(edited[middle], task=task.model_copy(update={"priority": task.priority % 5 + 1}))
+            table_view.set_tasks(edited)
+            await pilot.pause()
+
+        results["table.set_tasks_one_edit"] = await timed(edit_one, repeat)
+
+    await engine.dispose()
+    return results
+
+
+def run_size(size: int, repeat: int) -> dict[str, float]:
+    """Benchmark one size in a child process with its own database.
+
+    The engine is configured from the environment at import time, so each
+    database needs a fresh interpreter.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(os.environ, TUITASK_DB_PATH=os.path.join(directory, "bench.db"))
+        result = subprocess.run(
+            [sys.executable, __file__, "--child", str(size), "--repeat", str(repeat)],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def load_baseline(path: str) -> dict[tuple[str, int], float]:
+    with open(path) as handle:
+        report = json.load(handle)
+    return {
+        (row["case"], row["size"]): row["ms"]
+        for row in report["results"] if row["ms"] is not None
+    }
+
+
+def judge(case: Case, size: int, ms: float, baseline: dict[tuple[str, int], float]) -> str:
+    if ms > case.threshold_ms(size):
+        return "over-threshold"
+    before = baseline.get((case.name, size))
+    if before is not None and ms > before * (1 + REGRESSION_TOLERANCE) and ms - before > REGRESSION_MIN_MS:
+        return "regression"
+    return "ok"
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="TUITASK headless benchmarks.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the median is reported.")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", help="Earlier results to compare against.")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child is not None:
+        print(json.dumps(asyncio.run(measure(args.child, args.repeat))))
+        return 0
+
+    baseline = load_baseline(args.baseline) if args.baseline else {}
+    rows = []
+    for size in args.sizes:
+        print(f"Benchmarking {size} tasks ...")
+        for name, ms in run_size(size, args.repeat).items():
+            case = CASES[name]
+            status = judge(case, size, ms, baseline)
+            rows.append({
+                "case": name,
+                "size": size,
+                "ms": round(ms, 3),
+                "threshold_ms": case.threshold_ms(size),
+                "baseline_ms": baseline.get((name, size)),
+                "status": status,
+            })
+            print(f"  {status:<14} {name:<26} {ms:10.1f} ms")
+
+    report = {
+        "commit": git_commit(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "results": rows,
+    }
+    with open(args.output, "w") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Wrote {args.output}")
+    return 1 if any(row["status"] in ("over-threshold", "regression") for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
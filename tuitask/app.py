@@ -1,7 +1,6 @@
 from textual.app import App
+from textual import work
 from tuitask.views.main_screen import MainScreen
-from tuitask.db.engine import init_db
-from tuitask.viewmodels.tasks_viewmodel import TasksViewModel
 
 class TuiTaskApp(App):
     CSS_PATH = "styles.tcss"
@@ -15,15 +14,29 @@ class TuiTaskApp(App):
     async def on_mount(self) -> None:
         import logging
         logging.debug("App mounted")
-        
-        # Init DB
-        await init_db()
-        
-        # Seed Data (Async)
-        vm = TasksViewModel()
-        await vm.seed_sample_data()
-        
+
+        # First frame first; the tasks view waits for warm_up_db to finish.
         self.push_screen(MainScreen())
+        self.warm_up_db()
+
+    @work(exclusive=True, group="startup")
+    async def warm_up_db(self) -> None:
+        # The ORM stack is imported here, off the first frame's path; the
+        # import runs in a thread so the loop keeps drawing meanwhile.
+        import asyncio, importlib
+        viewmodel = await asyncio.to_thread(importlib.import_module, "tuitask.viewmodels.tasks_viewmodel")
+        from tuitask.db.engine import init_db
+
+        await init_db()
+        if await viewmodel.TasksViewModel().seed_sample_data():
+            # The tasks view may have loaded before the sample rows landed.
+            for tasks_screen in self.screen.query("TasksScreen"):
+                tasks_screen.apply_changes()
+
+    async def on_unmount(self) -> None:
+        # Flush queued writes before the event loop goes away.
+        from tuitask.db.writer import write_queue
+        await write_queue.close()
 
     def action_add_task(self) -> None:
         # If on MainScreen, trigger its add_task action
@@ -31,6 +44,11 @@ class TuiTaskApp(App):
             self.screen.action_add_task()
 
 def run() -> None:
+    import sys
+    if len(sys.argv) > 1:
+        from tuitask.commands import main
+        sys.exit(main(sys.argv[1:]))
+
     import logging
     logging.basicConfig(filename="tuitask.log", level=logging.DEBUG, filemode='w')
     logging.info("Starting TUITASK")
@@ -0,0 +1,103 @@
+"""Maintenance subcommands for the `tuitask` entry point (no UI)."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from tuitask.db.engine import async_session, init_db, unit_of_work
+
+
+async def stats_rebuild(args: argparse.Namespace) -> int:
+    from tuitask.db.crud import stats as stats_crud
+    async with unit_of_work() as session:
+        await stats_crud.rebuild_rollups(session)
+    print("Rebuilt phase_stats and project_stats from the task table.")
+    return 0
+
+
+async def stats_check(args: argparse.Namespace) -> int:
+    from tuitask.db.crud import stats as stats_crud
+    async with async_session() as session:
+        mismatches = await stats_crud.check_rollups(session)
+    for m in mismatches:
+        print(f"{m.table} {m.key}: expected {m.expected}, found {m.actual}")
+    if mismatches:
+        print(f"{len(mismatches)} rollup rows out of date; run `tuitask stats rebuild`.")
+        return 1
+    print("Rollups are consistent.")
+    return 0
+
+
+async def archive_run(args: argparse.Namespace) -> int:
+    from tuitask.db.crud import archive as archive_crud
+    from tuitask.db.engine import config
+    days = config.archive_after_days if args.days is None else args.days
+    async with unit_of_work() as session:
+        moved = await archive_crud.archive_tasks(session, older_than_days=days)
+    print(f"Archived {moved} completed tasks older than {days} days.")
+    return 0
+
+
+async def archive_restore(args: argparse.Namespace) -> int:
+    from tuitask.db.crud import archive as archive_crud
+    async with unit_of_work() as session:
+        moved = await archive_crud.restore_tasks(session, args.task_ids)
+    print(f"Restored {moved} of {len(args.task_ids)} tasks.")
+    return 0 if moved == len(args.task_ids) else 1
+
+
+async def seed(args: argparse.Namespace) -> int:
+    from tuitask.db import synthetic
+    from tuitask.db.crud import tasks as task_crud
+    if not args.append:
+        async with async_session() as session:
+            if await task_crud.has_tasks(session):
+                print("The database already has tasks; pass --append or point TUITASK_DB_PATH at a new file.")
+                return 1
+    plan = synthetic.SeedPlan(projects=args.projects, phases=args.phases, tasks=args.tasks, seed=args.seed)
+    async with unit_of_work() as session:
+        result = await synthetic.seed_synthetic(session, plan)
+    print(
+        f"Seeded {len(result.project_ids)} projects, {len(result.phase_ids)} phases and "
+        f"{result.tasks} tasks (seed {plan.seed})."
+    )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="tuitask", description="TUITASK maintenance commands.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    stats = commands.add_parser("stats", help="Progress rollup tables.")
+    stats_commands = stats.add_subparsers(dest="stats_command", required=True)
+    stats_commands.add_parser("rebuild", help="Recompute rollups from scratch.").set_defaults(handler=stats_rebuild)
+    stats_commands.add_parser("check", help="Verify rollups against the task table.").set_defaults(handler=stats_check)
+
+    archive = commands.add_parser("archive", help="Move old completed tasks out of the live table.")
+    archive_commands = archive.add_subparsers(dest="archive_command", required=True)
+    run_parser = archive_commands.add_parser("run", help="Archive completed tasks past the age limit.")
+    run_parser.add_argument("--days", type=int, help="Age limit (default: TUITASK_ARCHIVE_AFTER_DAYS or 30).")
+    run_parser.set_defaults(handler=archive_run)
+    restore_parser = archive_commands.add_parser("restore", help="Move archived tasks back by id.")
+    restore_parser.add_argument("task_ids", type=int, nargs="+")
+    restore_parser.set_defaults(handler=archive_restore)
+
+    seed_parser = commands.add_parser("seed", help="Generate a reproducible synthetic dataset.")
+    seed_parser.add_argument("--projects", type=int, default=20)
+    seed_parser.add_argument("--phases", type=int, default=100, help="Total phases, dealt across the projects.")
+    seed_parser.add_argument("--tasks", type=int, default=100_000)
+    seed_parser.add_argument("--seed", type=int, default=0, help="Random seed; same arguments, same data.")
+    seed_parser.add_argument("--append", action="store_true", help="Allow seeding a database that has tasks.")
+    seed_parser.set_defaults(handler=seed)
+
+    return parser
+
+
+def main(argv: list[str]) -> int:
+    args = build_parser().parse_args(argv)
+
+    async def run_command() -> int:
+        await init_db()
+        return await args.handler(args)
+
+    return asyncio.run(run_command())
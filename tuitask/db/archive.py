@@ -0,0 +1,49 @@
+"""Hot/cold split for tasks: `task_archive` storage and the `task_all` view.
+
+Completed tasks past the archive age move out of `task` (crud.archive), so
+the live table, its indexes and everything paging it stay small. Filters
+reach archived rows only through `task_all` when a TaskFilter asks for them
+(include_archived); progress rollups and FTS cover both tables.
+"""
+from __future__ import annotations
+
+from sqlalchemy import Boolean, Column, MetaData, Table, event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import aliased
+from sqlmodel import SQLModel
+
+from tuitask.models.task import Task, task_archive
+# aliased() configures the mappers, so Task's relationship targets must exist.
+from tuitask.models.phase import Phase  # noqa: F401
+from tuitask.models.project import Project  # noqa: F401
+
+TASK_COLUMNS = tuple(column.name for column in Task.__table__.columns)
+
+# Views are kept out of SQLModel.metadata so create_all leaves them alone.
+view_metadata = MetaData()
+
+task_all = Table(
+    "task_all",
+    view_metadata,
+    *(Column(column.name, column.type, primary_key=column.primary_key) for column in Task.__table__.columns),
+    Column("archived", Boolean),
+)
+
+# Task rows read through the view; archived ids never collide with live ones.
+TaskAll = aliased(Task, task_all, name="task_all", adapt_on_names=True)
+
+_columns = ", ".join(TASK_COLUMNS)
+VIEW_DDL = (
+    f"CREATE VIEW IF NOT EXISTS task_all AS "
+    f"SELECT {_columns}, 0 AS archived FROM task "
+    f"UNION ALL SELECT {_columns}, 1 AS archived FROM {task_archive.name}"
+)
+
+
+def create_archive_view(connection: Connection) -> None:
+    connection.exec_driver_sql(VIEW_DDL)
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _create_archive_view_after_tables(target, connection: Connection, **kw) -> None:
+    create_archive_view(connection)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+
+ENV_PREFIX = "TUITASK_"
+
+
+def _env(name: str, default: str) -> str:
+    return os.environ.get(ENV_PREFIX + name, default)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(ENV_PREFIX + name)
+    return int(value) if value not in (None, "") else default
+
+
+@dataclass(frozen=True)
+class DatabaseConfig:
+    """Engine settings; every field can be overridden with a TUITASK_* env var."""
+
+    path: str = "tuitask.db"
+    url: str = ""
+    echo: bool = False
+
+    # Connect-time PRAGMAs. WAL lets readers run alongside one writer, and
+    # NORMAL is the durable-enough pairing for it (no fsync per commit).
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size: int = -20_000  # negative = KiB, so ~20 MB of page cache
+    mmap_size: int = 256 * 1024 * 1024
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 5_000
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+
+    # Retries for "database is locked" that busy_timeout cannot absorb
+    # (e.g. a read transaction that has to upgrade to a write).
+    lock_retries: int = 5
+    lock_backoff_ms: int = 50
+
+    # Window in which queued writes (tuitask.db.writer) share one commit.
+    write_batch_ms: int = 15
+
+    # Completed tasks untouched this long move to task_archive (crud.archive).
+    archive_after_days: int = 30
+
+    extra_pragmas: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_env(cls) -> DatabaseConfig:
+        defaults = cls()
+        return cls(
+            path=_env("DB_PATH", defaults.path),
+            url=_env("DB_URL", defaults.url),
+            echo=_env("DB_ECHO", "") not in ("", "0", "false"),
+            journal_mode=_env("SQLITE_JOURNAL_MODE", defaults.journal_mode),
+            synchronous=_env("SQLITE_SYNCHRONOUS", defaults.synchronous),
+            cache_size=_env_int("SQLITE_CACHE_SIZE", defaults.cache_size),
+            mmap_size=_env_int("SQLITE_MMAP_SIZE", defaults.mmap_size),
+            temp_store=_env("SQLITE_TEMP_STORE", defaults.temp_store),
+            busy_timeout_ms=_env_int("SQLITE_BUSY_TIMEOUT_MS", defaults.busy_timeout_ms),
+            pool_size=_env_int("DB_POOL_SIZE", defaults.pool_size),
+            max_overflow=_env_int("DB_MAX_OVERFLOW", defaults.max_overflow),
+            pool_timeout=float(_env("DB_POOL_TIMEOUT", str(defaults.pool_timeout))),
+            lock_retries=_env_int("DB_LOCK_RETRIES", defaults.lock_retries),
+            lock_backoff_ms=_env_int("DB_LOCK_BACKOFF_MS", defaults.lock_backoff_ms),
+            write_batch_ms=_env_int("DB_WRITE_BATCH_MS", defaults.write_batch_ms),
+            archive_after_days=_env_int("ARCHIVE_AFTER_DAYS", defaults.archive_after_days),
+        )
+
+    @property
+    def database_url(self) -> str:
+        return self.url or f"sqlite+aiosqlite:///{self.path}"
+
+    @property
+    def is_memory(self) -> bool:
+        return ":memory:" in self.database_url or self.database_url.endswith("://")
+
+    def pragmas(self) -> dict[str, str]:
+        """PRAGMAs applied to every new DBAPI connection, in order."""
+        pragmas = {
+            "busy_timeout": str(self.busy_timeout_ms),
+            "journal_mode": self.journal_mode,
+            "synchronous": self.synchronous,
+            "cache_size": str(self.cache_size),
+            "mmap_size": str(self.mmap_size),
+            "temp_store": self.temp_store,
+        }
+        if self.is_memory:
+            # An in-memory database has no journal file to switch to WAL.
+            del pragmas["journal_mode"]
+        pragmas.update(self.extra_pragmas)
+        return pragmas
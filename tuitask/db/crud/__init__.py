@@ -0,0 +1,12 @@
+from typing import Iterable
+
+# Writers here only flush: the caller's unit_of_work (tuitask.db.engine) owns
+# the transaction, so related writes commit together.
+
+# Id lists are split to stay under SQLite's bound-parameter limit; all chunks
+# still share one transaction, so a bulk call costs a single commit.
+IDS_PER_STATEMENT = 10_000
+
+def chunked(ids: list[int], size: int = IDS_PER_STATEMENT) -> Iterable[list[int]]:
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
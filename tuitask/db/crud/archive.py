@@ -0,0 +1,47 @@
+from datetime import date, timedelta
+from typing import Iterable
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import select, func, insert, delete
+from sqlmodel.sql.expression import SelectOfScalar
+from tuitask.models.task import Task, task_archive
+from tuitask.db.archive import TASK_COLUMNS
+from tuitask.db.crud import chunked
+
+# Statuses whose tasks are eligible for the archive.
+ARCHIVE_STATUSES = ("completed",)
+
+def archivable_ids(older_than_days: int, today: date | None = None) -> SelectOfScalar:
+    """Ids of completed tasks untouched for `older_than_days` (due date if never stamped)."""
+    cutoff = (today or date.today()) - timedelta(days=older_than_days)
+    last_touched = func.coalesce(func.date(Task.updated_at), Task.due_date)
+    return select(Task.id).where(
+        func.lower(Task.status).in_(ARCHIVE_STATUSES),
+        last_touched < cutoff.isoformat(),
+    )
+
+async def move_tasks(session: AsyncSession, task_ids: Iterable[int], to_archive: bool = True) -> int:
+    """Move rows between task and task_archive, keeping ids and tag links.
+
+    The rollup and FTS triggers on both tables keep progress and search
+    whole; the change feed sees archived rows as deleted tasks.
+    """
+    source, target = (Task.__table__, task_archive) if to_archive else (task_archive, Task.__table__)
+    moved = 0
+    for chunk in chunked(list(task_ids)):
+        rows = select(*(source.c[name] for name in TASK_COLUMNS)).where(source.c.id.in_(chunk))
+        await session.exec(insert(target).from_select(TASK_COLUMNS, rows))
+        result = await session.exec(delete(source).where(source.c.id.in_(chunk)))
+        moved += result.rowcount
+    return moved
+
+async def archive_tasks(session: AsyncSession, older_than_days: int, today: date | None = None) -> int:
+    """Apply the archive policy; returns how many tasks moved."""
+    task_ids = (await session.exec(archivable_ids(older_than_days, today))).all()
+    return await move_tasks(session, task_ids)
+
+async def restore_tasks(session: AsyncSession, task_ids: Iterable[int]) -> int:
+    return await move_tasks(session, task_ids, to_archive=False)
+
+async def count_archived(session: AsyncSession) -> int:
+    result = await session.exec(select(func.count()).select_from(task_archive))
+    return result.one()
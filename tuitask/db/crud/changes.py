@@ -0,0 +1,60 @@
+from dataclasses import dataclass, field, replace
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import select, col
+from tuitask.models.changes import ChangeClock, DeletedRow
+from tuitask.models.phase import Phase
+from tuitask.models.project import Project
+from tuitask.models.task import Task
+from tuitask.models.task_filter import TaskFilter
+from tuitask.db.crud import chunked
+from tuitask.db.crud import tasks as task_crud
+
+@dataclass
+class ChangeSet:
+    """Rows inserted, updated or deleted after some change_clock version."""
+    version: int
+    tasks: list[Task] = field(default_factory=list)
+    phases: list[Phase] = field(default_factory=list)
+    projects: list[Project] = field(default_factory=list)
+    deleted: dict[str, set[int]] = field(default_factory=dict)
+    # Ids among `tasks` that match the filter passed to changes_since.
+    task_matches: set[int] = field(default_factory=set)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.tasks or self.phases or self.projects or self.deleted)
+
+    def deleted_ids(self, kind: str) -> set[int]:
+        return self.deleted.get(kind, set())
+
+async def current_version(session: AsyncSession) -> int:
+    result = await session.exec(select(ChangeClock.version).where(ChangeClock.id == 1))
+    return result.first() or 0
+
+async def changes_since(session: AsyncSession, version: int, spec: TaskFilter | None = None) -> ChangeSet:
+    """Everything that changed after `version`, via the row_version indexes.
+
+    The clock is read first, so a write racing this call is reported now or
+    again next time; applying a change twice is harmless.
+    """
+    changes = ChangeSet(version=await current_version(session))
+    for model, target in ((Task, changes.tasks), (Phase, changes.phases), (Project, changes.projects)):
+        result = await session.exec(select(model).where(col(model.row_version) > version))
+        target.extend(result.all())
+
+    result = await session.exec(
+        select(DeletedRow.kind, DeletedRow.row_id).where(col(DeletedRow.row_version) > version)
+    )
+    for kind, row_id in result.all():
+        changes.deleted.setdefault(kind, set()).add(row_id)
+
+    changed_ids = [task.id for task in changes.tasks]
+    if spec is None:
+        changes.task_matches = set(changed_ids)
+    else:
+        # The feed only carries live rows; archiving shows up as deletes.
+        spec = replace(spec, include_archived=False)
+        for chunk in chunked(changed_ids):
+            statement = task_crud.filter_tasks(select(Task.id).where(col(Task.id).in_(chunk)), spec)
+            changes.task_matches.update((await session.exec(statement)).all())
+    return changes
@@ -1,14 +1,29 @@
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select
+from sqlmodel import select, col, insert
 from tuitask.models.phase import Phase
 
 async def create_phase(session: AsyncSession, phase: Phase) -> Phase:
     session.add(phase)
-    await session.commit()
+    await session.flush()
     await session.refresh(phase)
     return phase
 
+async def create_phases_bulk(session: AsyncSession, phases: list[Phase]) -> list[int]:
+    """Insert many phases with one executemany; returns ids."""
+    if not phases:
+        return []
+    rows = [phase.model_dump(exclude={"id"}) for phase in phases]
+    statement = insert(Phase).returning(col(Phase.id), sort_by_parameter_order=True)
+    result = await session.exec(statement, params=rows)
+    phase_ids = list(result.scalars().all())
+    return phase_ids
+
 async def get_phases_by_project(session: AsyncSession, project_id: int) -> list[Phase]:
     statement = select(Phase).where(Phase.project_id == project_id).order_by(Phase.order)
     result = await session.exec(statement)
     return list(result.all())
+
+async def get_all_phases(session: AsyncSession) -> list[Phase]:
+    statement = select(Phase).order_by(Phase.project_id, Phase.order, Phase.id)
+    result = await session.exec(statement)
+    return list(result.all())
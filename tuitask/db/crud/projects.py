@@ -1,31 +1,69 @@
+from typing import NamedTuple
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select
+from sqlmodel import select, func, col, insert
 from sqlalchemy.orm import selectinload
 from tuitask.models.project import Project
 
+class ProgressCount(NamedTuple):
+    total: int = 0
+    completed: int = 0
+
+    @property
+    def percent(self) -> int:
+        return int((self.completed / self.total) * 100) if self.total else 0
+
+class ProgressCounts(NamedTuple):
+    phases: dict[int, ProgressCount]
+    projects: dict[int, ProgressCount]
+
 async def create_project(session: AsyncSession, project: Project) -> Project:
     session.add(project)
-    await session.commit()
+    await session.flush()
     await session.refresh(project)
     return project
 
+async def create_projects_bulk(session: AsyncSession, projects: list[Project]) -> list[int]:
+    """Insert many projects with one executemany; returns ids."""
+    if not projects:
+        return []
+    rows = [project.model_dump(exclude={"id"}) for project in projects]
+    statement = insert(Project).returning(col(Project.id), sort_by_parameter_order=True)
+    result = await session.exec(statement, params=rows)
+    return list(result.scalars().all())
+
 async def get_all_projects(session: AsyncSession) -> list[Project]:
     result = await session.exec(select(Project))
     return list(result.all())
 
 async def get_project_with_phases(session: AsyncSession, project_id: int) -> Project | None:
-    # Eager load phases AND their tasks for progress calc
-    from tuitask.models.phase import Phase
+    # Phases only; progress comes from get_progress_counts, not loaded tasks
     statement = select(Project).where(Project.id == project_id).options(
-        selectinload(Project.phases).selectinload(Phase.tasks)
+        selectinload(Project.phases)
     )
     result = await session.exec(statement)
     return result.first()
 
-async def get_full_hierarchy(session: AsyncSession) -> list[Project]:
+async def get_progress_counts(session: AsyncSession) -> ProgressCounts:
+    """(total, completed) task counts per phase and per project.
+
+    One GROUP BY over task joined to phase; project totals are the sum of
+    their phases' rows, so no task rows are ever loaded.
+    """
     from tuitask.models.phase import Phase
-    statement = select(Project).options(
-        selectinload(Project.phases).selectinload(Phase.tasks)
+    from tuitask.models.task import Task
+    completed = func.count().filter(func.lower(Task.status) == "completed")
+    statement = (
+        select(Phase.project_id, Task.phase_id, func.count(), completed)
+        .join(Phase, Phase.id == Task.phase_id)
+        .group_by(Phase.project_id, Task.phase_id)
     )
     result = await session.exec(statement)
-    return list(result.all())
+
+    phases: dict[int, ProgressCount] = {}
+    projects: dict[int, ProgressCount] = {}
+    for project_id, phase_id, total, done in result.all():
+        phases[phase_id] = ProgressCount(total, done)
+        if project_id is not None:
+            running = projects.get(project_id, ProgressCount())
+            projects[project_id] = ProgressCount(running.total + total, running.completed + done)
+    return ProgressCounts(phases, projects)
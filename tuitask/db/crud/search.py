@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from typing import Iterable
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import Select, literal, literal_column, select, union_all, func
+from tuitask.db.fts import FTS_TABLES
+
+# Archived tasks are only searched when asked for by kind.
+DEFAULT_KINDS = ("task", "phase", "project")
+
+@dataclass(frozen=True)
+class SearchHit:
+    kind: str  # "task", "phase", "project" or "task_archive"
+    id: int
+    rank: float  # bm25; lower is a better match
+
+def match_expression(text: str, column: str | None = None) -> str | None:
+    """Turn free text into an FTS5 prefix query (every word must match).
+
+    Words are quoted so FTS syntax characters in user input stay literal.
+    Returns None when `text` contains nothing to search for.
+    """
+    terms = [word.replace('"', '""') for word in text.split()]
+    if not terms:
+        return None
+    expression = " ".join(f'"{term}"*' for term in terms)
+    if column is not None:
+        expression = f"{{{column}}} : ({expression})"
+    return expression
+
+def matching_ids(kind: str, text: str, column: str | None = None) -> Select | None:
+    """Subquery of `kind` row ids matching `text`, for use in an IN clause."""
+    expression = match_expression(text, column)
+    if expression is None:
+        return None
+    fts = FTS_TABLES[kind]
+    return select(fts.c.rowid).where(fts.c[f"{kind}_fts"].match(expression))
+
+async def search(
+    session: AsyncSession,
+    text: str,
+    kinds: Iterable[str] = DEFAULT_KINDS,
+    limit: int = 50,
+    offset: int = 0,
+) -> list[SearchHit]:
+    """Ranked prefix search over task, phase and project text."""
+    expression = match_expression(text)
+    if expression is None:
+        return []
+    parts = []
+    for kind in kinds:
+        fts = FTS_TABLES[kind]
+        parts.append(
+            select(
+                literal(kind).label("kind"),
+                fts.c.rowid.label("id"),
+                func.bm25(literal_column(fts.name)).label("rank"),
+            ).where(fts.c[f"{kind}_fts"].match(expression))
+        )
+    statement = union_all(*parts).order_by("rank").limit(limit).offset(offset)
+    result = await session.exec(statement)
+    return [SearchHit(kind, row_id, rank) for kind, row_id, rank in result.all()]
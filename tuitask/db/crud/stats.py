@@ -0,0 +1,51 @@
+from typing import NamedTuple
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import select, func, text
+from tuitask.db.rollups import EXPECTED_PHASE_STATS, EXPECTED_PROJECT_STATS, REBUILD_SQL
+from tuitask.db.crud.projects import ProgressCount, ProgressCounts
+from tuitask.models.stats import PhaseStats, ProjectStats
+
+class RollupMismatch(NamedTuple):
+    table: str
+    key: tuple[int, str]  # (phase_id or project_id, status)
+    expected: int
+    actual: int
+
+async def get_rollup_progress(session: AsyncSession) -> ProgressCounts:
+    """Progress per phase and project read from the rollup tables.
+
+    Cost follows the number of (phase|project, status) rows, not tasks.
+    """
+    counts = ProgressCounts({}, {})
+    for model, key, target in (
+        (PhaseStats, PhaseStats.phase_id, counts.phases),
+        (ProjectStats, ProjectStats.project_id, counts.projects),
+    ):
+        completed = func.sum(model.task_count).filter(func.lower(model.status) == "completed")
+        statement = select(key, func.sum(model.task_count), func.coalesce(completed, 0)).group_by(key)
+        result = await session.exec(statement)
+        for row_id, total, done in result.all():
+            target[row_id] = ProgressCount(total, done)
+    return counts
+
+async def rebuild_rollups(session: AsyncSession) -> None:
+    """Recompute phase_stats and project_stats from the task table."""
+    for statement in REBUILD_SQL:
+        await session.exec(text(statement))
+
+async def check_rollups(session: AsyncSession) -> list[RollupMismatch]:
+    """Compare the rollup tables against a fresh aggregate of task."""
+    mismatches: list[RollupMismatch] = []
+    for table, expected_sql, model, key in (
+        ("phase_stats", EXPECTED_PHASE_STATS, PhaseStats, PhaseStats.phase_id),
+        ("project_stats", EXPECTED_PROJECT_STATS, ProjectStats, ProjectStats.project_id),
+    ):
+        expected_rows = await session.exec(text(expected_sql))
+        expected = {(row_id, status): count for row_id, status, count in expected_rows.all()}
+        actual_rows = await session.exec(select(key, model.status, model.task_count))
+        actual = {(row_id, status): count for row_id, status, count in actual_rows.all()}
+        for row_key in sorted(expected.keys() | actual.keys()):
+            want, have = expected.get(row_key, 0), actual.get(row_key, 0)
+            if want != have:
+                mismatches.append(RollupMismatch(table, row_key, want, have))
+    return mismatches
@@ -0,0 +1,65 @@
+from typing import Iterable
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import select, col, delete
+from sqlalchemy.dialects.sqlite import insert
+from sqlmodel.sql.expression import SelectOfScalar
+from tuitask.db.crud import chunked
+from tuitask.models.tag import Tag, TaskTag
+
+def normalize_tags(tags_str: str) -> list[str]:
+    """Split a comma string into unique, normalized tag names (order kept)."""
+    names = (part.strip().lower() for part in tags_str.split(","))
+    return list(dict.fromkeys(name for name in names if name))
+
+def tasks_with_tag(fragment: str) -> SelectOfScalar:
+    """Task ids carrying a tag whose name contains `fragment`.
+
+    Only the (small) tag dictionary is matched by substring; the link table
+    is then probed through its tag_id index, so cost follows the matches.
+    """
+    tag_ids = select(Tag.id).where(col(Tag.name).contains(fragment.strip().lower(), autoescape=True))
+    return select(TaskTag.task_id).where(col(TaskTag.tag_id).in_(tag_ids))
+
+async def ensure_tags(session: AsyncSession, names: Iterable[str]) -> dict[str, int]:
+    """Return name -> id for `names`, inserting any that do not exist yet."""
+    names = list(dict.fromkeys(names))
+    if not names:
+        return {}
+    await session.exec(insert(Tag).values([{"name": name} for name in names]).on_conflict_do_nothing())
+    result = await session.exec(select(Tag.name, Tag.id).where(col(Tag.name).in_(names)))
+    return dict(result.all())
+
+async def set_task_tags(session: AsyncSession, task_id: int, tags_str: str) -> None:
+    """Replace the link rows of one task with the tags in `tags_str`."""
+    await session.exec(delete(TaskTag).where(TaskTag.task_id == task_id))
+    tag_ids = await ensure_tags(session, normalize_tags(tags_str))
+    if tag_ids:
+        await session.exec(insert(TaskTag).values([
+            {"task_id": task_id, "tag_id": tag_id} for tag_id in tag_ids.values()
+        ]))
+
+async def set_tags_bulk(
+    session: AsyncSession,
+    task_tags: Iterable[tuple[int, str]],
+    replace: bool = True,
+) -> None:
+    """Link many tasks to their tags with one executemany per table.
+
+    `task_tags` yields (task_id, tags_str). With `replace`, existing links of
+    those tasks are dropped first; new tasks can skip that with False.
+    """
+    parsed = [(task_id, normalize_tags(tags_str)) for task_id, tags_str in task_tags]
+    if replace:
+        for chunk in chunked([task_id for task_id, _ in parsed]):
+            await delete_task_tags(session, chunk)
+    tag_ids = await ensure_tags(session, (name for _, names in parsed for name in names))
+    links = [{"task_id": task_id, "tag_id": tag_ids[name]} for task_id, names in parsed for name in names]
+    if links:
+        await session.exec(insert(TaskTag), params=links)
+
+async def delete_task_tags(session: AsyncSession, task_ids: Iterable[int]) -> None:
+    await session.exec(delete(TaskTag).where(col(TaskTag.task_id).in_(list(task_ids))))
+
+async def get_all_tags(session: AsyncSession) -> list[Tag]:
+    result = await session.exec(select(Tag).order_by(Tag.name))
+    return list(result.all())
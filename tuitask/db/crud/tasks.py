@@ -1,40 +1,284 @@
+from dataclasses import replace
+from datetime import date
+from typing import Any, Iterable, NamedTuple
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select
+from sqlmodel import select, col, func, and_, or_, insert, update, delete
+from sqlalchemy import exists, union_all
+from sqlmodel.sql.expression import SelectOfScalar
+from tuitask.models.phase import Phase
 from tuitask.models.task import Task
+from tuitask.models.task_filter import TaskFilter
+from tuitask.db.crud import chunked
+from tuitask.db.crud import tags as tag_crud
+from tuitask.db.crud import search as search_crud
+from tuitask.db.versioning import next_version
+from tuitask.db.archive import TaskAll
 from typing import Optional
 
+# Canonical task order: grouped by phase, then soonest due first.
+TASK_ORDER = (col(Task.phase_id), col(Task.due_date), col(Task.id))
+
+class TaskCursor(NamedTuple):
+    """Keyset position in TASK_ORDER: the sort key of the last row seen."""
+    phase_id: int | None
+    due_date: date
+    id: int
+
+    @classmethod
+    def after(cls, task: Task) -> "TaskCursor":
+        return cls(task.phase_id, task.due_date, task.id)
+
+    @property
+    def sort_key(self) -> tuple:
+        """TASK_ORDER as a Python sort key (NULL phase first, like SQLite)."""
+        return (self.phase_id is not None, self.phase_id or 0, self.due_date, self.id)
+
 async def create_task(session: AsyncSession, task: Task) -> Task:
     session.add(task)
-    await session.commit()
+    await session.flush()
+    await tag_crud.set_task_tags(session, task.id, task.tags_str)
     await session.refresh(task)
     return task
 
+async def create_tasks_bulk(session: AsyncSession, tasks: Iterable[Task]) -> list[int]:
+    """Insert many tasks (and their tag links) in the current transaction.
+
+    Rows go through a single executemany INSERT ... RETURNING id rather than
+    one add/commit/refresh per task. Returns the new ids in input order.
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return []
+    rows = [task.model_dump(exclude={"id"}) for task in tasks]
+    statement = insert(Task).returning(col(Task.id), sort_by_parameter_order=True)
+    result = await session.exec(statement, params=rows)
+    task_ids = list(result.scalars().all())
+    await tag_crud.set_tags_bulk(session, zip(task_ids, (row["tags_str"] for row in rows)), replace=False)
+    return task_ids
+
 async def get_task(session: AsyncSession, task_id: int) -> Optional[Task]:
     return await session.get(Task, task_id)
 
+async def has_tasks(session: AsyncSession) -> bool:
+    """EXISTS probe: stops at the first row instead of loading the table."""
+    result = await session.exec(select(exists().where(col(Task.id).is_not(None))))
+    return result.one()
+
 async def get_all_tasks(session: AsyncSession) -> list[Task]:
     result = await session.exec(select(Task))
     return list(result.all())
 
-async def update_task(session: AsyncSession, task_id: int, task_update: Task) -> Optional[Task]:
-    db_task = await session.get(Task, task_id)
-    if not db_task:
+async def get_tasks_by_ids(session: AsyncSession, task_ids: list[int]) -> list[Task]:
+    """Tasks with these ids, in the order given (missing ids are skipped)."""
+    found: dict[int, Task] = {}
+    for chunk in chunked(task_ids):
+        result = await session.exec(select(Task).where(col(Task.id).in_(chunk)))
+        found.update((task.id, task) for task in result.all())
+    return [found[task_id] for task_id in task_ids if task_id in found]
+
+async def get_task_rows(session: AsyncSession) -> list[tuple]:
+    """(id, phase_id, priority, due_date, status, assignee) of every live task, as plain tuples."""
+    statement = select(Task.id, Task.phase_id, Task.priority, Task.due_date, Task.status, Task.assignee)
+    result = await session.exec(statement)
+    return [tuple(row) for row in result.all()]
+
+def task_source(spec: TaskFilter):
+    """Task, or the live+archived `task_all` view when the filter asks for it."""
+    return TaskAll if spec.include_archived else Task
+
+def task_order(source=Task) -> tuple:
+    """TASK_ORDER for `source` (Task or TaskAll)."""
+    return (col(source.phase_id), col(source.due_date), col(source.id))
+
+def filter_tasks(statement: SelectOfScalar, spec: TaskFilter, today: date | None = None) -> SelectOfScalar:
+    """Apply the WHERE clauses described by `spec` to a task statement.
+
+    The statement must select from task_source(spec).
+    """
+    source = task_source(spec)
+    if spec.phase_id is not None:
+        statement = statement.where(source.phase_id == spec.phase_id)
+    elif spec.project_id is not None:
+        phase_ids = select(Phase.id).where(Phase.project_id == spec.project_id)
+        statement = statement.where(col(source.phase_id).in_(phase_ids))
+
+    status = spec.status.strip()
+    if status:
+        statement = statement.where(col(source.status).icontains(status, autoescape=True))
+    if spec.priority is not None:
+        statement = statement.where(source.priority == spec.priority)
+    title_ids = search_crud.matching_ids("task", spec.title, column="title")
+    if title_ids is not None:
+        if spec.include_archived:
+            title_ids = union_all(title_ids, search_crud.matching_ids("task_archive", spec.title, column="title"))
+        statement = statement.where(col(source.id).in_(title_ids))
+    assignee = spec.assignee.strip()
+    if assignee:
+        statement = statement.where(col(source.assignee).icontains(assignee, autoescape=True))
+    tags = spec.tags.strip()
+    if tags:
+        # Tag links outlive archiving, so this covers both tables.
+        statement = statement.where(col(source.id).in_(tag_crud.tasks_with_tag(tags)))
+
+    due_start, due_end = spec.due_range(today)
+    if due_start is not None:
+        statement = statement.where(source.due_date >= due_start)
+    if due_end is not None:
+        statement = statement.where(source.due_date <= due_end)
+    return statement
+
+def seek_after(statement: SelectOfScalar, cursor: TaskCursor, source=Task) -> SelectOfScalar:
+    """Restrict a TASK_ORDER statement to rows strictly after `cursor`."""
+    later_in_phase = or_(
+        source.due_date > cursor.due_date,
+        and_(source.due_date == cursor.due_date, col(source.id) > cursor.id),
+    )
+    # SQLite sorts NULL phase_id first, so "no phase" is the lowest group.
+    if cursor.phase_id is None:
+        return statement.where(or_(
+            col(source.phase_id).is_not(None),
+            and_(col(source.phase_id).is_(None), later_in_phase),
+        ))
+    return statement.where(or_(
+        col(source.phase_id) > cursor.phase_id,
+        and_(source.phase_id == cursor.phase_id, later_in_phase),
+    ))
+
+def task_page_statement(
+    spec: TaskFilter,
+    limit: int | None = None,
+    offset: int = 0,
+    after: TaskCursor | None = None,
+    today: date | None = None,
+) -> SelectOfScalar:
+    source = task_source(spec)
+    statement = filter_tasks(select(source), spec, today)
+    if after is not None:
+        statement = seek_after(statement, after, source)
+    statement = statement.order_by(*task_order(source))
+    if limit is not None:
+        statement = statement.limit(limit)
+    if offset:
+        statement = statement.offset(offset)
+    return statement
+
+async def find_tasks(
+    session: AsyncSession,
+    spec: TaskFilter,
+    limit: int | None = None,
+    offset: int = 0,
+    after: TaskCursor | None = None,
+    today: date | None = None,
+) -> list[Task]:
+    """Return one window of tasks matching `spec` in canonical order.
+
+    Pass `after` (keyset) rather than `offset` when paging forward: it seeks
+    straight to the next row instead of counting past every earlier one.
+    """
+    statement = task_page_statement(spec, limit=limit, offset=offset, after=after, today=today)
+    result = await session.exec(statement)
+    return list(result.all())
+
+async def count_tasks(session: AsyncSession, spec: TaskFilter, today: date | None = None) -> int:
+    statement = filter_tasks(select(func.count()).select_from(task_source(spec)), spec, today)
+    result = await session.exec(statement)
+    return result.one()
+
+class TaskVersionConflict(Exception):
+    """Raised when a task changed since the caller read it."""
+
+    def __init__(self, task_id: int, expected_version: int, current: Task):
+        super().__init__(
+            f"task {task_id} is at version {current.row_version}, not {expected_version}"
+        )
+        self.task_id = task_id
+        self.expected_version = expected_version
+        self.current = current
+
+# Columns a caller may not write directly through update_task.
+_MANAGED_COLUMNS = {"id", "row_version", "updated_at"}
+
+async def update_task(
+    session: AsyncSession,
+    task_id: int,
+    task_update: Task | dict[str, Any],
+    expected_version: int | None = None,
+) -> Optional[Task]:
+    """Apply the set fields of `task_update` in one UPDATE ... RETURNING.
+
+    With `expected_version`, the row only changes if nobody else wrote it
+    since; otherwise TaskVersionConflict carries the current row. Returns
+    None when the task does not exist.
+    """
+    if isinstance(task_update, Task):
+        task_update = task_update.model_dump(exclude_unset=True)
+    values = {key: value for key, value in task_update.items() if key not in _MANAGED_COLUMNS}
+
+    statement = (
+        update(Task)
+        .where(col(Task.id) == task_id)
+        .values(**values, row_version=next_version(), updated_at=func.current_timestamp())
+        .returning(Task)
+        .execution_options(populate_existing=True)
+    )
+    if expected_version is not None:
+        statement = statement.where(col(Task.row_version) == expected_version)
+    db_task = (await session.exec(statement)).scalars().one_or_none()
+
+    if db_task is None:
+        current = await session.get(Task, task_id, populate_existing=True) if expected_version is not None else None
+        if current is not None:
+            raise TaskVersionConflict(task_id, expected_version, current)
         return None
-    
-    # Update fields (simplistic mapping for now)
-    task_data = task_update.model_dump(exclude_unset=True)
-    for key, value in task_data.items():
-        setattr(db_task, key, value)
-        
-    session.add(db_task)
-    await session.commit()
-    await session.refresh(db_task)
+    if "tags_str" in values:
+        await tag_crud.set_task_tags(session, task_id, db_task.tags_str)
     return db_task
 
+async def update_tasks_where(
+    session: AsyncSession,
+    values: dict[str, Any],
+    task_ids: Iterable[int] | None = None,
+    spec: TaskFilter | None = None,
+) -> int:
+    """Apply `values` to every task in `task_ids` and/or matching `spec`.
+
+    One UPDATE statement however many rows match; returns the
+    number of rows changed. With neither selector given, nothing is updated.
+    """
+    if task_ids is None and spec is None:
+        return 0
+    statement = update(Task).values(**values)
+    if spec is not None:
+        # Archived rows are not updated in place.
+        spec = replace(spec, include_archived=False)
+        statement = statement.where(col(Task.id).in_(filter_tasks(select(Task.id), spec)))
+    statements = [statement]
+    if task_ids is not None:
+        statements = [statement.where(col(Task.id).in_(chunk)) for chunk in chunked(list(task_ids))]
+
+    changed: list[int] = []
+    for chunk_statement in statements:
+        result = await session.exec(chunk_statement.returning(col(Task.id)))
+        changed.extend(result.scalars().all())
+    if "tags_str" in values:
+        await tag_crud.set_tags_bulk(session, ((task_id, values["tags_str"]) for task_id in changed))
+    return len(changed)
+
+async def delete_tasks_bulk(session: AsyncSession, task_ids: Iterable[int]) -> int:
+    """Delete many tasks and their tag links in the current transaction."""
+    task_ids = list(task_ids)
+    deleted = 0
+    for chunk in chunked(task_ids):
+        await tag_crud.delete_task_tags(session, chunk)
+        result = await session.exec(delete(Task).where(col(Task.id).in_(chunk)))
+        deleted += result.rowcount
+    return deleted
+
 async def delete_task(session: AsyncSession, task_id: int) -> bool:
     task = await session.get(Task, task_id)
     if not task:
         return False
+    await tag_crud.delete_task_tags(session, [task_id])
     await session.delete(task)
-    await session.commit()
+    await session.flush()
     return True
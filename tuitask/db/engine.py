@@ -1,27 +1,183 @@
+import asyncio
+import functools
+import logging
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator
+
 from sqlmodel import SQLModel
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy import Connection, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy.orm import sessionmaker
 
-# DB Config
-DATABASE_URL = "sqlite+aiosqlite:///tuitask.db"
+from tuitask.db.config import DatabaseConfig
+
+logger = logging.getLogger(__name__)
+
+# DB Config (see tuitask.db.config for the TUITASK_* overrides)
+config = DatabaseConfig.from_env()
+DATABASE_URL = config.database_url
+
+
+def create_engine(config: DatabaseConfig) -> AsyncEngine:
+    """Build the async engine and apply the connect-time PRAGMAs."""
+    options = {}
+    if not config.is_memory:
+        options.update(
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_timeout=config.pool_timeout,
+        )
+    new_engine = create_async_engine(config.database_url, echo=config.echo, **options)
+    pragmas = config.pragmas()
+
+    @event.listens_for(new_engine.sync_engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    return new_engine
+
+
+engine = create_engine(config)
+
+# One factory for the whole app; building a sessionmaker per call is wasted work.
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[AsyncSession]:
+    """Session whose writes commit together on exit, or roll back on error.
+
+    The crud write helpers only flush, so everything done inside one block
+    lands in a single transaction.
+    """
+    async with async_session() as session:
+        try:
+            yield session
+            await session.commit()
+        except BaseException:
+            await session.rollback()
+            raise
+
+
+def is_locked_error(error: OperationalError) -> bool:
+    message = str(error.orig or error).lower()
+    return "database is locked" in message or "database table is locked" in message
+
+
+def retry_on_locked(func):
+    """Re-run an async unit of work when SQLite reports the database locked.
+
+    The wrapped coroutine must open its own session, so every attempt starts a
+    fresh transaction. Backoff doubles from config.lock_backoff_ms.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        delay = config.lock_backoff_ms / 1000
+        for attempt in range(config.lock_retries + 1):
+            try:
+                return await func(*args, **kwargs)
+            except OperationalError as error:
+                if not is_locked_error(error) or attempt == config.lock_retries:
+                    raise
+                logger.warning("database locked in %s, retrying in %.3fs", func.__qualname__, delay)
+                await asyncio.sleep(delay)
+                delay *= 2
+    return wrapper
+
+
+# Stored in PRAGMA user_version once a database is at the Alembic head.
+# Bump it with every schema change (each new Alembic revision).
+SCHEMA_VERSION = 8
+
+# The Alembic scripts sit next to the package in a source checkout.
+MIGRATIONS_PATH = Path(__file__).resolve().parents[2] / "alembic"
+
+_ready: asyncio.Event | None = None
+
+
+def _ready_event() -> asyncio.Event:
+    global _ready
+    if _ready is None:
+        _ready = asyncio.Event()
+    return _ready
+
+
+async def wait_until_ready() -> None:
+    """Block until init_db has finished in this process."""
+    await _ready_event().wait()
+
+
+def _alembic(connection: Connection, command_name: str) -> None:
+    """Run an Alembic command ("upgrade" or "stamp" to head) on `connection`."""
+    from alembic import command
+    from alembic.config import Config
+
+    # No ini file, so env.py leaves the app's logging configuration alone.
+    alembic_config = Config()
+    alembic_config.set_main_option("script_location", str(MIGRATIONS_PATH))
+    alembic_config.attributes["connection"] = connection
+    getattr(command, command_name)(alembic_config, "head")
+
+
+def _has_tables(connection: Connection) -> bool:
+    result = connection.exec_driver_sql("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'project'")
+    return result.first() is not None
+
+
+def _missing_columns(connection: Connection) -> list[str]:
+    """Model tables and columns the database lacks, as "table" or "table.column"."""
+    missing = []
+    for table in SQLModel.metadata.sorted_tables:
+        present = {row[1] for row in connection.exec_driver_sql(f'PRAGMA table_info("{table.name}")')}
+        if not present:
+            missing.append(table.name)
+        missing.extend(f"{table.name}.{column.name}" for column in table.columns if present and column.name not in present)
+    return missing
 
-engine = create_async_engine(DATABASE_URL, echo=False, future=True)
 
 async def init_db():
+    # Import models to ensure they are registered in metadata
+    from tuitask.models.project import Project
+    from tuitask.models.phase import Phase
+    from tuitask.models.task import Task
+    from tuitask.models.tag import Tag, TaskTag
+    from tuitask.models.stats import PhaseStats, ProjectStats
+    from tuitask.models.changes import ChangeClock, DeletedRow
+    # Registers the FTS tables and triggers to run after create_all
+    from tuitask.db import fts, rollups, versioning, archive
+
     async with engine.begin() as conn:
-        # Import models to ensure they are registered in metadata
-        from tuitask.models.project import Project
-        from tuitask.models.phase import Phase
-        from tuitask.models.task import Task
-        
-        # Create all tables defined in SQLModel metadata
-        # await conn.run_sync(SQLModel.metadata.drop_all) # Uncomment to reset
-        await conn.run_sync(SQLModel.metadata.create_all)
-
-async def get_session() -> AsyncSession:
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
+        # An up-to-date database costs one PRAGMA read, not a create_all
+        # pass that inspects every table and re-runs the trigger DDL.
+        user_version = (await conn.exec_driver_sql("PRAGMA user_version")).scalar()
+        if user_version != SCHEMA_VERSION:
+            if await conn.run_sync(_has_tables):
+                # Tables from an older release: create_all would skip them,
+                # so new columns and backfills come from the migrations.
+                await conn.run_sync(_alembic, "upgrade")
+            else:
+                # await conn.run_sync(SQLModel.metadata.drop_all) # Uncomment to reset
+                await conn.run_sync(SQLModel.metadata.create_all)
+                # Built at head, so later releases migrate it from there.
+                await conn.run_sync(_alembic, "stamp")
+            # The fast path above trusts this stamp from then on, so it is
+            # only written once the schema is known to match the models.
+            missing = await conn.run_sync(_missing_columns)
+            if missing:
+                raise RuntimeError(
+                    f"{DATABASE_URL} does not match the models after migrating "
+                    f"(missing {', '.join(missing)}); run `alembic upgrade head` or start a new database"
+                )
+            await conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    _ready_event().set()
+
+async def get_session() -> AsyncIterator[AsyncSession]:
     async with async_session() as session:
         yield session
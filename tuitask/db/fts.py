@@ -0,0 +1,67 @@
+"""FTS5 search tables over task, phase and project, kept in sync by triggers."""
+from __future__ import annotations
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, event
+from sqlalchemy.engine import Connection
+from sqlmodel import SQLModel
+
+# Source table -> indexed text columns. Each FTS table is external-content:
+# it stores only the index and reads text back from the source row by id.
+FTS_SOURCES: dict[str, tuple[str, ...]] = {
+    "task": ("title", "tags_str"),
+    "task_archive": ("title", "tags_str"),
+    "phase": ("name", "description"),
+    "project": ("name", "description"),
+}
+
+# Kept out of SQLModel.metadata: create_all cannot emit virtual tables.
+fts_metadata = MetaData()
+
+FTS_TABLES: dict[str, Table] = {
+    source: Table(
+        f"{source}_fts",
+        fts_metadata,
+        Column("rowid", Integer, primary_key=True),
+        # The hidden column named after the table is the MATCH target.
+        Column(f"{source}_fts", String),
+        *(Column(name, String) for name in columns),
+    )
+    for source, columns in FTS_SOURCES.items()
+}
+
+
+def fts_ddl(source: str) -> list[str]:
+    """CREATE statements for one source's FTS table and its sync triggers."""
+    fts = f"{source}_fts"
+    cols = ", ".join(FTS_SOURCES[source])
+    new_vals = ", ".join(f"new.{c}" for c in FTS_SOURCES[source])
+    old_vals = ", ".join(f"old.{c}" for c in FTS_SOURCES[source])
+    insert_new = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_vals});"
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_vals});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{cols}, content='{source}', content_rowid='id', tokenize='unicode61', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {source} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {source} "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def create_fts(connection: Connection) -> None:
+    """Create any missing FTS table, indexing rows that already exist."""
+    existing = {
+        row[0] for row in connection.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE '%\\_fts' ESCAPE '\\'"
+        )
+    }
+    for source in FTS_SOURCES:
+        for statement in fts_ddl(source):
+            connection.exec_driver_sql(statement)
+        if f"{source}_fts" not in existing:
+            connection.exec_driver_sql(f"INSERT INTO {source}_fts({source}_fts) VALUES ('rebuild')")
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _create_fts_after_tables(target, connection: Connection, **kw) -> None:
+    create_fts(connection)
@@ -0,0 +1,65 @@
+"""EXPLAIN QUERY PLAN guard for the hot task query paths."""
+from __future__ import annotations
+
+import re
+from datetime import date
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql import Executable
+from sqlmodel import select, col
+
+from tuitask.db.crud import tasks as task_crud
+from tuitask.models.phase import Phase
+from tuitask.models.task import Task
+from tuitask.models.task_filter import TaskFilter
+
+# Plan rows such as "SCAN task" (or "SCAN TABLE task" before SQLite 3.36)
+# mean every row is visited without an index.
+TABLE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)$")
+
+# Tag substring filters scan the tag dictionary on purpose: it holds one row
+# per distinct tag, and the link table is then probed through its index.
+ALLOWED_SCANS = frozenset({"tag"})
+
+_SAMPLE_CURSOR = task_crud.TaskCursor(1, date(2025, 1, 1), 1)
+
+HOT_QUERIES: dict[str, Callable[[], Executable]] = {
+    "tasks_first_page": lambda: task_crud.task_page_statement(TaskFilter(), limit=200),
+    "tasks_next_page": lambda: task_crud.task_page_statement(TaskFilter(), limit=200, after=_SAMPLE_CURSOR),
+    "tasks_in_phase": lambda: task_crud.task_page_statement(TaskFilter(phase_id=1), limit=200, after=_SAMPLE_CURSOR),
+    "tasks_in_project": lambda: task_crud.task_page_statement(TaskFilter(project_id=1), limit=200),
+    "tasks_due_window": lambda: task_crud.filter_tasks(select(Task), TaskFilter(due_window="next_7")),
+    "tasks_by_status_due": lambda: task_crud.task_page_statement(
+        TaskFilter(status="Blocked", due_window="overdue"), limit=200
+    ),
+    "tasks_by_title": lambda: task_crud.task_page_statement(TaskFilter(title="ship mv"), limit=200),
+    "tasks_by_tag": lambda: task_crud.filter_tasks(select(Task), TaskFilter(tags="ui")),
+    "tasks_by_assignee": lambda: task_crud.task_page_statement(TaskFilter(assignee="Ada"), limit=200),
+    "phase_tasks_selectin": lambda: select(Task).where(col(Task.phase_id).in_([1, 2, 3])),
+    "phases_by_project": lambda: select(Phase).where(Phase.project_id == 1).order_by(Phase.order),
+    "tasks_changed_since": lambda: select(Task).where(col(Task.row_version) > 42),
+}
+
+
+async def explain(conn: AsyncConnection, statement: Executable) -> list[str]:
+    """Return the detail column of SQLite's plan for `statement`."""
+    compiled = statement.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+    # Only the plan matters, so dates can go in as their stored ISO text.
+    params = tuple(
+        value.isoformat() if isinstance(value, date) else value
+        for value in (compiled.params[name] for name in compiled.positiontup or ())
+    )
+    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params)
+    return [row[-1] for row in result.all()]
+
+
+async def check_query_plans(conn: AsyncConnection) -> dict[str, list[str]]:
+    """Map each hot query that falls back to a table scan to its plan."""
+    failures: dict[str, list[str]] = {}
+    for name, build in HOT_QUERIES.items():
+        plan = await explain(conn, build())
+        scanned = {match.group(1) for match in map(TABLE_SCAN.match, plan) if match}
+        if scanned - ALLOWED_SCANS:
+            failures[name] = plan
+    return failures
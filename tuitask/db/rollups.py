@@ -0,0 +1,137 @@
+"""Trigger-maintained task counts per phase and project (phase_stats, project_stats).
+
+Every write path - ORM, bulk statements, raw SQL - goes through the
+triggers, so the rollups stay current without the crud layer's help.
+`REBUILD_SQL` recomputes them from the task table when they need repair.
+"""
+from __future__ import annotations
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlmodel import SQLModel
+
+
+def _add(phase: str, status: str) -> str:
+    return (
+        f"INSERT INTO phase_stats (phase_id, status, task_count) "
+        f"SELECT id, {status}, 1 FROM phase WHERE id = {phase} "
+        f"ON CONFLICT (phase_id, status) DO UPDATE SET task_count = task_count + 1; "
+        f"INSERT INTO project_stats (project_id, status, task_count) "
+        f"SELECT project_id, {status}, 1 FROM phase WHERE id = {phase} AND project_id IS NOT NULL "
+        f"ON CONFLICT (project_id, status) DO UPDATE SET task_count = task_count + 1;"
+    )
+
+
+def _remove(phase: str, status: str) -> str:
+    return (
+        f"UPDATE phase_stats SET task_count = task_count - 1 "
+        f"WHERE phase_id = {phase} AND status = {status}; "
+        f"DELETE FROM phase_stats WHERE phase_id = {phase} AND status = {status} AND task_count <= 0; "
+        f"UPDATE project_stats SET task_count = task_count - 1 "
+        f"WHERE status = {status} AND project_id = (SELECT project_id FROM phase WHERE id = {phase}); "
+        f"DELETE FROM project_stats WHERE status = {status} AND task_count <= 0 "
+        f"AND project_id = (SELECT project_id FROM phase WHERE id = {phase});"
+    )
+
+
+def _detach_phase(phase: str, project: str) -> str:
+    """Subtract one phase's counts from a project's rollup."""
+    return (
+        f"UPDATE project_stats SET task_count = task_count - ("
+        f"SELECT s.task_count FROM phase_stats s WHERE s.phase_id = {phase} AND s.status = project_stats.status) "
+        f"WHERE project_id = {project} AND status IN (SELECT status FROM phase_stats WHERE phase_id = {phase}); "
+        f"DELETE FROM project_stats WHERE project_id = {project} AND task_count <= 0;"
+    )
+
+
+ROLLUP_TRIGGERS = [
+    f"CREATE TRIGGER IF NOT EXISTS task_stats_ai AFTER INSERT ON task BEGIN {_add('new.phase_id', 'new.status')} END",
+    f"CREATE TRIGGER IF NOT EXISTS task_stats_ad AFTER DELETE ON task BEGIN {_remove('old.phase_id', 'old.status')} END",
+    f"CREATE TRIGGER IF NOT EXISTS task_stats_au AFTER UPDATE OF status, phase_id ON task "
+    f"BEGIN {_remove('old.phase_id', 'old.status')} {_add('new.phase_id', 'new.status')} END",
+    f"CREATE TRIGGER IF NOT EXISTS phase_stats_au AFTER UPDATE OF project_id ON phase "
+    f"BEGIN {_detach_phase('old.id', 'old.project_id')} "
+    f"INSERT INTO project_stats (project_id, status, task_count) "
+    f"SELECT new.project_id, status, task_count FROM phase_stats WHERE phase_id = new.id AND new.project_id IS NOT NULL "
+    f"ON CONFLICT (project_id, status) DO UPDATE SET task_count = task_count + excluded.task_count; END",
+    f"CREATE TRIGGER IF NOT EXISTS phase_stats_ad AFTER DELETE ON phase "
+    f"BEGIN {_detach_phase('old.id', 'old.project_id')} DELETE FROM phase_stats WHERE phase_id = old.id; END",
+]
+
+# Archived tasks keep counting (see TASK_ROWS), so moving a row from task to
+# task_archive nets out to no change.
+ARCHIVE_ROLLUP_TRIGGERS = [
+    f"CREATE TRIGGER IF NOT EXISTS task_archive_stats_ai AFTER INSERT ON task_archive "
+    f"BEGIN {_add('new.phase_id', 'new.status')} END",
+    f"CREATE TRIGGER IF NOT EXISTS task_archive_stats_ad AFTER DELETE ON task_archive "
+    f"BEGIN {_remove('old.phase_id', 'old.status')} END",
+]
+
+# Every task row the rollups count: live and archived (db.archive) alike,
+# so archiving does not change progress.
+TASK_ROWS = "(SELECT phase_id, status FROM task UNION ALL SELECT phase_id, status FROM task_archive)"
+
+
+def expected_phase_stats(source: str = TASK_ROWS) -> str:
+    """Expected phase_stats rows, computed from scratch.
+
+    Tasks whose phase no longer exists count towards neither table, matching
+    what the triggers maintain.
+    """
+    return (
+        f"SELECT task.phase_id, task.status, count(*) FROM {source} AS task "
+        f"JOIN phase ON phase.id = task.phase_id GROUP BY task.phase_id, task.status"
+    )
+
+
+def expected_project_stats(source: str = TASK_ROWS) -> str:
+    return (
+        f"SELECT phase.project_id, task.status, count(*) FROM {source} AS task "
+        f"JOIN phase ON phase.id = task.phase_id WHERE phase.project_id IS NOT NULL "
+        f"GROUP BY phase.project_id, task.status"
+    )
+
+
+def rebuild_sql(source: str = TASK_ROWS) -> list[str]:
+    return [
+        "DELETE FROM phase_stats",
+        "DELETE FROM project_stats",
+        f"INSERT INTO phase_stats (phase_id, status, task_count) {expected_phase_stats(source)}",
+        f"INSERT INTO project_stats (project_id, status, task_count) {expected_project_stats(source)}",
+    ]
+
+
+# The insert triggers' work for `:task_count` new rows of one (phase, status),
+# for bulk loads that run with the triggers dropped.
+ADD_COUNT_SQL = [
+    "INSERT INTO phase_stats (phase_id, status, task_count) "
+    "SELECT id, :status, :task_count FROM phase WHERE id = :phase_id "
+    "ON CONFLICT (phase_id, status) DO UPDATE SET task_count = task_count + excluded.task_count",
+    "INSERT INTO project_stats (project_id, status, task_count) "
+    "SELECT project_id, :status, :task_count FROM phase WHERE id = :phase_id AND project_id IS NOT NULL "
+    "ON CONFLICT (project_id, status) DO UPDATE SET task_count = task_count + excluded.task_count",
+]
+
+
+EXPECTED_PHASE_STATS = expected_phase_stats()
+EXPECTED_PROJECT_STATS = expected_project_stats()
+REBUILD_SQL = rebuild_sql()
+
+
+def create_rollups(connection: Connection) -> None:
+    """Create missing rollup triggers; backfill when they are new."""
+    existing = {
+        row[0] for row in connection.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name = 'task_stats_ai'"
+        )
+    }
+    for statement in ROLLUP_TRIGGERS + ARCHIVE_ROLLUP_TRIGGERS:
+        connection.exec_driver_sql(statement)
+    if not existing:
+        for statement in REBUILD_SQL:
+            connection.exec_driver_sql(statement)
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _create_rollups_after_tables(target, connection: Connection, **kw) -> None:
+    create_rollups(connection)
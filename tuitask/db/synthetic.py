@@ -0,0 +1,265 @@
+"""Reproducible synthetic datasets for benchmarks and profiling (`tuitask seed`).
+
+Projects and phases are few and go through the crud bulk inserts. Tasks are
+bulk-loaded: the task triggers (change feed, rollups, FTS) and secondary
+indexes are dropped for the load, their work is redone once, set-based, and
+they are restored in the same transaction. Every value comes from one
+random.Random(seed), so the same arguments give the same database.
+"""
+from __future__ import annotations
+
+import math
+import random
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Iterator
+
+from sqlmodel import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from tuitask.db.crud import phases as phase_crud
+from tuitask.db.crud import projects as project_crud
+from tuitask.db.crud import tags as tag_crud
+from tuitask.db.fts import FTS_SOURCES
+from tuitask.db.rollups import ADD_COUNT_SQL
+from tuitask.models.phase import Phase
+from tuitask.models.project import Project, ProjectLocation
+from tuitask.models.tag import TaskTag
+
+# Weighted toward finished work, like a long-running tracker.
+STATUS_WEIGHTS = {
+    "Completed": 40,
+    "Assigned": 20,
+    "Started": 18,
+    "Not assigned": 8,
+    "Needs sign-off": 7,
+    "Blocked": 7,
+}
+PRIORITY_WEIGHTS = {1: 10, 2: 20, 3: 40, 4: 20, 5: 10}
+# How many tags a task carries.
+TAG_COUNT_WEIGHTS = {0: 15, 1: 40, 2: 30, 3: 15}
+
+ASSIGNEES = (
+    "Ada", "Sam", "Riley", "Jordan", "Alex", "Morgan", "Casey", "Taylor", "Jamie", "Robin",
+    "Quinn", "Avery", "Devon", "Harper", "Kai", "Noor", "Priya", "Mateo", "Yuki", "Lena",
+    "Omar", "Ines", "Tomas", "Zara", "Felix", "Mina", "Hugo", "Sana", "Nico", "Elif",
+)
+TAGS = (
+    "ui", "api", "auth", "infra", "hosting", "design", "docs", "bug", "perf", "db",
+    "ai", "keys", "billing", "mobile", "search", "security", "ops", "qa", "release", "i18n",
+)
+PHASE_NAMES = ("Planning", "Design", "Development", "Testing", "Release", "Maintenance")
+VERBS = ("Fix", "Ship", "Draft", "Review", "Refactor", "Document", "Test", "Migrate", "Design", "Profile")
+SUBJECTS = (
+    "login flow", "task card UI", "billing page", "search index", "sync worker", "release notes",
+    "API client", "settings screen", "backup job", "onboarding emails", "audit log", "cache layer",
+)
+PROJECT_SUBJECTS = ("Website", "Mobile App", "Data Platform", "Billing", "Internal Tools", "Infra")
+
+# Tasks generated and inserted per statement; bounds memory at any size.
+LOAD_CHUNK = 50_000
+
+
+def zipf_weights(count: int) -> list[float]:
+    """A few heavy hitters and a long tail."""
+    return [1 / rank for rank in range(1, count + 1)]
+
+
+@dataclass(frozen=True)
+class SeedPlan:
+    projects: int
+    phases: int
+    tasks: int
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class SeedResult:
+    project_ids: list[int]
+    phase_ids: list[int]
+    first_task_id: int
+    tasks: int
+
+
+TASK_LOAD_COLUMNS = (
+    "id", "title", "status", "assignee", "priority", "phase_id", "start_date", "due_date",
+    "tags_str", "links_str", "requires_signoff", "row_version", "updated_at",
+)
+
+# Day-offset distributions, relative to today. Finished work is in the past
+# and mostly recent; open work clusters around the coming week.
+DONE_OFFSETS = range(-365, 1)
+OPEN_OFFSETS = range(-60, 121)
+DURATIONS = range(1, 61)
+
+
+def _weights(values: range, density) -> list[float]:
+    return [density(value) for value in values]
+
+
+def generate_tasks(
+    rng: random.Random,
+    count: int,
+    phase_ids: list[int],
+    first_id: int,
+    row_version: int,
+    today: date,
+) -> Iterator[list[tuple]]:
+    """Yield chunks of task rows (TASK_LOAD_COLUMNS order, values as SQLite stores them).
+
+    Every column is drawn for a whole chunk with one rng.choices call; the
+    per-row work is only assembling the tuple.
+    """
+    statuses, status_weights = zip(*STATUS_WEIGHTS.items())
+    priorities, priority_weights = zip(*PRIORITY_WEIGHTS.items())
+    assignee_weights = zipf_weights(len(ASSIGNEES))
+    # Some phases are much busier than others.
+    phase_weights = [rng.paretovariate(1.5) for _ in phase_ids]
+    done_weights = _weights(DONE_OFFSETS, lambda day: math.exp(day / 60))
+    open_weights = _weights(OPEN_OFFSETS, lambda day: math.exp(-((day - 7) / 21) ** 2 / 2))
+    duration_weights = _weights(DURATIONS, lambda days: math.exp(-days / 10))
+    # Tag strings come from a pool drawn once with the TAG_COUNT_WEIGHTS mix.
+    tag_counts, tag_count_weights = zip(*TAG_COUNT_WEIGHTS.items())
+    tag_weights = zipf_weights(len(TAGS))
+    tag_pool = [
+        ",".join(dict.fromkeys(rng.choices(TAGS, tag_weights, k=size)))
+        for size in rng.choices(tag_counts, tag_count_weights, k=4096)
+    ]
+    days = {
+        offset: (today + timedelta(days=offset)).isoformat()
+        for offset in range(DONE_OFFSETS.start - DURATIONS.stop, OPEN_OFFSETS.stop)
+    }
+    now = datetime.combine(today, datetime.min.time()).isoformat(" ")
+
+    next_id = first_id
+    for start in range(0, count, LOAD_CHUNK):
+        size = min(LOAD_CHUNK, count - start)
+        columns = zip(
+            rng.choices(statuses, status_weights, k=size),
+            rng.choices(priorities, priority_weights, k=size),
+            rng.choices(ASSIGNEES, assignee_weights, k=size),
+            rng.choices(phase_ids, phase_weights, k=size),
+            rng.choices(tag_pool, k=size),
+            rng.choices(DONE_OFFSETS, done_weights, k=size),
+            rng.choices(OPEN_OFFSETS, open_weights, k=size),
+            rng.choices(DURATIONS, duration_weights, k=size),
+            rng.choices(VERBS, k=size),
+            rng.choices(SUBJECTS, k=size),
+            rng.choices((True, False), (1, 9), k=size),
+        )
+        rows = []
+        for status, priority, assignee, phase_id, tags, done, pending, duration, verb, subject, signoff in columns:
+            completed = status == "Completed"
+            due = done if completed else pending
+            rows.append((
+                next_id,
+                f"{verb} {subject} #{next_id}",
+                status,
+                "Unassigned" if status == "Not assigned" else assignee,
+                priority,
+                phase_id,
+                days[due - duration],
+                days[due],
+                tags,
+                "",
+                signoff or status == "Needs sign-off",
+                row_version,
+                days[due] + " 00:00:00" if completed else now,
+            ))
+            next_id += 1
+        yield rows
+
+
+@asynccontextmanager
+async def bulk_load_mode(session: AsyncSession, tables: tuple[str, ...]) -> AsyncIterator[None]:
+    """Drop the triggers and secondary indexes of `tables` for the block.
+
+    Indexes are rebuilt in one sorted pass afterwards, then the triggers come
+    back. DDL is transactional in SQLite, so a failed load rolls the drop back
+    too. The caller must redo whatever the triggers would have maintained.
+    """
+    names = ", ".join(f"'{table}'" for table in tables)
+    result = await session.exec(text(
+        f"SELECT type, name, sql FROM sqlite_master "
+        f"WHERE type IN ('index', 'trigger') AND tbl_name IN ({names}) AND sql IS NOT NULL"
+    ))
+    # Indexes before triggers on the way back.
+    objects = sorted(result.all(), key=lambda row: row[0] != "index")
+    for kind, name, _ in objects:
+        await session.exec(text(f"DROP {kind.upper()} {name}"))
+    yield
+    for _, _, sql in objects:
+        await session.exec(text(sql))
+
+
+async def load_tasks(session: AsyncSession, rng: random.Random, count: int, phase_ids: list[int], today: date) -> int:
+    """Bulk-load `count` generated tasks; returns the first new id."""
+    connection = await session.connection()
+    first_id = 1 + (await session.exec(text(
+        "SELECT max(coalesce((SELECT seq FROM sqlite_sequence WHERE name = 'task'), 0), "
+        "coalesce((SELECT max(id) FROM task), 0), coalesce((SELECT max(id) FROM task_archive), 0))"
+    ))).one()[0]
+    # The whole load is one change: every row gets the next clock value.
+    version = 1 + (await session.exec(text("SELECT version FROM change_clock WHERE id = 1"))).one()[0]
+    tag_ids = await tag_crud.ensure_tags(session, TAGS)
+
+    columns = ", ".join(TASK_LOAD_COLUMNS)
+    placeholders = ", ".join("?" for _ in TASK_LOAD_COLUMNS)
+    tags_at = TASK_LOAD_COLUMNS.index("tags_str")
+    status_at, phase_at = TASK_LOAD_COLUMNS.index("status"), TASK_LOAD_COLUMNS.index("phase_id")
+    counts: Counter[tuple[int, str]] = Counter()
+    async with bulk_load_mode(session, ("task", TaskTag.__tablename__)):
+        for rows in generate_tasks(rng, count, phase_ids, first_id, version, today):
+            await connection.exec_driver_sql(f"INSERT INTO task ({columns}) VALUES ({placeholders})", rows)
+            links = [(row[0], tag_ids[name]) for row in rows if row[tags_at] for name in row[tags_at].split(",")]
+            await connection.exec_driver_sql(f"INSERT INTO {TaskTag.__tablename__} (task_id, tag_id) VALUES (?, ?)", links)
+            counts.update((row[phase_at], row[status_at]) for row in rows)
+
+        # What the suspended triggers would have done, once for the whole load.
+        fts_columns = ", ".join(FTS_SOURCES["task"])
+        await session.exec(text(
+            f"INSERT INTO task_fts (rowid, {fts_columns}) SELECT id, {fts_columns} FROM task WHERE id >= :first"
+        ), params={"first": first_id})
+        await session.exec(text("UPDATE change_clock SET version = :version WHERE id = 1"), params={"version": version})
+        rollup_rows = [
+            {"phase_id": phase_id, "status": status, "task_count": task_count}
+            for (phase_id, status), task_count in counts.items()
+        ]
+        if rollup_rows:
+            for statement in ADD_COUNT_SQL:
+                await session.exec(text(statement), params=rollup_rows)
+    return first_id
+
+
+async def seed_synthetic(session: AsyncSession, plan: SeedPlan, today: date | None = None) -> SeedResult:
+    """Generate the projects, phases and tasks described by `plan`."""
+    rng = random.Random(plan.seed)
+    today = today or date.today()
+
+    project_ids = await project_crud.create_projects_bulk(session, [
+        Project(
+            name=f"{rng.choice(PROJECT_SUBJECTS)} {number}",
+            location=rng.choice(list(ProjectLocation)),
+            timezone="UTC",
+            description=f"Synthetic project {number}",
+        )
+        for number in range(1, plan.projects + 1)
+    ])
+    # Phases are dealt round-robin, so each project gets an ordered run of them.
+    phases = []
+    for index in range(plan.phases):
+        order = index // max(len(project_ids), 1) + 1
+        phases.append(Phase(
+            name=f"{PHASE_NAMES[(order - 1) % len(PHASE_NAMES)]} {order}",
+            description=f"Synthetic phase {index + 1}",
+            order=order,
+            project_id=project_ids[index % len(project_ids)] if project_ids else None,
+        ))
+    phase_ids = await phase_crud.create_phases_bulk(session, phases)
+
+    first_task_id = 0
+    if plan.tasks:
+        first_task_id = await load_tasks(session, rng, plan.tasks, phase_ids or [None], today)
+    return SeedResult(project_ids, phase_ids, first_task_id, plan.tasks)
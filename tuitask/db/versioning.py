@@ -0,0 +1,65 @@
+"""Row versions and delete tombstones for the change feed (crud.changes).
+
+Each insert or update of a task, phase or project advances the single-row
+change_clock and stamps the row with the new version; each delete leaves a
+deleted_row tombstone at the next version. Readers remember the clock they
+loaded at and later ask only for rows above it.
+"""
+from __future__ import annotations
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql.selectable import ScalarSelect
+from sqlmodel import SQLModel, select
+
+from tuitask.models.changes import ChangeClock
+
+VERSIONED_TABLES = ("task", "phase", "project")
+
+_TICK = "UPDATE change_clock SET version = version + 1 WHERE id = 1;"
+
+
+def _stamp(table: str) -> str:
+    return (
+        f"{_TICK} UPDATE {table} SET row_version = (SELECT version FROM change_clock WHERE id = 1), "
+        f"updated_at = CURRENT_TIMESTAMP WHERE id = new.id;"
+    )
+
+
+def _triggers(table: str) -> list[str]:
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {table}_version_ai AFTER INSERT ON {table} BEGIN {_stamp(table)} END",
+        # The WHEN guard skips the stamping UPDATE issued by the insert trigger.
+        f"CREATE TRIGGER IF NOT EXISTS {table}_version_au AFTER UPDATE ON {table} "
+        f"WHEN new.row_version IS old.row_version BEGIN {_stamp(table)} END",
+        # Writers that assign next_version() themselves (so RETURNING sees the
+        # final row) only need the clock caught up.
+        f"CREATE TRIGGER IF NOT EXISTS {table}_version_claim AFTER UPDATE OF row_version ON {table} "
+        f"WHEN new.row_version IS NOT old.row_version BEGIN "
+        f"UPDATE change_clock SET version = max(version, new.row_version) WHERE id = 1; END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_version_ad AFTER DELETE ON {table} BEGIN {_TICK} "
+        f"INSERT INTO deleted_row (kind, row_id, row_version) "
+        f"SELECT '{table}', old.id, version FROM change_clock WHERE id = 1; END",
+    ]
+
+
+VERSION_TRIGGERS = [statement for table in VERSIONED_TABLES for statement in _triggers(table)]
+
+
+def next_version() -> ScalarSelect:
+    """The version the next change will get, for use inside an UPDATE."""
+    return select(ChangeClock.version + 1).where(ChangeClock.id == 1).scalar_subquery()
+
+
+SEED_CLOCK = "INSERT OR IGNORE INTO change_clock (id, version) VALUES (1, 0)"
+
+
+def create_versioning(connection: Connection) -> None:
+    connection.exec_driver_sql(SEED_CLOCK)
+    for statement in VERSION_TRIGGERS:
+        connection.exec_driver_sql(statement)
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _create_versioning_after_tables(target, connection: Connection, **kw) -> None:
+    create_versioning(connection)
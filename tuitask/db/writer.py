@@ -0,0 +1,124 @@
+"""Write-behind queue: one writer coroutine, group commits, per-op futures."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, TypeVar
+
+from sqlalchemy.exc import OperationalError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from tuitask.db.engine import config, is_locked_error, retry_on_locked, unit_of_work
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+WriteOp = Callable[[AsyncSession], Awaitable[T]]
+
+_STOP = object()
+
+
+class WriteQueue:
+    """Serializes writes through a single background task.
+
+    Operations submitted within `batch_ms` of each other share one
+    transaction and therefore one commit (one fsync). Each op runs in its own
+    SAVEPOINT, so a failing op only fails its own future.
+    """
+
+    def __init__(self, batch_ms: int | None = None, max_batch: int = 256) -> None:
+        self.batch_ms = config.write_batch_ms if batch_ms is None else batch_ms
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue | None = None
+        self._writer: asyncio.Task | None = None
+
+    def submit_nowait(self, op: WriteOp[T]) -> asyncio.Future[T]:
+        """Queue `op` and return a future resolved after its batch commits."""
+        self._ensure_writer()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((op, future))
+        return future
+
+    async def submit(self, op: WriteOp[T]) -> T:
+        return await self.submit_nowait(op)
+
+    async def close(self) -> None:
+        """Flush whatever is pending and stop the writer."""
+        if self._writer is None:
+            return
+        self._queue.put_nowait(_STOP)
+        await self._writer
+        self._writer = None
+        self._queue = None
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None or self._writer.done():
+            self._queue = asyncio.Queue()
+            self._writer = asyncio.create_task(self._run(), name="tuitask-writer")
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.batch_ms / 1000
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                try:
+                    item = self._queue.get_nowait() if timeout <= 0 else await asyncio.wait_for(self._queue.get(), timeout)
+                except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._commit(batch)
+
+    async def _commit(self, batch: list[tuple[WriteOp, asyncio.Future]]) -> None:
+        pending = [(op, future) for op, future in batch if not future.cancelled()]
+        if not pending:
+            return
+        try:
+            outcomes = await self._apply(pending)
+        except Exception as error:
+            logger.exception("write batch of %d failed", len(pending))
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), (ok, value) in zip(pending, outcomes):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    @retry_on_locked
+    async def _apply(self, pending: list[tuple[WriteOp, asyncio.Future]]) -> list[tuple[bool, Any]]:
+        outcomes: list[tuple[bool, Any]] = []
+        async with unit_of_work() as session:
+            # pysqlite only opens a transaction before DML, so the first
+            # SAVEPOINT would open one and its RELEASE commit it: every op
+            # would land on its own and a retry would replay committed ops.
+            # An explicit BEGIN makes the batch one transaction; IMMEDIATE
+            # takes the write lock before any op runs.
+            connection = await session.connection()
+            await connection.exec_driver_sql("BEGIN IMMEDIATE")
+            for op, _ in pending:
+                try:
+                    async with session.begin_nested():
+                        outcomes.append((True, await op(session)))
+                except OperationalError as error:
+                    if is_locked_error(error):
+                        raise  # retry the whole batch
+                    outcomes.append((False, error))
+                except Exception as error:
+                    outcomes.append((False, error))
+        return outcomes
+
+
+write_queue = WriteQueue()
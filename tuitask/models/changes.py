@@ -0,0 +1,17 @@
+from sqlmodel import SQLModel, Field
+
+class ChangeClock(SQLModel, table=True):
+    """Single-row counter behind every row_version; advanced by db.versioning triggers."""
+    __tablename__ = "change_clock"
+
+    id: int = Field(default=1, primary_key=True)
+    version: int = 0
+
+class DeletedRow(SQLModel, table=True):
+    """Tombstone left by a delete so changes_since can report it."""
+    __tablename__ = "deleted_row"
+
+    id: int | None = Field(default=None, primary_key=True)
+    kind: str
+    row_id: int
+    row_version: int = Field(index=True)
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 from sqlmodel import SQLModel, Field, Relationship
 
@@ -10,15 +11,13 @@ class Phase(SQLModel, table=True):
     name: str
     description: str = Field(default="")
     order: int = Field(default=0)
+
+    # Change tracking, written by the db.versioning triggers.
+    row_version: int = Field(default=0, index=True)
+    updated_at: Optional[datetime] = None
     
-    project_id: Optional[int] = Field(default=None, foreign_key="project.id")
+    project_id: Optional[int] = Field(default=None, foreign_key="project.id", index=True)
     project: Optional["Project"] = Relationship(back_populates="phases")
     
     tasks: List["Task"] = Relationship(back_populates="phase")
 
-    @property
-    def progress(self) -> int:
-        if not self.tasks:
-            return 0
-        completed = sum(1 for t in self.tasks if t.status.lower() == "completed")
-        return int((completed / len(self.tasks)) * 100)
@@ -1,3 +1,4 @@
+from datetime import datetime
 from enum import Enum
 from typing import Optional, List, TYPE_CHECKING
 from sqlmodel import SQLModel, Field, Relationship
@@ -15,19 +16,10 @@ class Project(SQLModel, table=True):
     location: ProjectLocation = Field(default=ProjectLocation.LOCAL)
     timezone: str = Field(default="UTC")
     description: str = Field(default="")
+
+    # Change tracking, written by the db.versioning triggers.
+    row_version: int = Field(default=0, index=True)
+    updated_at: Optional[datetime] = None
     
     phases: List["Phase"] = Relationship(back_populates="project")
 
-    @property
-    def progress(self) -> int:
-        if not self.phases:
-            return 0
-        total_tasks = 0
-        completed_tasks = 0
-        for phase in self.phases:
-            total_tasks += len(phase.tasks)
-            completed_tasks += sum(1 for t in phase.tasks if t.status.lower() == "completed")
-        
-        if total_tasks == 0:
-            return 0
-        return int((completed_tasks / total_tasks) * 100)
@@ -0,0 +1,17 @@
+from sqlmodel import SQLModel, Field
+
+class PhaseStats(SQLModel, table=True):
+    """Task count per (phase, status); maintained by triggers in db.rollups."""
+    __tablename__ = "phase_stats"
+
+    phase_id: int = Field(foreign_key="phase.id", primary_key=True)
+    status: str = Field(primary_key=True)
+    task_count: int = 0
+
+class ProjectStats(SQLModel, table=True):
+    """Task count per (project, status); maintained by triggers in db.rollups."""
+    __tablename__ = "project_stats"
+
+    project_id: int = Field(foreign_key="project.id", primary_key=True)
+    status: str = Field(primary_key=True)
+    task_count: int = 0
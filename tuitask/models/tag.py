@@ -0,0 +1,12 @@
+from typing import Optional
+from sqlmodel import SQLModel, Field
+
+class Tag(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    # Stored normalized (stripped, lower-case) so lookups can use the index.
+    name: str = Field(index=True, unique=True)
+
+class TaskTag(SQLModel, table=True):
+    """Link row; (task_id, tag_id) serves per-task lookups, tag_id the inverted index."""
+    task_id: int = Field(foreign_key="task.id", primary_key=True)
+    tag_id: int = Field(foreign_key="tag.id", primary_key=True, index=True)
@@ -1,14 +1,26 @@
-from datetime import date
+from datetime import date, datetime
 from typing import Optional, TYPE_CHECKING
+from sqlalchemy import Column, DateTime, Index, Table, func
 from sqlmodel import SQLModel, Field, Relationship
 
 if TYPE_CHECKING:
+    import numpy as np
     from tuitask.models.phase import Phase
+    from tuitask.viewmodels.task_columns import TaskColumns
 
 class Task(SQLModel, table=True):
+    __table_args__ = (
+        # Matches TASK_ORDER; the rowid (id) tail comes free with every index.
+        Index("ix_task_phase_id_due_date", "phase_id", "due_date"),
+        # Archived tasks keep their id, so ids must never be handed out twice.
+        {"sqlite_autoincrement": True},
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
     status: str = "Assigned" # Kept for general status (e.g. Blocked), distinct from Phase? Or maybe redundant.
+    # Status and assignee filters are substring matches, which no index
+    # serves, so neither column is indexed.
     assignee: str = "Unassigned"
     priority: int = 3
     
@@ -18,13 +30,18 @@ class Task(SQLModel, table=True):
     
     # Dates
     start_date: date = Field(default_factory=date.today)
-    due_date: date = Field(default_factory=date.today)
+    due_date: date = Field(default_factory=date.today, index=True)
     
-    # Simplified for SQL MVP (Storing lists as comma strings or separate tables later)
+    # Display copy of the tags; Tag/TaskTag (crud.tags) is what queries use.
     tags_str: str = "" 
+    # Simplified for SQL MVP (Storing lists as comma strings or separate tables later)
     links_str: str = ""
     requires_signoff: bool = False
 
+    # Change tracking, written by the db.versioning triggers.
+    row_version: int = Field(default=0, index=True)
+    updated_at: Optional[datetime] = None
+
     @property
     def task_id(self) -> int:
         return self.id if self.id else 0
@@ -44,6 +61,19 @@ class Task(SQLModel, table=True):
             return ()
 
 
+# Cold storage for completed tasks moved out by db.archive: the task columns
+# plus when the row moved. Read it together with task through `task_all`.
+task_archive = Table(
+    "task_archive",
+    SQLModel.metadata,
+    *(
+        Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable, index=column.index)
+        for column in Task.__table__.columns
+    ),
+    Column("archived_at", DateTime, nullable=False, server_default=func.current_timestamp()),
+)
+
+
 def velocity_points(task: Task, today: date | None = None) -> int:
     today = today or date.today()
     base = task.priority * 10
@@ -55,4 +85,19 @@ def velocity_points(task: Task, today: date | None = None) -> int:
     urgency_bonus = max(0, 10 - days_until_due)
     return base + urgency_bonus
 
+
+def velocity_points_array(snapshot: "TaskColumns", today: date | None = None) -> "np.ndarray":
+    """velocity_points for every row of a columnar snapshot at once (needs NumPy)."""
+    import numpy as np
+
+    today = today or date.today()
+    base = snapshot.priority.astype(np.int32) * 10
+    days_until_due = snapshot.due - today.toordinal()
+    open_points = np.where(
+        days_until_due < 0,
+        np.maximum(0, base + days_until_due * 3),
+        base + np.maximum(0, 10 - days_until_due),
+    )
+    return np.where(snapshot.completed, base + np.maximum(0, days_until_due) * 2, open_points)
+
 # No global SAMPLE_TASKS, database will replace it.
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields, replace
+from datetime import date, timedelta
+
+DUE_WINDOW_DAYS = {
+    "next_7": 7,
+    "next_30": 30,
+}
+
+
+@dataclass(frozen=True)
+class TaskFilter:
+    """Filter spec shared by the filter widgets and the task queries."""
+
+    project_id: int | None = None
+    phase_id: int | None = None
+    status: str = ""
+    priority: int | None = None
+    title: str = ""
+    assignee: str = ""
+    tags: str = ""
+    due_window: str = ""
+    # Also page through task_archive (via the task_all view).
+    include_archived: bool = False
+
+    def merge(self, other: TaskFilter) -> TaskFilter:
+        """Overlay the fields `other` actually sets on top of this filter."""
+        changes = {}
+        for field in fields(other):
+            value = getattr(other, field.name)
+            if value is not None and value != "" and value is not False:
+                changes[field.name] = value
+        return replace(self, **changes)
+
+    def due_range(self, today: date | None = None) -> tuple[date | None, date | None]:
+        """Inclusive (start, end) bounds of the due window, None where open."""
+        today = today or date.today()
+        if self.due_window == "overdue":
+            return None, today - timedelta(days=1)
+        if self.due_window in DUE_WINDOW_DAYS:
+            return today, today + timedelta(days=DUE_WINDOW_DAYS[self.due_window])
+        return None, None
@@ -10,8 +10,7 @@ from textual.reactive import reactive
 from textual import on, work
 
 from tuitask.models.task import Task
-from tuitask.models.project import Project
-from tuitask.viewmodels.tasks_viewmodel import TasksViewModel
+from tuitask.viewmodels.tasks_viewmodel import TasksViewModel, TaskSnapshot
 
 
 class CreateModal(ModalScreen):
@@ -53,13 +52,13 @@ class CreateModal(ModalScreen):
     def __init__(
         self,
         default_kind: str = "task",
-        hierarchy: list[Project] | None = None,
+        snapshot: TaskSnapshot | None = None,
         default_project_id: int | None = None,
         default_phase_id: int | None = None,
     ) -> None:
         super().__init__()
         self.kind = default_kind
-        self.hierarchy = hierarchy or []
+        self.snapshot = snapshot
         self.default_project_id = default_project_id
         self.default_phase_id = default_phase_id
 
@@ -114,16 +113,15 @@ class CreateModal(ModalScreen):
 
     def project_options(self) -> list[tuple[str, int | str]]:
         options = [("Select project", "")]
-        options.extend((project.name, project.id) for project in self.hierarchy if project.id is not None)
+        if self.snapshot is not None:
+            options.extend((project.name, project.id) for project in self.snapshot.projects if project.id is not None)
         return options
 
     def phase_options(self, project_id: int | None) -> list[tuple[str, int | str]]:
         options = [("Select phase", "")]
-        if project_id is None:
+        if project_id is None or self.snapshot is None:
             return options
-        for project in self.hierarchy:
-            if project.id == project_id:
-                options.extend((phase.name, phase.id) for phase in project.phases if phase.id is not None)
+        options.extend((phase.name, phase.id) for phase in self.snapshot.phases_of(project_id) if phase.id is not None)
         return options
 
     def update_phase_select(self, project_id: int | None) -> None:
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from datetime import date
-from typing import Iterable
+import asyncio
+from typing import Callable
 
 from textual.containers import Container, Vertical
 from textual.app import ComposeResult
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual import on, work
 
 from tuitask.ui.widgets.header import HeaderBar
@@ -15,10 +16,12 @@ from tuitask.ui.widgets.phases import PhasesPanel, FiltersPanel
 from tuitask.ui.widgets.tasks_toolbar import TasksToolbar
 from tuitask.ui.widgets.tasks_table import TasksTableView
 from tuitask.ui.widgets.tasks_cards import TasksCardsView
-from tuitask.ui.widgets.tasks_shared import TaskDisplay
-from tuitask.ui.screens.create_modal import CreateModal
+from tuitask.ui.widgets.tasks_shared import LoadMore, TaskDisplay
+from tuitask.models.task import Task
+from tuitask.models.task_filter import TaskFilter
 
-from tuitask.viewmodels.tasks_viewmodel import TasksViewModel
+from tuitask.db.engine import wait_until_ready
+from tuitask.viewmodels.tasks_viewmodel import TasksViewModel, TaskPager, TaskSnapshot
 
 class TasksScreen(Container):
     """Bagels-inspired Tasks screen."""
@@ -34,10 +37,14 @@ class TasksScreen(Container):
     selected_project_id: reactive[int | None] = reactive(None)
     selected_phase_id: reactive[int | None] = reactive(None)
     view_mode: reactive[str] = reactive("table")
-    hierarchy_cache: reactive[list] = reactive([])
     tasks_cache: reactive[list] = reactive([])
-    table_filters: reactive[dict] = reactive({})
-    panel_filters: reactive[dict] = reactive({})
+    table_filters: reactive[TaskFilter] = reactive(TaskFilter())
+    panel_filters: reactive[TaskFilter] = reactive(TaskFilter())
+
+    # Rows fetched per page; only loaded pages cross the DB boundary.
+    PAGE_SIZE = 200
+    # Seconds the filter and search inputs must be quiet before a reload.
+    DEBOUNCE_SECONDS = 0.15
 
     def compose(self) -> ComposeResult:
         yield HeaderBar(id="HeaderBar")
@@ -59,97 +66,193 @@ class TasksScreen(Container):
 
         yield FooterBar(id="FooterBar")
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.vm = TasksViewModel()
+        self.pager: TaskPager | None = None
+        self.snapshot: TaskSnapshot | None = None
+        self._debounce_timers: dict[str, Timer] = {}
+        # Bumped per task reload; a reload whose number is stale drops its result.
+        self._tasks_generation = 0
+        # The filter of the most recently requested reload, which may still be
+        # in flight; self.pager.spec only catches up once it lands.
+        self._tasks_spec: TaskFilter | None = None
+        # View modes ("table", "cards") whose widgets lag behind tasks_cache.
+        # Only the visible view is rebuilt; a stale one catches up when shown.
+        self._stale_views: set[str] = set()
+
     def on_mount(self) -> None:
         self.sync_view_mode()
-        self.load_hierarchy()
-        self.load_tasks()
-
-    @work(exclusive=True)
-    async def load_hierarchy(self) -> None:
-        vm = TasksViewModel()
-        self.hierarchy_cache = await vm.get_hierarchy()
-        self.query_one(ProjectsPanel).set_projects(self.hierarchy_cache)
+        self.load_snapshot()
+
+    @work(exclusive=True, group="tasks")
+    async def load_snapshot(self) -> None:
+        """(Re)load projects, phases and the first task page in one pass."""
+        await wait_until_ready()
+        vm = self.vm
+        spec = self.current_filter()
+        generation = self.request_tasks(spec)
+        snapshot = await asyncio.shield(vm.load_snapshot(spec, page_size=self.PAGE_SIZE))
+        if generation != self._tasks_generation:
+            return
+        self.snapshot = snapshot
+        self.pager = vm.pager(spec, page_size=self.PAGE_SIZE, first_page=snapshot.tasks)
+        self.tasks_cache = self.pager.tasks
+
+        percents = {project_id: count.percent for project_id, count in snapshot.progress.projects.items()}
+        self.query_one(ProjectsPanel).set_projects(snapshot.projects, percents)
         self.refresh_phases()
         self.refresh_task_views()
+        self.load_index()
+        if self.current_filter() != spec:
+            self.load_tasks()
+
+    @work(exclusive=True, group="index")
+    async def load_index(self) -> None:
+        """Pull small tables into memory so filter changes skip the database."""
+        await self.vm.load_index()
+
+    def debounce(self, key: str, callback: Callable[[], None]) -> None:
+        """Call `callback` once nothing else has been debounced under `key`
+        for DEBOUNCE_SECONDS; each call restarts the wait."""
+        timer = self._debounce_timers.pop(key, None)
+        if timer is not None:
+            timer.stop()
+
+        def fire() -> None:
+            del self._debounce_timers[key]
+            callback()
+
+        self._debounce_timers[key] = self.set_timer(self.DEBOUNCE_SECONDS, fire)
+
+    def cancel_debounce(self, key: str) -> None:
+        timer = self._debounce_timers.pop(key, None)
+        if timer is not None:
+            timer.stop()
+
+    def filters_changed(self) -> None:
+        """Reload tasks after a burst of filter edits, panel and table alike."""
+        self.debounce("tasks", self.reload_if_filter_changed)
+
+    def reload_if_filter_changed(self) -> None:
+        if self.snapshot is None:
+            # The snapshot load in flight catches up with the filters when it lands.
+            return
+        # Typing and deleting back to the same filter costs nothing, even
+        # while the reload for that filter is still in flight.
+        if self._tasks_spec == self.current_filter():
+            return
+        self.load_tasks()
 
-    @work(exclusive=True)
+    def request_tasks(self, spec: TaskFilter) -> int:
+        """Record a task reload for `spec`; returns its generation number."""
+        self._tasks_generation += 1
+        self._tasks_spec = spec
+        return self._tasks_generation
+
+    @work(exclusive=True, group="tasks")
     async def load_tasks(self) -> None:
-        vm = TasksViewModel()
-        self.tasks_cache = await vm.get_all_tasks()
+        """Load the first page for the current filters.
+
+        Exclusive in its group, so starting a reload cancels the one in
+        flight. The query itself is shielded: a cancelled run stops waiting
+        but lets the statement finish, so no pooled connection is torn down
+        mid-query. The generation check drops any result that still lands late.
+        """
+        # This run covers whatever a pending debounce would have loaded.
+        self.cancel_debounce("tasks")
+        if self.snapshot is None:
+            # Still starting up: the snapshot load picks up the latest filters.
+            self.load_snapshot()
+            return
+        spec = self.current_filter()
+        generation = self.request_tasks(spec)
+        pager = self.vm.pager(spec, page_size=self.PAGE_SIZE)
+        await asyncio.shield(pager.next_page())
+        if generation != self._tasks_generation:
+            return
+        self.pager = pager
+        self.tasks_cache = pager.tasks
         self.refresh_task_views()
 
+    @work(exclusive=True, group="changes")
+    async def apply_changes(self) -> None:
+        """Pull rows changed since the snapshot and patch the views with them."""
+        snapshot, pager = self.snapshot, self.pager
+        if snapshot is None or pager is None:
+            self.load_snapshot()
+            return
+        vm = self.vm
+        generation = self._tasks_generation
+        changes = await asyncio.shield(vm.changes_since(snapshot.version, pager.spec))
+        if changes.empty or snapshot is not self.snapshot:
+            return
+        snapshot.apply(changes)
+        if changes.tasks or changes.deleted_ids("task"):
+            snapshot.progress = await asyncio.shield(vm.get_progress())
+        percents = {project_id: count.percent for project_id, count in snapshot.progress.projects.items()}
+        self.query_one(ProjectsPanel).set_projects(snapshot.projects, percents)
+        if changes.phases or changes.deleted_ids("phase"):
+            self.refresh_phases()
+        # A reload requested meanwhile replaces the pager with fresher rows.
+        if generation == self._tasks_generation and pager.apply(changes):
+            self.tasks_cache = pager.tasks
+            self.refresh_task_views()
+
+    @work(exclusive=True, group="pages")
+    async def load_more_tasks(self) -> None:
+        pager = self.pager
+        if pager is None or pager.exhausted:
+            return
+        generation = self._tasks_generation
+        page = await asyncio.shield(pager.next_page())
+        if generation != self._tasks_generation:
+            return
+        items = self.build_task_items(page)
+        if self.view_mode == "table":
+            self.query_one(TasksTableView).append_tasks(items, has_more=not pager.exhausted)
+            self._stale_views.add("cards")
+        else:
+            self.query_one(TasksCardsView).append_tasks(items, has_more=not pager.exhausted)
+            self._stale_views.add("table")
+
+    def current_filter(self) -> TaskFilter:
+        spec = self.panel_filters.merge(self.table_filters)
+        return spec.merge(TaskFilter(project_id=self.selected_project_id, phase_id=self.selected_phase_id))
+
     def refresh_phases(self) -> None:
-        phases_panel = self.query_one(PhasesPanel)
-        phases = []
-        for project in self.hierarchy_cache:
-            if self.selected_project_id is None or project.id == self.selected_project_id:
-                phases.extend(project.phases)
-        phases_panel.set_phases(phases)
+        if self.snapshot is not None:
+            self.query_one(PhasesPanel).set_phases(self.snapshot.phases_of(self.selected_project_id))
 
     def refresh_task_views(self) -> None:
-        task_items = self.build_task_items()
-        table_view = self.query_one(TasksTableView)
-        cards_view = self.query_one(TasksCardsView)
-        table_view.set_tasks(task_items)
-        cards_view.set_tasks(task_items)
-
-    def build_task_items(self) -> list[TaskDisplay]:
-        phase_lookup: dict[int, tuple[int | None, str, str]] = {}
-        for project in self.hierarchy_cache:
-            for phase in project.phases:
-                phase_lookup[phase.id] = (project.id, project.name, phase.name)
+        """Show tasks_cache in the visible view; the hidden one goes stale."""
+        self._stale_views = {"table", "cards"}
+        self.refresh_visible_view()
+
+    def refresh_visible_view(self) -> None:
+        """Rebuild the visible view if tasks_cache changed while it was hidden."""
+        if self.view_mode not in self._stale_views:
+            return
+        self._stale_views.discard(self.view_mode)
+        task_items = self.build_task_items(self.tasks_cache)
+        has_more = self.pager is not None and not self.pager.exhausted
+        if self.view_mode == "table":
+            self.query_one(TasksTableView).set_tasks(task_items, has_more=has_more)
+        else:
+            self.query_one(TasksCardsView).set_tasks(task_items, has_more=has_more)
 
+    def build_task_items(self, tasks: list[Task]) -> list[TaskDisplay]:
         items: list[TaskDisplay] = []
-        for task in self.tasks_cache:
-            project_id = None
-            project_name = "Unknown Project"
-            phase_name = "Unassigned"
-            if task.phase_id in phase_lookup:
-                project_id, project_name, phase_name = phase_lookup[task.phase_id]
-            items.append(TaskDisplay(task=task, project_name=project_name, phase_name=phase_name, project_id=project_id))
-
-        return self.apply_filters(items)
-
-    def apply_filters(self, items: Iterable[TaskDisplay]) -> list[TaskDisplay]:
-        filters = {**self.panel_filters, **self.table_filters}
-        status = filters.get("status", "").strip().lower()
-        priority = filters.get("priority", "").strip()
-        title = filters.get("title", "").strip().lower()
-        assignee = filters.get("assignee", "").strip().lower()
-        tags = filters.get("tags", "").strip().lower()
-        due_window = filters.get("due_window", "")
-
-        filtered: list[TaskDisplay] = []
-        today = date.today()
-
-        for item in items:
-            task = item.task
-
-            if self.selected_project_id and item.project_id != self.selected_project_id:
-                continue
-            if self.selected_phase_id and task.phase_id != self.selected_phase_id:
-                continue
-            if status and status not in task.status.lower():
-                continue
-            if priority and str(task.priority) != priority:
-                continue
-            if title and title not in task.title.lower():
-                continue
-            if assignee and assignee not in task.assignee.lower():
-                continue
-            if tags and not any(tags in tag.lower() for tag in task.tags):
-                continue
-            if due_window:
-                days_until_due = (task.due_date - today).days
-                if due_window == "overdue" and days_until_due >= 0:
-                    continue
-                if due_window == "next_7" and not (0 <= days_until_due <= 7):
-                    continue
-                if due_window == "next_30" and not (0 <= days_until_due <= 30):
-                    continue
-            filtered.append(item)
-
-        return filtered
+        for task in tasks:
+            project, phase = self.snapshot.locate(task)
+            items.append(TaskDisplay(
+                task=task,
+                project_name=project.name if project else "Unknown Project",
+                phase_name=phase.name if phase else "Unassigned",
+                project_id=project.id if project else None,
+            ))
+
+        return items
 
     def sync_view_mode(self) -> None:
         table = self.query_one("#TasksTableView")
@@ -161,6 +264,7 @@ class TasksScreen(Container):
             cards.remove_class("-hidden")
             table.add_class("-hidden")
         self.query_one(TasksToolbar).set_mode(self.view_mode)
+        self.refresh_visible_view()
 
     def action_toggle_view(self) -> None:
         self.view_mode = "cards" if self.view_mode == "table" else "table"
@@ -170,10 +274,13 @@ class TasksScreen(Container):
         self.open_create_modal(kind=kind)
 
     def open_create_modal(self, kind: str = "task") -> None:
+        # Loaded on first use; the modal is not needed to draw the tasks view.
+        from tuitask.ui.screens.create_modal import CreateModal
+
         self.app.push_screen(
             CreateModal(
                 default_kind=kind,
-                hierarchy=self.hierarchy_cache,
+                snapshot=self.snapshot,
                 default_project_id=self.selected_project_id,
                 default_phase_id=self.selected_phase_id,
             ),
@@ -182,8 +289,7 @@ class TasksScreen(Container):
 
     def on_item_created(self, result: dict | None = None) -> None:
         if result:
-            self.load_hierarchy()
-            self.load_tasks()
+            self.apply_changes()
             self.app.notify(f"Created {result.get('type', 'item')}: {result.get('title', '')}")
 
     @on(TasksToolbar.ViewModeChanged)
@@ -196,12 +302,31 @@ class TasksScreen(Container):
         self.selected_project_id = event.project_id
         self.selected_phase_id = None
         self.refresh_phases()
-        self.refresh_task_views()
+        self.load_tasks()
 
     @on(PhasesPanel.PhaseSelected)
     def on_phase_selected(self, event: PhasesPanel.PhaseSelected) -> None:
         self.selected_phase_id = event.phase_id
-        self.refresh_task_views()
+        self.load_tasks()
+
+    @on(ProjectsPanel.SearchChanged)
+    def on_project_search(self, event: ProjectsPanel.SearchChanged) -> None:
+        self.debounce("search:project", lambda: self.start_search(self.query_one(ProjectsPanel), "project", event.query))
+
+    @on(PhasesPanel.SearchChanged)
+    def on_phase_search(self, event: PhasesPanel.SearchChanged) -> None:
+        self.debounce("search:phase", lambda: self.start_search(self.query_one(PhasesPanel), "phase", event.query))
+
+    def start_search(self, panel: ProjectsPanel | PhasesPanel, kind: str, query: str) -> None:
+        self.run_worker(self.search_panel(panel, kind, query), group=f"search:{kind}", exclusive=True)
+
+    async def search_panel(self, panel: ProjectsPanel | PhasesPanel, kind: str, query: str) -> None:
+        ids = None
+        if query:
+            # Shielded like load_tasks: a newer search cancels this one.
+            hits = await asyncio.shield(self.vm.search(query, kinds=(kind,), limit=self.PAGE_SIZE))
+            ids = [hit.id for hit in hits]
+        panel.show_matches(ids)
 
     @on(TasksToolbar.NewTaskRequested)
     def on_task_request(self, event: TasksToolbar.NewTaskRequested) -> None:
@@ -214,9 +339,13 @@ class TasksScreen(Container):
     @on(TasksTableView.FiltersChanged)
     def on_table_filters(self, event: TasksTableView.FiltersChanged) -> None:
         self.table_filters = event.filters
-        self.refresh_task_views()
+        self.filters_changed()
+
+    @on(LoadMore)
+    def on_load_more(self, event: LoadMore) -> None:
+        self.load_more_tasks()
 
     @on(FiltersPanel.FiltersChanged)
     def on_panel_filters(self, event: FiltersPanel.FiltersChanged) -> None:
         self.panel_filters = event.filters
-        self.refresh_task_views()
+        self.filters_changed()
@@ -1,10 +1,11 @@
-from textual.widgets import ListView, ListItem, Label, Input, RadioSet, RadioButton, Select
+from textual.widgets import ListView, ListItem, Label, Input, RadioSet, RadioButton, Select, Checkbox
 from textual.containers import Container
 from textual.app import ComposeResult
 from textual.message import Message
 from textual import on
 
 from tuitask.models.phase import Phase
+from tuitask.models.task_filter import TaskFilter
 
 class PhaseItem(ListItem):
     """A single phase item."""
@@ -28,6 +29,11 @@ class PhasesPanel(Container):
             self.phase_id = phase_id
             super().__init__()
 
+    class SearchChanged(Message):
+        def __init__(self, query: str):
+            self.query = query
+            super().__init__()
+
     def __init__(self):
         super().__init__(classes="Panel")
         self.border_title = "Phases (f)"
@@ -52,13 +58,17 @@ class PhasesPanel(Container):
         if isinstance(event.item, PhaseItem):
             self.post_message(self.PhaseSelected(event.item.phase.id))
 
+    def show_matches(self, phase_ids: list[int] | None) -> None:
+        """Show only `phase_ids`, in that (rank) order; None shows all."""
+        if phase_ids is None:
+            self.refresh_list(self.phases)
+            return
+        by_id = {phase.id: phase for phase in self.phases}
+        self.refresh_list([by_id[pid] for pid in phase_ids if pid in by_id])
+
     @on(Input.Changed, "#input-phase-filter")
     def on_filter_changed(self, event: Input.Changed) -> None:
-        query = event.value.strip().lower()
-        phases = self.phases
-        if query:
-            phases = [phase for phase in self.phases if query in phase.name.lower()]
-        self.refresh_list(phases)
+        self.post_message(self.SearchChanged(event.value.strip()))
 
 class FiltersPanel(Container):
     """Column B: Task Filters."""
@@ -67,7 +77,7 @@ class FiltersPanel(Container):
         self.border_title = "Filters"
 
     class FiltersChanged(Message):
-        def __init__(self, filters: dict[str, str]):
+        def __init__(self, filters: TaskFilter):
             self.filters = filters
             super().__init__()
 
@@ -97,6 +107,8 @@ class FiltersPanel(Container):
             value="",
         )
 
+        yield Checkbox("Include archived", id="filter-archived")
+
     def on_mount(self) -> None:
         self.emit_filters()
 
@@ -107,12 +119,13 @@ class FiltersPanel(Container):
             status_label = status.label.plain
             if status_label.lower() == "all":
                 status_label = ""
-        filters = {
-            "status": status_label,
-            "assignee": self.query_one("#filter-assignee", Input).value,
-            "tags": self.query_one("#filter-tags", Input).value,
-            "due_window": self.query_one("#filter-due", Select).value or "",
-        }
+        filters = TaskFilter(
+            status=status_label,
+            assignee=self.query_one("#filter-assignee", Input).value,
+            tags=self.query_one("#filter-tags", Input).value,
+            due_window=self.query_one("#filter-due", Select).value or "",
+            include_archived=self.query_one("#filter-archived", Checkbox).value,
+        )
         self.post_message(self.FiltersChanged(filters))
 
     @on(RadioSet.Changed)
@@ -122,5 +135,6 @@ class FiltersPanel(Container):
     @on(Input.Changed, "#filter-assignee")
     @on(Input.Changed, "#filter-tags")
     @on(Select.Changed, "#filter-due")
+    @on(Checkbox.Changed, "#filter-archived")
     def on_filters_changed(self, event) -> None:
         self.emit_filters()
@@ -8,13 +8,15 @@ from tuitask.models.project import Project
 
 class ProjectItem(ListItem):
     """A single project item in the list."""
-    def __init__(self, project: Project):
+    def __init__(self, project: Project, progress: int | None = None):
         super().__init__()
         self.project = project
+        self.progress = progress
 
     def compose(self) -> ComposeResult:
         yield Label(f"{self.project.name}", classes="project-name")
-        # yield Label(f"{self.project.progress}%", classes="project-progress Muted")
+        if self.progress is not None:
+            yield Label(f"{self.progress}%", classes="project-progress Muted")
 
 class ProjectsPanel(Container):
     """Column A: Projects List."""
@@ -30,36 +32,47 @@ class ProjectsPanel(Container):
             self.project_id = project_id
             super().__init__()
 
+    class SearchChanged(Message):
+        def __init__(self, query: str):
+            self.query = query
+            super().__init__()
+
     def __init__(self):
         super().__init__(classes="Panel")
         self.border_title = "Projects (p)"
         self.projects: list[Project] = []
         self.filtered_projects: list[Project] = []
+        self.progress: dict[int, int] = {}
 
     def compose(self) -> ComposeResult:
         yield Input(placeholder="Filter projects...", id="input-project-filter")
         yield ListView(id="list-projects")
 
-    def set_projects(self, projects: list[Project]):
+    def set_projects(self, projects: list[Project], progress: dict[int, int] | None = None):
         self.projects = projects
         self.filtered_projects = projects
+        self.progress = progress or {}
         self.refresh_list()
 
     def refresh_list(self) -> None:
         list_view = self.query_one("#list-projects", ListView)
         list_view.clear()
         for p in self.filtered_projects:
-            list_view.append(ProjectItem(p))
+            list_view.append(ProjectItem(p, self.progress.get(p.id)))
 
-    @on(Input.Changed, "#input-project-filter")
-    def on_filter_changed(self, event: Input.Changed) -> None:
-        query = event.value.strip().lower()
-        if not query:
+    def show_matches(self, project_ids: list[int] | None) -> None:
+        """Show only `project_ids`, in that (rank) order; None shows all."""
+        if project_ids is None:
             self.filtered_projects = self.projects
         else:
-            self.filtered_projects = [p for p in self.projects if query in p.name.lower()]
+            by_id = {p.id: p for p in self.projects}
+            self.filtered_projects = [by_id[pid] for pid in project_ids if pid in by_id]
         self.refresh_list()
 
+    @on(Input.Changed, "#input-project-filter")
+    def on_filter_changed(self, event: Input.Changed) -> None:
+        self.post_message(self.SearchChanged(event.value.strip()))
+
     @on(ListView.Selected)
     def on_selection(self, event: ListView.Selected):
         if isinstance(event.item, ProjectItem):
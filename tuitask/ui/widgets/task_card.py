@@ -18,8 +18,7 @@ class TaskCard(Container):
     def compose(self) -> ComposeResult:
         item = self.task_data
         t = item.task
-        today = date.today()
-        
+
         # Row 1: Status Dot + Title + P value
         with Horizontal(classes="card-top"):
             yield Label("●", classes=f"status-dot {self.status_class(t.status)}")
@@ -32,18 +31,49 @@ class TaskCard(Container):
 
         # Row 3: Chips
         with Horizontal(classes="card-tags"):
-            for tag in t.tags:
-                if tag:
-                    yield Label(tag.strip(), classes="chip")
-            if t.requires_signoff:
-                yield Label("SIGNOFF", classes="chip signoff")
+            yield from self.chips(item)
 
         # Row 4: Assignee + Due
         with Horizontal(classes="card-bot"):
-            yield Label(t.assignee, classes="chip")
-            due_class = "chip overdue" if t.due_date < today else "chip"
-            yield Label(f"Due {t.due_date.isoformat()}", classes=due_class)
-            yield Label(t.status, classes="chip muted")
+            yield Label(t.assignee, classes="chip card-assignee")
+            yield Label(f"Due {t.due_date.isoformat()}", classes=self.due_class(item))
+            yield Label(t.status, classes="chip muted card-status")
+
+    def show(self, task: TaskDisplay) -> None:
+        """Point this card at another task, reusing its widgets.
+
+        TasksCardsView recycles a screenful of cards this way while scrolling.
+        """
+        previous, self.task_data = self.task_data, task
+        if task == previous or not self.is_mounted:
+            return
+        t = task.task
+        self.query_one(".status-dot", Label).set_classes(f"status-dot {self.status_class(t.status)}")
+        self.query_one(".card-title", Label).update(t.title)
+        self.query_one(".card-priority", Label).update(f"P{t.priority}")
+        self.query_one(".card-crumb", Label).update(f"{task.project_name} → {task.phase_name}")
+        if (t.tags, t.requires_signoff) != (previous.task.tags, previous.task.requires_signoff):
+            # Chips are the only part whose widget count varies.
+            tags = self.query_one(".card-tags", Horizontal)
+            tags.remove_children()
+            tags.mount_all(self.chips(task))
+        self.query_one(".card-assignee", Label).update(t.assignee)
+        due = self.query_one(".card-due", Label)
+        due.update(f"Due {t.due_date.isoformat()}")
+        due.set_classes(self.due_class(task))
+        self.query_one(".card-status", Label).update(t.status)
+
+    @staticmethod
+    def chips(item: TaskDisplay) -> list[Label]:
+        t = item.task
+        chips = [Label(tag.strip(), classes="chip") for tag in t.tags if tag]
+        if t.requires_signoff:
+            chips.append(Label("SIGNOFF", classes="chip signoff"))
+        return chips
+
+    @staticmethod
+    def due_class(item: TaskDisplay) -> str:
+        return "chip card-due overdue" if item.task.due_date < date.today() else "chip card-due"
 
     @staticmethod
     def status_class(status: str) -> str:
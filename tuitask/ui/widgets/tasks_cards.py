@@ -2,30 +2,129 @@ from __future__ import annotations
 
 from textual.containers import VerticalScroll, Container
 from textual.app import ComposeResult
+from textual.widget import Widget
 
 from tuitask.ui.widgets.task_card import TaskCard
-from tuitask.ui.widgets.tasks_shared import TaskDisplay
+from tuitask.ui.widgets.tasks_shared import LoadMore, TaskDisplay
 
 class TasksCardsView(VerticalScroll):
-    """Grid view for tasks (Card View)."""
-    
+    """Grid view for tasks (Card View).
+
+    Windowed: only the rows of cards in or near the viewport exist as
+    widgets. Spacers above and below the grid stand in for the rest, so the
+    scrollbar covers the whole list, and scrolling re-points the mounted
+    cards at other tasks (TaskCard.show) instead of mounting new ones.
+    """
+
+    # Rows kept mounted beyond each edge of the viewport.
+    OVERSCAN_ROWS = 2
+    TWO_COLUMN_WIDTH = 140
+
+    # The grid layout lives here only; the theme styles the cards' look.
+    # Every row is one fixed grid-rows high, so row positions are arithmetic
+    # (see row_pitch).
+    DEFAULT_CSS = """
+    TasksCardsView #cards-grid {
+        layout: grid;
+        height: auto;
+        grid-rows: 10;
+        grid-gutter: 1 1;
+    }
+    TasksCardsView #cards-grid.one-col { grid-size: 1; }
+    TasksCardsView #cards-grid.two-col { grid-size: 2; }
+    TasksCardsView TaskCard {
+        height: 100%;
+        margin: 0;
+    }
+    /* Zero width keeps these out of Textual's spatial map, which would
+       otherwise index a tall spacer into thousands of buckets per layout. */
+    TasksCardsView .cards-spacer {
+        width: 0;
+        height: 0;
+    }
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tasks: list[TaskDisplay] = []
+        self.columns = 1
+        self.cards: list[TaskCard] = []
+        self._has_more = False
+        # (first row, row count, columns, task count) currently on screen.
+        self._window: tuple[int, int, int, int] | None = None
+
     def compose(self) -> ComposeResult:
+        yield Widget(id="cards-before", classes="cards-spacer")
         yield Container(id="cards-grid")
+        yield Widget(id="cards-after", classes="cards-spacer")
+
+    @property
+    def row_pitch(self) -> int:
+        """Lines from one card row to the next: grid-rows plus the gutter."""
+        styles = self.query_one("#cards-grid").styles
+        return int(styles.grid_rows[0].value) + styles.grid_gutter_vertical
 
     def on_mount(self) -> None:
         self.on_resize(None)
+        self.watch(self, "scroll_y", self.on_cards_scroll, init=False)
 
-    def set_tasks(self, tasks: list[TaskDisplay]) -> None:
-        grid = self.query_one("#cards-grid", Container)
-        grid.remove_children()
-        for t in tasks:
-            grid.mount(TaskCard(t))
+    def set_tasks(self, tasks: list[TaskDisplay], has_more: bool = False) -> None:
+        self.tasks = list(tasks)
+        self._has_more = has_more and bool(self.tasks)
+        self.refresh_window(force=True)
+
+    def append_tasks(self, tasks: list[TaskDisplay], has_more: bool = False) -> None:
+        """Add the next page of cards after the ones already loaded."""
+        self.tasks.extend(tasks)
+        self._has_more = has_more
+        self.refresh_window(force=True)
+
+    def on_cards_scroll(self, scroll_y: float) -> None:
+        self.refresh_window()
 
     def on_resize(self, event) -> None:
         grid = self.query_one("#cards-grid", Container)
-        if self.size.width >= 140:
+        if self.size.width >= self.TWO_COLUMN_WIDTH:
             grid.remove_class("one-col")
             grid.add_class("two-col")
+            self.columns = 2
         else:
             grid.remove_class("two-col")
             grid.add_class("one-col")
+            self.columns = 1
+        self.refresh_window()
+
+    def refresh_window(self, force: bool = False) -> None:
+        """Show the rows around the viewport; a no-op while they are already shown."""
+        rows = -(-len(self.tasks) // self.columns)
+        pitch = self.row_pitch
+        height = self.scrollable_content_region.height
+        shown = height // pitch + 1 + 2 * self.OVERSCAN_ROWS
+        # The scroll offset can trail a shrinking list until the next layout.
+        first = max(0, min(int(self.scroll_y) // pitch - self.OVERSCAN_ROWS, rows - shown))
+        count = min(shown, rows - first)
+        if self._has_more and rows - (first + count) <= self.OVERSCAN_ROWS:
+            # Cleared until the appended page reports whether more remain.
+            self._has_more = False
+            self.post_message(LoadMore())
+        window = (first, count, self.columns, len(self.tasks))
+        if window == self._window and not force:
+            return
+        self._window = window
+
+        self.query_one("#cards-before").styles.height = first * pitch
+        self.query_one("#cards-after").styles.height = (rows - first - count) * pitch
+        start = first * self.columns
+        self.fill(self.tasks[start:start + count * self.columns])
+
+    def fill(self, items: list[TaskDisplay]) -> None:
+        """Recycle the mounted cards for `items`, mounting more only if the window grew."""
+        for card, item in zip(self.cards, items):
+            card.show(item)
+            card.display = True
+        for card in self.cards[len(items):]:
+            card.display = False
+        if len(items) > len(self.cards):
+            new_cards = [TaskCard(item) for item in items[len(self.cards):]]
+            self.cards.extend(new_cards)
+            self.query_one("#cards-grid", Container).mount_all(new_cards)
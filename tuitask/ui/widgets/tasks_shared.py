@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from textual.message import Message
+
 from tuitask.models.task import Task
 
 
@@ -11,3 +13,7 @@ class TaskDisplay:
     project_name: str
     phase_name: str
     project_id: int | None = None
+
+
+class LoadMore(Message):
+    """A task view is showing rows near the last loaded one."""
@@ -3,22 +3,40 @@ from __future__ import annotations
 from datetime import date
 
 from textual.widgets import DataTable, Input
+from textual.widgets.data_table import ColumnKey
 from textual.containers import Horizontal, Container
 from textual.app import ComposeResult
 from textual import on
 from textual.message import Message
 from rich.text import Text
 
-from tuitask.ui.widgets.tasks_shared import TaskDisplay
+from tuitask.models.task_filter import TaskFilter
+from tuitask.ui.widgets.tasks_shared import LoadMore, TaskDisplay
+
+# Key of the placeholder row shown when nothing matches.
+EMPTY_ROW = "empty"
 
 class TasksTableView(Container):
     """Table view for tasks."""
 
     class FiltersChanged(Message):
-        def __init__(self, filters: dict[str, str]):
+        def __init__(self, filters: TaskFilter):
             self.filters = filters
             super().__init__()
 
+    # Rows from the bottom at which the next page is requested.
+    PREFETCH_ROWS = 20
+    # Past this many rows to drop, set_tasks refills the table instead of diffing.
+    REBUILD_OVER_REMOVALS = 100
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._current_group: object = object()
+        self._has_more = False
+        # Shown rows in order: key -> the source their cells were built from.
+        self._rows: dict[str, tuple] = {}
+        self._columns: list[ColumnKey] = []
+
     def compose(self) -> ComposeResult:
         # Filter Row
         with Horizontal(id="table-filters"):
@@ -33,74 +51,165 @@ class TasksTableView(Container):
 
     def on_mount(self):
         table = self.query_one("#tasks-data-table", DataTable)
-        table.add_columns("Due", "Pri", "Task", "Status", "Assignee", "Tags", "Phase")
+        self._columns = table.add_columns("Due", "Pri", "Task", "Status", "Assignee", "Tags", "Phase")
+        self.watch(table, "scroll_y", self.on_table_scroll, init=False)
 
     @on(Input.Changed)
     def on_filter_change(self, event: Input.Changed) -> None:
-        filters = {
-            "status": self.query_one("#f-status", Input).value,
-            "priority": self.query_one("#f-pri", Input).value,
-            "title": self.query_one("#f-title", Input).value,
-            "assignee": self.query_one("#f-assignee", Input).value,
-            "tags": self.query_one("#f-tags", Input).value,
-        }
+        priority = self.query_one("#f-pri", Input).value.strip()
+        filters = TaskFilter(
+            status=self.query_one("#f-status", Input).value,
+            priority=int(priority) if priority.isdigit() else None,
+            title=self.query_one("#f-title", Input).value,
+            assignee=self.query_one("#f-assignee", Input).value,
+            tags=self.query_one("#f-tags", Input).value,
+        )
         self.post_message(self.FiltersChanged(filters))
 
-    def set_tasks(self, tasks: list[TaskDisplay]) -> None:
+    @on(DataTable.RowHighlighted, "#tasks-data-table")
+    def on_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        self.maybe_load_more()
+
+    def on_table_scroll(self, scroll_y: float) -> None:
+        self.maybe_load_more()
+
+    def maybe_load_more(self) -> None:
+        if not self._has_more:
+            return
         table = self.query_one("#tasks-data-table", DataTable)
-        table.clear()
+        bottom = max(table.cursor_row, int(table.scroll_y) + table.scrollable_content_region.height)
+        if bottom >= table.row_count - self.PREFETCH_ROWS:
+            # Cleared until the appended page reports whether more remain.
+            self._has_more = False
+            self.post_message(LoadMore())
+
+    def set_tasks(self, tasks: list[TaskDisplay], has_more: bool = False) -> None:
+        """Show `tasks`, touching only the rows that differ from what is shown.
+
+        Rows are keyed by task id ("group:<phase id>" for the phase headers);
+        the diff removes, adds and updates rows by key, so the scroll offset
+        and the cursor's row survive a refresh.
+        """
+        self._has_more = has_more
+        self._current_group = object()
         if not tasks:
-            table.add_row(Text("No tasks match the filters.", style="dim"), "", "", "", "", "", "")
+            self._has_more = False
+            self.reconcile({EMPTY_ROW: ("empty",)})
             return
+        self.reconcile(dict(self.layout_rows(tasks)))
+        self.maybe_load_more()
 
-        sorted_tasks = sorted(tasks, key=lambda item: (item.phase_name, item.task.due_date))
-        current_group = None
+    def append_tasks(self, tasks: list[TaskDisplay], has_more: bool = False) -> None:
+        """Add the next page of rows below the ones already shown."""
+        table = self.query_one("#tasks-data-table", DataTable)
+        self._has_more = has_more
+        for key, source in self.layout_rows(tasks):
+            table.add_row(*self.row_cells(source), key=key)
+            self._rows[key] = source
+        self.maybe_load_more()
+
+    def layout_rows(self, tasks: list[TaskDisplay]) -> list[tuple[str, tuple]]:
+        """(key, source) per row, with a header wherever the phase changes.
+
+        A source is everything a row's cells are drawn from, so equal sources
+        mean the row can stay as it is.
+        """
+        # Rows arrive in the query's (phase, due date) order.
         today = date.today()
-
-        for item in sorted_tasks:
+        rows = []
+        for item in tasks:
             task = item.task
-            if item.phase_name != current_group:
-                current_group = item.phase_name
-                table.add_row(
-                    "",
-                    "",
-                    Text(f"// {current_group}", style="dim"),
-                    "",
-                    "",
-                    "",
-                    "",
-                    key=f"group:{current_group}",
-                )
-
-            status_lower = task.status.lower()
-            status_color = "green"
-            if "start" in status_lower:
-                status_color = "blue"
-            elif "blocked" in status_lower or "overdue" in status_lower:
-                status_color = "red"
-            elif "need" in status_lower:
-                status_color = "magenta"
-            dot = Text("● ", style=status_color)
-            title = Text.assemble(dot, (task.title, "bold"))
-
-            due_style = "bold red" if task.due_date < today else "white"
-            due_text = Text(task.due_date.isoformat(), style=due_style)
-
-            priority = Text(str(task.priority), style="red" if task.priority >= 4 else "white")
-            status_text = Text(f"{task.status}", style="bold")
-
-            tags = list(task.tags)
-            tag_text = Text(", ".join(tag for tag in tags if tag))
-            if task.requires_signoff:
-                tag_text.append("  SIGNOFF", style="black on #B898F0")
-
-            table.add_row(
-                due_text,
-                priority,
-                title,
-                status_text,
-                task.assignee,
-                tag_text,
-                item.phase_name,
-                key=str(task.id),
-            )
+            if task.phase_id != self._current_group:
+                self._current_group = task.phase_id
+                rows.append((f"group:{task.phase_id}", ("group", item.phase_name)))
+            rows.append((str(task.id), ("task", item, today)))
+        return rows
+
+    def reconcile(self, rows: dict[str, tuple]) -> None:
+        """Turn the shown rows into `rows` (key -> source, in display order)."""
+        table = self.query_one("#tasks-data-table", DataTable)
+        cursor_key = self.cursor_key()
+        keys = list(rows)
+        stale = [key for key in self._rows if key not in rows]
+        kept = [key for key in self._rows if key in rows]
+        # add_row only appends, so the kept rows from the first one out of
+        # place down are taken out and added back after the new ones.
+        in_place = 0
+        for shown, wanted in zip(kept, keys):
+            if shown != wanted:
+                break
+            in_place += 1
+        moved = kept[in_place:]
+        if len(stale) + len(moved) > self.REBUILD_OVER_REMOVALS:
+            # remove_row re-indexes every row below, so mass removals cost
+            # more than refilling; unchanged rows keep their built cells.
+            cells = {key: table.get_row(key) for key, source in self._rows.items() if rows.get(key) == source}
+            scroll_y = table.scroll_y
+            table.clear()
+            for key, source in rows.items():
+                table.add_row(*(cells.get(key) or self.row_cells(source)), key=key)
+            # clear() scrolls home; go back once the new rows are laid out.
+            self.call_after_refresh(table.scroll_to, y=scroll_y, animate=False)
+        else:
+            cells = {key: table.get_row(key) for key in moved if rows[key] == self._rows[key]}
+            for key in stale + moved:
+                table.remove_row(key)
+            for key in keys[:in_place]:
+                source = rows[key]
+                if self._rows[key] != source:
+                    for column, cell in zip(self._columns, self.row_cells(source)):
+                        table.update_cell(key, column, cell)
+            for key in keys[in_place:]:
+                table.add_row(*(cells.get(key) or self.row_cells(rows[key])), key=key)
+        self._rows = dict(rows)
+        if cursor_key in self._rows:
+            table.move_cursor(row=table.get_row_index(cursor_key), scroll=False)
+
+    def cursor_key(self) -> str | None:
+        table = self.query_one("#tasks-data-table", DataTable)
+        if not table.row_count:
+            return None
+        row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
+        return row_key.value
+
+    def row_cells(self, source: tuple) -> tuple:
+        """The cells of one row, built from its layout_rows source."""
+        kind = source[0]
+        if kind == "empty":
+            return (Text("No tasks match the filters.", style="dim"), "", "", "", "", "", "")
+        if kind == "group":
+            return (Text(), "", Text(f"// {source[1]}", style="dim"), "", "", "", "")
+
+        _, item, today = source
+        task = item.task
+        status_lower = task.status.lower()
+        status_color = "green"
+        if "start" in status_lower:
+            status_color = "blue"
+        elif "blocked" in status_lower or "overdue" in status_lower:
+            status_color = "red"
+        elif "need" in status_lower:
+            status_color = "magenta"
+        dot = Text("● ", style=status_color)
+        title = Text.assemble(dot, (task.title, "bold"))
+
+        due_style = "bold red" if task.due_date < today else "white"
+        due_text = Text(task.due_date.isoformat(), style=due_style)
+
+        priority = Text(str(task.priority), style="red" if task.priority >= 4 else "white")
+        status_text = Text(f"{task.status}", style="bold")
+
+        tags = list(task.tags)
+        tag_text = Text(", ".join(tag for tag in tags if tag))
+        if task.requires_signoff:
+            tag_text.append("  SIGNOFF", style="black on #B898F0")
+
+        return (
+            due_text,
+            priority,
+            title,
+            status_text,
+            task.assignee,
+            tag_text,
+            item.phase_name,
+        )
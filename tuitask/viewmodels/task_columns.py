@@ -0,0 +1,215 @@
+"""Columnar snapshot of the live tasks, for boards too big to index per task.
+
+Needs NumPy, an optional dependency (`pip install tuitask[columnar]`). One
+array per filtered column, rows kept in TASK_ORDER, so a TaskFilter becomes
+a boolean mask and its matches come out already sorted. Title and tag
+filters stay in SQL: they need the FTS and tag indexes, not a column scan.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Optional
+
+import numpy as np
+
+from tuitask.db.crud.changes import ChangeSet
+from tuitask.db.crud.tasks import TaskCursor
+from tuitask.models.task import Task
+from tuitask.models.task_filter import TaskFilter
+
+# Stands in for NULL in the id columns.
+NO_ID = -1
+
+# (id, phase_id, priority, due_date, status, assignee), as crud.tasks.get_task_rows returns them.
+Row = tuple[int, Optional[int], int, date, str, str]
+
+ROW_COLUMNS = ("id", "phase", "priority", "due", "status", "assignee")
+
+
+def task_row(task: Task) -> Row:
+    return task.id, task.phase_id, task.priority, task.due_date, task.status, task.assignee
+
+
+def _codes(values: Iterable[str], vocabulary: dict[str, int], count: int) -> np.ndarray:
+    """Dictionary-encode `values`, growing `vocabulary` with new strings."""
+    return np.fromiter((vocabulary.setdefault(value, len(vocabulary)) for value in values), dtype=np.int32, count=count)
+
+
+def _arrays(rows: Iterable[Row], statuses: dict[str, int], assignees: dict[str, int]) -> dict[str, np.ndarray]:
+    rows = list(rows)
+    count = len(rows)
+    return {
+        "id": np.fromiter((row[0] for row in rows), dtype=np.int64, count=count),
+        "phase": np.fromiter((NO_ID if row[1] is None else row[1] for row in rows), dtype=np.int64, count=count),
+        "priority": np.fromiter((row[2] for row in rows), dtype=np.int8, count=count),
+        "due": np.fromiter((row[3].toordinal() for row in rows), dtype=np.int32, count=count),
+        "status": _codes((row[4] for row in rows), statuses, count),
+        "assignee": _codes((row[5] for row in rows), assignees, count),
+    }
+
+
+def _matching(codes: np.ndarray, vocabulary: dict[str, int], wanted) -> np.ndarray:
+    """Rows whose code stands for a string passing `wanted` (given it lowercased).
+
+    One lookup per distinct string, then a gather; cheaper than np.isin.
+    """
+    table = np.zeros(len(vocabulary), dtype=bool)
+    for value, code in vocabulary.items():
+        table[code] = wanted(value.lower())
+    return table[codes]
+
+
+@dataclass
+class TaskColumns:
+    id: np.ndarray  # int64
+    phase: np.ndarray  # int64, NO_ID for no phase
+    priority: np.ndarray  # int8
+    due: np.ndarray  # int32 date ordinals
+    status: np.ndarray  # int32 codes into `statuses`
+    assignee: np.ndarray  # int32 codes into `assignees`
+    statuses: dict[str, int]
+    assignees: dict[str, int]
+    phase_project: dict[int, int | None]
+    # Owning project through the phase, NO_ID for none; set by sort().
+    project: np.ndarray | None = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Row], phase_project: dict[int, int | None]) -> TaskColumns:
+        statuses: dict[str, int] = {}
+        assignees: dict[str, int] = {}
+        columns = cls(
+            **_arrays(rows, statuses, assignees),
+            statuses=statuses,
+            assignees=assignees,
+            phase_project=phase_project,
+        )
+        columns.sort()
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    @property
+    def completed(self) -> np.ndarray:
+        return _matching(self.status, self.statuses, lambda value: value == "completed")
+
+    def can_answer(self, spec: TaskFilter) -> bool:
+        # Live rows only, and no text search.
+        return not (spec.include_archived or spec.title.strip() or spec.tags.strip())
+
+    # -- maintenance -------------------------------------------------------
+
+    def sort(self) -> None:
+        """Put the rows in TASK_ORDER and regroup by project.
+
+        NO_ID sorts below every phase id, so (phase, due, id) is TASK_ORDER
+        with the no-phase rows first.
+        """
+        order = np.lexsort((self.id, self.due, self.phase))
+        for name in ROW_COLUMNS:
+            setattr(self, name, getattr(self, name)[order])
+        self.set_phases(self.phase_project)
+
+    def set_phases(self, phase_project: dict[int, int | None]) -> None:
+        self.phase_project = phase_project
+        self.project = self.owners(self.phase)
+
+    def owners(self, phase: np.ndarray) -> np.ndarray:
+        """The project owning each phase in `phase`, NO_ID where none does."""
+        phases = np.array(sorted(self.phase_project), dtype=np.int64)
+        owners = np.array([NO_ID if self.phase_project[p] is None else self.phase_project[p] for p in phases], dtype=np.int64)
+        project = np.full(len(phase), NO_ID, dtype=np.int64)
+        if len(phases):
+            slot = np.minimum(np.searchsorted(phases, phase), len(phases) - 1)
+            known = phases[slot] == phase
+            project[known] = owners[slot[known]]
+        return project
+
+    def position(self, phase: int, due: int, task_id: int) -> int:
+        """Index at which a row with this TASK_ORDER key belongs.
+
+        The rows are sorted by phase, by due within a phase and by id within
+        a due date, so each key column narrows a binary search of the next.
+        """
+        start = int(np.searchsorted(self.phase, phase, "left"))
+        end = int(np.searchsorted(self.phase, phase, "right"))
+        dues = self.due[start:end]
+        start, end = start + int(np.searchsorted(dues, due, "left")), start + int(np.searchsorted(dues, due, "right"))
+        return start + int(np.searchsorted(self.id[start:end], task_id))
+
+    def apply(self, changes: ChangeSet) -> None:
+        """Fold one change set in: drop the touched rows, then insert their
+        new state at its TASK_ORDER position instead of re-sorting every row."""
+        phases_changed = bool(changes.phases or changes.deleted_ids("phase"))
+        if phases_changed:
+            for phase_id in changes.deleted_ids("phase"):
+                self.phase_project.pop(phase_id, None)
+            self.phase_project.update((phase.id, phase.project_id) for phase in changes.phases)
+        touched = changes.deleted_ids("task") | {task.id for task in changes.tasks}
+        if touched:
+            gone = np.flatnonzero(np.isin(self.id, list(touched)))
+            for name in ROW_COLUMNS + ("project",):
+                setattr(self, name, np.delete(getattr(self, name), gone))
+            fresh = _arrays((task_row(task) for task in changes.tasks), self.statuses, self.assignees)
+            # Sorted among themselves, rows sharing a position go in in order.
+            order = np.lexsort((fresh["id"], fresh["due"], fresh["phase"]))
+            fresh = {name: column[order] for name, column in fresh.items()}
+            fresh["project"] = self.owners(fresh["phase"])
+            positions = [
+                self.position(*key)
+                for key in zip(fresh["phase"].tolist(), fresh["due"].tolist(), fresh["id"].tolist())
+            ]
+            for name in ROW_COLUMNS + ("project",):
+                setattr(self, name, np.insert(getattr(self, name), positions, fresh[name]))
+        if phases_changed:
+            # A phase can move to another project; regroup every row.
+            self.set_phases(self.phase_project)
+
+    # -- queries -----------------------------------------------------------
+
+    def mask(self, spec: TaskFilter, today: date | None = None) -> np.ndarray:
+        """Rows matching the structured fields of `spec` (see can_answer)."""
+        matched = np.ones(len(self.id), dtype=bool)
+        if spec.phase_id is not None:
+            matched &= self.phase == spec.phase_id
+        elif spec.project_id is not None:
+            matched &= self.project == spec.project_id
+        status = spec.status.strip().lower()
+        if status:
+            matched &= _matching(self.status, self.statuses, lambda value: status in value)
+        if spec.priority is not None:
+            matched &= self.priority == spec.priority
+        assignee = spec.assignee.strip().lower()
+        if assignee:
+            matched &= _matching(self.assignee, self.assignees, lambda value: assignee in value)
+        due_start, due_end = spec.due_range(today)
+        if due_start is not None:
+            matched &= self.due >= due_start.toordinal()
+        if due_end is not None:
+            matched &= self.due <= due_end.toordinal()
+        return matched
+
+    def after(self, cursor: TaskCursor) -> np.ndarray:
+        """Rows strictly after `cursor`, like crud.tasks.seek_after."""
+        due = cursor.due_date.toordinal()
+        later_in_phase = (self.due > due) | ((self.due == due) & (self.id > cursor.id))
+        if cursor.phase_id is None:
+            return (self.phase != NO_ID) | later_in_phase
+        return (self.phase > cursor.phase_id) | ((self.phase == cursor.phase_id) & later_in_phase)
+
+    def find_ids(
+        self,
+        spec: TaskFilter,
+        limit: int | None = None,
+        offset: int = 0,
+        after: TaskCursor | None = None,
+        today: date | None = None,
+    ) -> list[int]:
+        """Ids of one window of matches, in TASK_ORDER."""
+        matched = self.mask(spec, today)
+        if after is not None:
+            matched &= self.after(after)
+        rows = np.flatnonzero(matched)
+        end = None if limit is None else offset + limit
+        return self.id[rows[offset:end]].tolist()
@@ -0,0 +1,246 @@
+"""In-memory indexes over the live tasks, so filters skip the database.
+
+TasksViewModel.load_index builds a TaskIndex when the whole live table fits
+in memory; find_tasks then answers a TaskFilter by intersecting posting sets
+instead of running SQL, and each change set from the feed updates the index
+in place.
+"""
+from __future__ import annotations
+
+import heapq
+import re
+from itertools import islice
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from typing import Hashable, Iterable
+
+from tuitask.db.crud.changes import ChangeSet
+from tuitask.db.crud.tags import normalize_tags
+from tuitask.db.crud.tasks import TaskCursor
+from tuitask.models.phase import Phase
+from tuitask.models.task import Task
+from tuitask.models.task_filter import TaskFilter
+
+# Like the unicode61 FTS tokenizer: words are runs of letters and digits.
+_WORD = re.compile(r"[^\W_]+")
+
+
+def title_tokens(text: str) -> set[str]:
+    return set(_WORD.findall(text.lower()))
+
+
+def _post(postings: dict, key: Hashable, task_id: int) -> None:
+    postings.setdefault(key, set()).add(task_id)
+
+
+def _unpost(postings: dict, key: Hashable, task_id: int) -> bool:
+    """Drop one id; True when that emptied the key."""
+    ids = postings.get(key)
+    if ids is None:
+        return False
+    ids.discard(task_id)
+    if not ids:
+        del postings[key]
+        return True
+    return False
+
+
+def _union(postings: dict[str, set[int]], keys: Iterable[str]) -> set[int]:
+    matched: set[int] = set()
+    for key in keys:
+        matched |= postings[key]
+    return matched
+
+
+class TaskIndex:
+    """Hash, sorted and token indexes over one set of live tasks.
+
+    Matching follows crud.tasks.filter_tasks: status, assignee and tags by
+    case-insensitive substring (checked against the distinct keys, then the
+    postings are unioned), title words as token prefixes like the FTS query,
+    and the due window as a range over the sorted due dates.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = (), phases: Iterable[Phase] = ()):
+        self.tasks: dict[int, Task] = {}
+        self.phase_project: dict[int, int | None] = {}
+        self.by_status: dict[str, set[int]] = {}
+        self.by_assignee: dict[str, set[int]] = {}
+        self.by_priority: dict[int, set[int]] = {}
+        self.by_phase: dict[int | None, set[int]] = {}
+        self.by_project: dict[int | None, set[int]] = {}
+        self.by_tag: dict[str, set[int]] = {}
+        self.by_token: dict[str, set[int]] = {}
+        # Sorted keys of by_token, so a prefix is a bisect range.
+        self.tokens: list[str] = []
+        # (due_date, id) in order, for the due windows.
+        self.due: list[tuple[date, int]] = []
+        # TASK_ORDER sort keys (TaskCursor.sort_key, id last), per task and in order.
+        self.keys: dict[int, tuple] = {}
+        self.order: list[tuple] = []
+
+        self.set_phases(phases)
+        for task in tasks:
+            self._post_task(task)
+            self.due.append((task.due_date, task.id))
+        self.tokens = sorted(self.by_token)
+        self.due.sort()
+        self.order = sorted(self.keys.values())
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def can_answer(self, spec: TaskFilter) -> bool:
+        # Only live rows are indexed.
+        return not spec.include_archived
+
+    # -- maintenance -------------------------------------------------------
+
+    def set_phases(self, phases: Iterable[Phase]) -> None:
+        """Replace the phase -> project map and regroup by_project."""
+        self._regroup_projects({phase.id: phase.project_id for phase in phases})
+
+    def _regroup_projects(self, phase_project: dict[int, int | None]) -> None:
+        self.phase_project = phase_project
+        self.by_project = {}
+        for phase_id, ids in self.by_phase.items():
+            self.by_project.setdefault(self.phase_project.get(phase_id), set()).update(ids)
+
+    def add(self, task: Task) -> None:
+        """Index a new task, or re-index one that changed."""
+        self.remove(task.id)
+        self._post_task(task)
+        for token in title_tokens(task.title):
+            if len(self.by_token[token]) == 1:
+                insort(self.tokens, token)
+        insort(self.due, (task.due_date, task.id))
+        insort(self.order, self.keys[task.id])
+
+    def remove(self, task_id: int) -> Task | None:
+        task = self.tasks.pop(task_id, None)
+        if task is None:
+            return None
+        _unpost(self.by_status, task.status.lower(), task_id)
+        _unpost(self.by_assignee, task.assignee.lower(), task_id)
+        _unpost(self.by_priority, task.priority, task_id)
+        _unpost(self.by_phase, task.phase_id, task_id)
+        _unpost(self.by_project, self.phase_project.get(task.phase_id), task_id)
+        for tag in normalize_tags(task.tags_str):
+            _unpost(self.by_tag, tag, task_id)
+        for token in title_tokens(task.title):
+            if _unpost(self.by_token, token, task_id):
+                del self.tokens[bisect_left(self.tokens, token)]
+        del self.due[bisect_left(self.due, (task.due_date, task_id))]
+        key = self.keys.pop(task_id)
+        del self.order[bisect_left(self.order, key)]
+        return task
+
+    def apply(self, changes: ChangeSet) -> None:
+        """Fold one change set from the feed into the index."""
+        for task_id in changes.deleted_ids("task"):
+            self.remove(task_id)
+        if changes.phases or changes.deleted_ids("phase"):
+            phase_project = dict(self.phase_project)
+            for phase_id in changes.deleted_ids("phase"):
+                phase_project.pop(phase_id, None)
+            phase_project.update((phase.id, phase.project_id) for phase in changes.phases)
+            self._regroup_projects(phase_project)
+        for task in changes.tasks:
+            self.add(task)
+
+    def _post_task(self, task: Task) -> None:
+        """Add to every posting map; the sorted lists are the caller's job."""
+        task_id = task.id
+        self.tasks[task_id] = task
+        self.keys[task_id] = TaskCursor.after(task).sort_key
+        _post(self.by_status, task.status.lower(), task_id)
+        _post(self.by_assignee, task.assignee.lower(), task_id)
+        _post(self.by_priority, task.priority, task_id)
+        _post(self.by_phase, task.phase_id, task_id)
+        _post(self.by_project, self.phase_project.get(task.phase_id), task_id)
+        for tag in normalize_tags(task.tags_str):
+            _post(self.by_tag, tag, task_id)
+        for token in title_tokens(task.title):
+            _post(self.by_token, token, task_id)
+
+    # -- queries -----------------------------------------------------------
+
+    def _prefixed(self, prefix: str) -> set[int]:
+        start = bisect_left(self.tokens, prefix)
+        end = bisect_left(self.tokens, prefix + "\U0010ffff", start)
+        return _union(self.by_token, self.tokens[start:end])
+
+    def _due_between(self, start: date | None, end: date | None) -> set[int]:
+        low = 0 if start is None else bisect_left(self.due, (start,))
+        high = len(self.due) if end is None else bisect_right(self.due, (end, float("inf")))
+        return {task_id for _, task_id in self.due[low:high]}
+
+    def matching_ids(self, spec: TaskFilter, today: date | None = None) -> set[int]:
+        """Ids of the indexed tasks that match `spec`."""
+        matched = self._match(spec, today)
+        return set(self.tasks) if matched is None else matched
+
+    def _match(self, spec: TaskFilter, today: date | None) -> set[int] | None:
+        """Like matching_ids, but None when `spec` does not narrow at all."""
+        # Each set narrows the result; the smallest is intersected first.
+        narrowing: list[set[int]] = []
+        if spec.phase_id is not None:
+            narrowing.append(self.by_phase.get(spec.phase_id, set()))
+        elif spec.project_id is not None:
+            narrowing.append(self.by_project.get(spec.project_id, set()))
+
+        status = spec.status.strip().lower()
+        if status:
+            narrowing.append(_union(self.by_status, (key for key in self.by_status if status in key)))
+        if spec.priority is not None:
+            narrowing.append(self.by_priority.get(spec.priority, set()))
+        for word in spec.title.split():
+            for token in title_tokens(word):
+                narrowing.append(self._prefixed(token))
+        assignee = spec.assignee.strip().lower()
+        if assignee:
+            narrowing.append(_union(self.by_assignee, (key for key in self.by_assignee if assignee in key)))
+        tags = spec.tags.strip().lower()
+        if tags:
+            narrowing.append(_union(self.by_tag, (key for key in self.by_tag if tags in key)))
+        due_start, due_end = spec.due_range(today)
+        if due_start is not None or due_end is not None:
+            narrowing.append(self._due_between(due_start, due_end))
+
+        if not narrowing:
+            return None
+        narrowing.sort(key=len)
+        matched = set(narrowing[0])
+        for ids in narrowing[1:]:
+            if not matched:
+                break
+            matched &= ids
+        return matched
+
+    def find(
+        self,
+        spec: TaskFilter,
+        limit: int | None = None,
+        offset: int = 0,
+        after: TaskCursor | None = None,
+        today: date | None = None,
+    ) -> list[Task]:
+        """Same window as crud.tasks.find_tasks, in TASK_ORDER."""
+        matched = self._match(spec, today)
+        start = 0 if after is None else bisect_right(self.order, after.sort_key)
+        wanted = None if limit is None else offset + limit
+        if matched is None or wanted is not None and len(matched) * 8 > len(self.order) - start:
+            # Broad filter: walk the ordered keys until the window is full.
+            keys = []
+            for key in islice(self.order, start, None):
+                if matched is None or key[-1] in matched:
+                    keys.append(key)
+                    if len(keys) == wanted:
+                        break
+        else:
+            # Narrow filter: sort just the matches.
+            keys = [self.keys[task_id] for task_id in matched]
+            if after is not None:
+                keys = [key for key in keys if key > after.sort_key]
+            keys = sorted(keys) if wanted is None else heapq.nsmallest(wanted, keys)
+        return [self.tasks[key[-1]] for key in keys[offset:]]
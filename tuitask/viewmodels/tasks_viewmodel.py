@@ -1,62 +1,247 @@
 from __future__ import annotations
 
-from tuitask.db.engine import get_session
+import asyncio
+import importlib.util
+from bisect import insort
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from tuitask.db.engine import async_session, unit_of_work
+from tuitask.db.writer import write_queue
 from tuitask.db.crud import tasks as task_crud
+from tuitask.db.crud.changes import ChangeSet
+from tuitask.db.crud.projects import ProgressCounts
+from tuitask.models.phase import Phase
+from tuitask.models.project import Project
 from tuitask.models.task import Task
+from tuitask.models.task_filter import TaskFilter
+from tuitask.viewmodels.task_index import TaskIndex
 from datetime import date, timedelta
 
+if TYPE_CHECKING:
+    from tuitask.db.crud.search import SearchHit
+    from tuitask.viewmodels.task_columns import TaskColumns
+
+# Live tasks up to which load_index keeps the whole table in memory as a
+# TaskIndex; larger tables get the columnar TaskColumns when NumPy is there.
+INDEX_MAX_TASKS = 50_000
+
+
+def columns_available() -> bool:
+    """NumPy (the `columnar` extra) is installed."""
+    return importlib.util.find_spec("numpy") is not None
+
+
+@dataclass
+class TaskSnapshot:
+    """Flat projects, phases and first task page, with prebuilt lookups.
+
+    Loaded once by TasksViewModel.load_snapshot and kept by the screen;
+    filter changes only page tasks again and reuse these maps, and later
+    writes arrive through `apply` as change sets above `version`.
+    """
+    projects: list[Project]
+    phases: list[Phase]
+    tasks: list[Task]
+    progress: ProgressCounts
+    version: int = 0
+    projects_by_id: dict[int, Project] = field(init=False)
+    phases_by_id: dict[int, Phase] = field(init=False)
+    phases_by_project: dict[int | None, list[Phase]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.projects_by_id = {project.id: project for project in self.projects}
+        self.phases_by_id = {phase.id: phase for phase in self.phases}
+        self.index_phases()
+
+    def index_phases(self) -> None:
+        self.phases_by_project = {}
+        for phase in self.phases:
+            self.phases_by_project.setdefault(phase.project_id, []).append(phase)
+
+    def apply(self, changes: ChangeSet) -> None:
+        """Fold project and phase changes into the lists and maps."""
+        if changes.projects or changes.deleted_ids("project"):
+            for project_id in changes.deleted_ids("project"):
+                self.projects_by_id.pop(project_id, None)
+            self.projects_by_id.update((project.id, project) for project in changes.projects)
+            self.projects = sorted(self.projects_by_id.values(), key=lambda project: project.id)
+        if changes.phases or changes.deleted_ids("phase"):
+            for phase_id in changes.deleted_ids("phase"):
+                self.phases_by_id.pop(phase_id, None)
+            self.phases_by_id.update((phase.id, phase) for phase in changes.phases)
+            # Same order as phase_crud.get_all_phases.
+            self.phases = sorted(
+                self.phases_by_id.values(),
+                key=lambda phase: (phase.project_id is not None, phase.project_id or 0, phase.order, phase.id),
+            )
+            self.index_phases()
+        self.version = max(self.version, changes.version)
+
+    def phases_of(self, project_id: int | None) -> list[Phase]:
+        """Phases of one project in display order; None means every phase."""
+        if project_id is None:
+            return self.phases
+        return self.phases_by_project.get(project_id, [])
+
+    def locate(self, task: Task) -> tuple[Project | None, Phase | None]:
+        phase = self.phases_by_id.get(task.phase_id)
+        project = self.projects_by_id.get(phase.project_id) if phase else None
+        return project, phase
+
+
 class TasksViewModel:
+    def __init__(self) -> None:
+        # Set by load_index; find_tasks answers from one of them instead of SQL.
+        self.index: TaskIndex | None = None
+        self.columns: TaskColumns | None = None
+
+    async def load_index(self, max_tasks: int = INDEX_MAX_TASKS) -> bool:
+        """Hold the live tasks in memory so filters skip the database.
+
+        Up to `max_tasks` they go in a TaskIndex; larger tables get a columnar
+        TaskColumns when NumPy is installed. Returns False when neither fits.
+        Call it after load_snapshot: change sets from that snapshot's version
+        onwards (changes_since) keep it current. The build runs in a thread so
+        the UI keeps drawing.
+        """
+        from tuitask.db.crud import phases as phase_crud
+        async with async_session() as session:
+            phases = await phase_crud.get_all_phases(session)
+            if await task_crud.count_tasks(session, TaskFilter()) <= max_tasks:
+                tasks = await task_crud.get_all_tasks(session)
+                self.index = await asyncio.to_thread(TaskIndex, tasks, phases)
+                self.columns = None
+                return True
+            if not columns_available():
+                self.index = self.columns = None
+                return False
+            rows = await task_crud.get_task_rows(session)
+        from tuitask.viewmodels.task_columns import TaskColumns
+        phase_project = {phase.id: phase.project_id for phase in phases}
+        self.columns = await asyncio.to_thread(TaskColumns.from_rows, rows, phase_project)
+        self.index = None
+        return True
+
     async def get_all_tasks(self) -> list[Task]:
-        async for session in get_session():
+        async with async_session() as session:
             return await task_crud.get_all_tasks(session)
-        return []
+
+    async def find_tasks(
+        self,
+        spec: TaskFilter,
+        limit: int | None = None,
+        offset: int = 0,
+        after: task_crud.TaskCursor | None = None,
+    ) -> list[Task]:
+        if self.index is not None and self.index.can_answer(spec):
+            return self.index.find(spec, limit=limit, offset=offset, after=after)
+        if self.columns is not None and self.columns.can_answer(spec):
+            task_ids = self.columns.find_ids(spec, limit=limit, offset=offset, after=after)
+            async with async_session() as session:
+                return await task_crud.get_tasks_by_ids(session, task_ids)
+        async with async_session() as session:
+            return await task_crud.find_tasks(session, spec, limit=limit, offset=offset, after=after)
+
+    async def search(
+        self,
+        text: str,
+        kinds: tuple[str, ...] = ("task", "phase", "project"),
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list["SearchHit"]:
+        from tuitask.db.crud import search as search_crud
+        async with async_session() as session:
+            return await search_crud.search(session, text, kinds=kinds, limit=limit, offset=offset)
+
+    async def changes_since(self, version: int, spec: TaskFilter | None = None) -> ChangeSet:
+        from tuitask.db.crud import changes as changes_crud
+        async with async_session() as session:
+            changes = await changes_crud.changes_since(session, version, spec)
+        for memory in (self.index, self.columns):
+            if memory is not None:
+                memory.apply(changes)
+        return changes
+
+    def pager(self, spec: TaskFilter, page_size: int = 200, first_page: list[Task] | None = None) -> "TaskPager":
+        return TaskPager(self, spec, page_size, first_page)
+
+    async def load_snapshot(self, spec: TaskFilter, page_size: int = 200) -> TaskSnapshot:
+        """Projects, phases, progress and the first task page from one session."""
+        from tuitask.db.crud import projects as project_crud
+        from tuitask.db.crud import phases as phase_crud
+        from tuitask.db.crud import stats as stats_crud
+        from tuitask.db.crud import changes as changes_crud
+        async with async_session() as session:
+            # Clock first: anything committed meanwhile shows up in the next delta.
+            version = await changes_crud.current_version(session)
+            return TaskSnapshot(
+                version=version,
+                projects=await project_crud.get_all_projects(session),
+                phases=await phase_crud.get_all_phases(session),
+                tasks=await task_crud.find_tasks(session, spec, limit=page_size),
+                progress=await stats_crud.get_rollup_progress(session),
+            )
 
     async def get_task_by_id(self, task_id: int) -> Task | None:
-        async for session in get_session():
+        async with async_session() as session:
             return await task_crud.get_task(session, task_id)
-        return None
 
-    async def add_task(self, task: Task):
-        async for session in get_session():
-            await task_crud.create_task(session, task)
+    # Writes go through the shared write queue and complete when their
+    # group commit does.
+    async def add_task(self, task: Task) -> Task:
+        return await write_queue.submit(lambda session: task_crud.create_task(session, task))
 
-    async def get_hierarchy(self) -> list["Project"]:
-        # Import inside method or at top if Project is available
-        from tuitask.models.project import Project
-        from tuitask.db.crud import projects as project_crud
-        async for session in get_session():
-            return await project_crud.get_full_hierarchy(session)
-        return []
+    async def add_tasks(self, tasks: list[Task]) -> list[int]:
+        return await write_queue.submit(lambda session: task_crud.create_tasks_bulk(session, tasks))
+
+    async def update_task(self, task_id: int, changes: dict, expected_version: int | None = None) -> Task | None:
+        """Version-checked edit; raises task_crud.TaskVersionConflict if the row moved on."""
+        return await write_queue.submit(
+            lambda session: task_crud.update_task(session, task_id, changes, expected_version)
+        )
+
+    async def set_status(self, task_ids: list[int], status: str) -> int:
+        """Set one status on many tasks with a single UPDATE."""
+        return await write_queue.submit(
+            lambda session: task_crud.update_tasks_where(session, {"status": status}, task_ids=task_ids)
+        )
+
+    async def delete_tasks(self, task_ids: list[int]) -> int:
+        return await write_queue.submit(lambda session: task_crud.delete_tasks_bulk(session, task_ids))
+
+    async def get_progress(self) -> "ProgressCounts":
+        from tuitask.db.crud import stats as stats_crud
+        async with async_session() as session:
+            return await stats_crud.get_rollup_progress(session)
 
     async def add_project(self, name: str, description: str = "") -> Project:
         """Create a new project."""
         from tuitask.db.crud import projects as project_crud
-        from tuitask.db.session import get_db_context
-        
-        async with get_db_context() as db:
-            return await project_crud.create_project(db, name, description)
+
+        project = Project(name=name, description=description)
+        return await write_queue.submit(lambda session: project_crud.create_project(session, project))
 
     async def add_phase(self, project_id: int, name: str) -> Phase:
         """Create a new phase in a project."""
-        from tuitask.db.crud import projects as project_crud
-        from tuitask.db.session import get_db_context
-        
-        async with get_db_context() as db:
-            return await project_crud.create_phase(db, project_id, name)
-            
-    async def seed_sample_data(self):
-        """Seeds initial data if DB is empty."""
+        from tuitask.db.crud import phases as phase_crud
+
+        phase = Phase(name=name, project_id=project_id)
+        return await write_queue.submit(lambda session: phase_crud.create_phase(session, phase))
+
+    async def seed_sample_data(self) -> bool:
+        """Seeds initial data if DB is empty; returns whether it did."""
         from tuitask.db.crud import projects as project_crud
         from tuitask.db.crud import phases as phase_crud
         from tuitask.models.project import Project, ProjectLocation
         from tuitask.models.phase import Phase
         
-        existing = await self.get_all_tasks()
-        if existing:
-            return
+        async with async_session() as session:
+            if await task_crud.has_tasks(session):
+                return False
 
         print("Seeding hierarchy data...")
-        async for session in get_session():
+        async with unit_of_work() as session:
             # Create Project
             proj = Project(
                 name="Website Redesign", 
@@ -67,21 +252,81 @@ class TasksViewModel:
             await project_crud.create_project(session, proj)
             
             # Create Phases
-            p1 = Phase(name="Planning", description="Requirements gathering", order=1, project_id=proj.id)
-            p2 = Phase(name="Development", description="Coding and implementation", order=2, project_id=proj.id)
-            p3 = Phase(name="Testing", description="QA and UAT", order=3, project_id=proj.id)
-            
-            await phase_crud.create_phase(session, p1)
-            await phase_crud.create_phase(session, p2)
-            await phase_crud.create_phase(session, p3)
+            p1, p2, p3 = await phase_crud.create_phases_bulk(session, [
+                Phase(name="Planning", description="Requirements gathering", order=1, project_id=proj.id),
+                Phase(name="Development", description="Coding and implementation", order=2, project_id=proj.id),
+                Phase(name="Testing", description="QA and UAT", order=3, project_id=proj.id),
+            ])
             
             # Create Tasks linked to Phases
             sample_tasks = [
-                Task(title="Ship MVP login flow", status="Started", assignee="Ada", priority=4, tags_str="auth,ui", requires_signoff=True, due_date=date.today() + timedelta(days=2), phase_id=p2.id),
-                Task(title="Set up Pi-hosted instance", status="Assigned", assignee="Sam", priority=3, tags_str="hosting,infra", due_date=date.today() + timedelta(days=5), phase_id=p2.id),
-                Task(title="Draft task card UI", status="Needs sign-off", assignee="Riley", priority=5, tags_str="design,ui", requires_signoff=True, due_date=date.today() + timedelta(days=1), phase_id=p1.id),
-                Task(title="Connect AI key store", status="Not assigned", assignee="Unassigned", priority=2, tags_str="ai,keys", due_date=date.today() + timedelta(days=8), phase_id=p2.id),
+                Task(title="Ship MVP login flow", status="Started", assignee="Ada", priority=4, tags_str="auth,ui", requires_signoff=True, due_date=date.today() + timedelta(days=2), phase_id=p2),
+                Task(title="Set up Pi-hosted instance", status="Assigned", assignee="Sam", priority=3, tags_str="hosting,infra", due_date=date.today() + timedelta(days=5), phase_id=p2),
+                Task(title="Draft task card UI", status="Needs sign-off", assignee="Riley", priority=5, tags_str="design,ui", requires_signoff=True, due_date=date.today() + timedelta(days=1), phase_id=p1),
+                Task(title="Connect AI key store", status="Not assigned", assignee="Unassigned", priority=2, tags_str="ai,keys", due_date=date.today() + timedelta(days=8), phase_id=p2),
             ]
             
-            for t in sample_tasks:
-                await task_crud.create_task(session, t)
+            await task_crud.create_tasks_bulk(session, sample_tasks)
+        return True
+
+
+class TaskPager:
+    """Lazily fetched, keyset-paginated view of the tasks matching one filter."""
+
+    def __init__(
+        self,
+        vm: TasksViewModel,
+        spec: TaskFilter,
+        page_size: int = 200,
+        first_page: list[Task] | None = None,
+    ):
+        self.vm = vm
+        self.spec = spec
+        self.page_size = page_size
+        self.tasks: list[Task] = []
+        self.cursor: task_crud.TaskCursor | None = None
+        self.exhausted = False
+        if first_page is not None:
+            self.accept(first_page)
+
+    async def next_page(self) -> list[Task]:
+        """Fetch the page after the last loaded row; empty once exhausted."""
+        if self.exhausted:
+            return []
+        page = await self.vm.find_tasks(self.spec, limit=self.page_size, after=self.cursor)
+        self.accept(page)
+        return page
+
+    def apply(self, changes: ChangeSet) -> bool:
+        """Patch the loaded rows with a change set; True if any row moved.
+
+        Changed rows are dropped, then re-inserted in TASK_ORDER when they
+        still match the filter and sort inside the loaded window. Rows past
+        the cursor arrive with later pages as usual.
+        """
+        touched = changes.deleted_ids("task") | {task.id for task in changes.tasks}
+        if not touched:
+            return False
+        kept = [task for task in self.tasks if task.id not in touched]
+        changed = len(kept) != len(self.tasks)
+        self.tasks[:] = kept
+        limit = self.cursor.sort_key if self.cursor and not self.exhausted else None
+        for task in changes.tasks:
+            if task.id not in changes.task_matches:
+                continue
+            key = task_crud.TaskCursor.after(task).sort_key
+            if limit is not None and key > limit:
+                continue
+            insort(self.tasks, task, key=lambda row: task_crud.TaskCursor.after(row).sort_key)
+            changed = True
+        if self.exhausted and self.tasks:
+            self.cursor = task_crud.TaskCursor.after(self.tasks[-1])
+        return changed
+
+    def accept(self, page: list[Task]) -> None:
+        """Record a fetched page and advance the cursor past it."""
+        if len(page) < self.page_size:
+            self.exhausted = True
+        if page:
+            self.cursor = task_crud.TaskCursor.after(page[-1])
+            self.tasks.extend(page)
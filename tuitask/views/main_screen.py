@@ -1,14 +1,18 @@
 from textual.screen import Screen
-from textual.containers import Container
 from textual.widgets import Button, ContentSwitcher
 from textual.app import ComposeResult
 from textual import on
+from typing import TYPE_CHECKING
 
 from tuitask.components.navigation import TopNav
 from tuitask.views.dashboard import DashboardView
-# Switch to V3 Tasks View
-from tuitask.ui.screens.tasks import TasksScreen
-from tuitask.ui.screens.create_modal import CreateModal
+
+# The Tasks pane (and with it the ORM, crud and view model stack) is imported
+# and mounted the first time it is shown, not at startup.
+TASKS_PANE = "tasks"
+
+if TYPE_CHECKING:
+    from tuitask.ui.screens.tasks import TasksScreen
 
 class MainScreen(Screen):
     BINDINGS = [
@@ -20,13 +24,29 @@ class MainScreen(Screen):
         yield TopNav(id="top-nav")
         with ContentSwitcher(initial="dashboard", id="content-switcher"):
             yield DashboardView(id="dashboard")
-            yield TasksScreen(id="tasks")
     
     def on_mount(self) -> None:
         pass
 
+    def tasks_pane(self) -> "TasksScreen | None":
+        """The mounted Tasks pane, or None before it was first shown."""
+        switcher = self.query_one("#content-switcher", ContentSwitcher)
+        return next((child for child in switcher.children if child.id == TASKS_PANE), None)
+
+    async def show_tasks(self) -> "TasksScreen":
+        """Switch to the Tasks pane, importing and mounting it on first use."""
+        switcher = self.query_one("#content-switcher", ContentSwitcher)
+        pane = self.tasks_pane()
+        if pane is None:
+            from tuitask.ui.screens.tasks import TasksScreen
+            pane = TasksScreen(id=TASKS_PANE)
+            await switcher.add_content(pane, set_current=True)
+        else:
+            switcher.current = TASKS_PANE
+        return pane
+
     @on(Button.Pressed)
-    def handle_nav(self, event: Button.Pressed) -> None:
+    async def handle_nav(self, event: Button.Pressed) -> None:
         import logging
         logging.debug(f"Nav Button Pressed: {event.button.id}")
         if event.button.id == "tab-home":
@@ -34,12 +54,9 @@ class MainScreen(Screen):
             self.update_nav_state("tab-home")
         elif event.button.id == "tab-tasks":
             # Switch to tasks (V3)
-            self.query_one("#content-switcher", ContentSwitcher).current = "tasks"
+            await self.show_tasks()
             self.update_nav_state("tab-tasks")
             
-            # Optional: trigger refresh on TasksScreen
-            # self.query_one(TasksScreen).load_hierarchy()
-            
         elif event.button.id == "tab-manager":
             pass
     
@@ -53,17 +70,18 @@ class MainScreen(Screen):
                 btn.variant = "default"
 
     def action_add_task(self) -> None:
-        try:
-            self.query_one(TasksScreen).open_create_modal(kind="task")
-        except Exception:
+        pane = self.tasks_pane()
+        if pane is not None:
+            pane.open_create_modal(kind="task")
+        else:
+            from tuitask.ui.screens.create_modal import CreateModal
             self.app.push_screen(CreateModal(), callback=self.on_task_added)
 
     def on_task_added(self, result = None) -> None:
         if result:
             self.app.notify(f"Created: {result.get('title', 'Item')}")
             # Refresh V3 Tasks View
-            try:
-                self.query_one(TasksScreen).load_hierarchy()
-                self.query_one(TasksScreen).load_tasks()
-            except:
-                pass
+            # Not mounted yet: it loads fresh rows when first shown.
+            pane = self.tasks_pane()
+            if pane is not None:
+                pane.apply_changes()
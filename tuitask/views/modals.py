@@ -6,7 +6,7 @@ from textual import on, work
 from tuitask.models.project import Project, ProjectLocation
 from tuitask.models.phase import Phase
 from tuitask.models.task import Task
-from tuitask.db.engine import get_session
+from tuitask.db.writer import write_queue
 from tuitask.db.crud import projects as project_crud
 from tuitask.db.crud import phases as phase_crud
 from tuitask.db.crud import tasks as task_crud
@@ -41,8 +41,7 @@ class TaskCreationModal(ModalScreen):
         # Simple creation (unassigned for now)
         task = Task(title=title, phase_id=None) 
         
-        async for session in get_session():
-             await task_crud.create_task(session, task)
+        await write_queue.submit(lambda session: task_crud.create_task(session, task))
              
         self.app.notify(f"Task '{title}' created!")
         self.dismiss(True)
@@ -83,8 +82,7 @@ class ProjectCreateModal(ModalScreen):
 
         proj = Project(name=name, timezone=tz, description=desc, location=loc)
         
-        async for session in get_session():
-            await project_crud.create_project(session, proj)
+        await write_queue.submit(lambda session: project_crud.create_project(session, proj))
         
         self.app.notify(f"Project '{name}' created!")
         self.dismiss(True)
@@ -127,8 +125,7 @@ class PhaseCreateModal(ModalScreen):
 
         phase = Phase(name=name, description=desc, order=order, project_id=self.project_id)
         
-        async for session in get_session():
-             await phase_crud.create_phase(session, phase)
+        await write_queue.submit(lambda session: phase_crud.create_phase(session, phase))
              
         self.app.notify(f"Phase '{name}' created!")
         self.dismiss(True)
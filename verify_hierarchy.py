@@ -15,15 +15,18 @@ async def verify():
     
     async for session in get_session():
         projs = await projects.get_all_projects(session)
+        counts = await projects.get_progress_counts(session)
         print(f"Projects found: {len(projs)}")
         for p in projs:
             p_loaded = await projects.get_project_with_phases(session, p.id)
+            project_progress = counts.projects.get(p.id, projects.ProgressCount())
             print(f"Project: {p_loaded.name} [Loc: {p_loaded.location}, TZ: {p_loaded.timezone}]")
             print(f"  Description: {p_loaded.description}")
-            print(f"  Progress: {p_loaded.progress}%")
+            print(f"  Progress: {project_progress.percent}%")
             
             for phase in p_loaded.phases:
-                print(f"  Phase: {phase.name} (Order {phase.order}) - {phase.progress}% done")
+                phase_progress = counts.phases.get(phase.id, projects.ProgressCount())
+                print(f"  Phase: {phase.name} (Order {phase.order}) - {phase_progress.percent}% done")
                 print(f"    Desc: {phase.description}")
 
 if __name__ == "__main__":
@@ -0,0 +1,33 @@
+import asyncio
+import sys
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+
+async def verify(url: str) -> int:
+    print(f"Checking hot query plans against {url} ...")
+    # Import models to ensure they are registered in metadata
+    from tuitask.models.project import Project
+    from tuitask.models.tag import Tag, TaskTag
+    from tuitask.db import fts
+    from tuitask.db.query_plans import HOT_QUERIES, check_query_plans
+
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        if url.endswith(":memory:"):
+            await conn.run_sync(SQLModel.metadata.create_all)
+        failures = await check_query_plans(conn)
+    await engine.dispose()
+
+    for name in HOT_QUERIES:
+        print(f"  {'SCAN' if name in failures else 'ok  '}  {name}")
+        for detail in failures.get(name, []):
+            print(f"          {detail}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    # Default: a fresh schema built from the models. Pass a URL to check a live DB.
+    url = sys.argv[1] if len(sys.argv) > 1 else "sqlite+aiosqlite:///:memory:"
+    sys.exit(asyncio.run(verify(url)))
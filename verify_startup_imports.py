@@ -0,0 +1,65 @@
+import subprocess
+import sys
+
+# Modules that must not load before the first screen is drawn: the ORM and
+# database stack, and the panes that are mounted on first use.
+DEFERRED = (
+    "sqlmodel",
+    "sqlalchemy",
+    "aiosqlite",
+    "tuitask.db",
+    "tuitask.models",
+    "tuitask.viewmodels",
+    "tuitask.ui.screens",
+    "tuitask.views.modals",
+)
+
+# Cumulative import time of tuitask.app (textual included), in milliseconds.
+DEFAULT_BUDGET_MS = 500
+
+
+def import_times(module: str) -> tuple[dict[str, int], str | None]:
+    """Cumulative import time in microseconds per module, from -X importtime.
+
+    The second item is the last traceback line when the import failed.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    times, other = {}, []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            other.append(line)
+        elif "cumulative" not in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            times[name.strip()] = int(cumulative)
+    error = (other[-1] if other else "import failed") if result.returncode else None
+    return times, error
+
+
+def is_deferred(name: str) -> bool:
+    return any(name == prefix or name.startswith(prefix + ".") for prefix in DEFERRED)
+
+
+def verify(budget_ms: int) -> int:
+    print(f"Checking startup imports against a {budget_ms} ms budget ...")
+    times, error = import_times("tuitask.app")
+    if error:
+        print(f"  FAIL  {error}")
+        return 1
+    total_ms = times["tuitask.app"] / 1000
+    eager = sorted(name for name in times if is_deferred(name))
+
+    print(f"  {'ok  ' if total_ms <= budget_ms else 'SLOW'}  tuitask.app imported in {total_ms:.0f} ms")
+    print(f"  {'ok  ' if not eager else 'EAGER'}  deferred modules loaded at startup: {len(eager)}")
+    for name in eager:
+        print(f"          {name}")
+    return 1 if eager or total_ms > budget_ms else 0
+
+
+if __name__ == "__main__":
+    # Pass a budget in milliseconds to tighten or relax the time check.
+    budget_ms = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+    sys.exit(verify(budget_ms))
@@ -0,0 +1,55 @@
+import asyncio
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+# The database the repository ships, at the schema from before the migrations.
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tuitask.db")
+
+
+async def verify(path: str) -> int:
+    from tuitask.db.crud import projects as project_crud
+    from tuitask.db.crud import tasks as task_crud
+    from tuitask.db.engine import SCHEMA_VERSION, async_session, engine, init_db
+    from tuitask.models.task_filter import TaskFilter
+
+    before = sqlite3.connect(path)
+    expected = before.execute("SELECT count(*) FROM task").fetchone()[0]
+    before.close()
+
+    await init_db()
+    async with async_session() as session:
+        tasks = await task_crud.get_all_tasks(session)
+        projects = await project_crud.get_all_projects(session)
+        tagged = await task_crud.find_tasks(session, TaskFilter(tags="ui"))
+    # A second start takes the fast path and must find the same schema.
+    await init_db()
+    async with async_session() as session:
+        listed_again = await task_crud.get_all_tasks(session)
+    await engine.dispose()
+
+    after = sqlite3.connect(path)
+    user_version = after.execute("PRAGMA user_version").fetchone()[0]
+    after.close()
+
+    results = {
+        f"lists all {expected} tasks after the upgrade": len(tasks) == expected and bool(projects),
+        "tags backfilled from tags_str": bool(tagged) and all("ui" in task.tags for task in tagged),
+        f"user_version stamped {SCHEMA_VERSION}": user_version == SCHEMA_VERSION,
+        "second start lists the same tasks": len(listed_again) == expected,
+    }
+    for name, ok in results.items():
+        print(f"  {'ok  ' if ok else 'FAIL'}  {name}")
+    return 0 if all(results.values()) else 1
+
+
+if __name__ == "__main__":
+    print("Checking a pre-migration tuitask.db opens and lists its tasks ...")
+    with tempfile.TemporaryDirectory() as directory:
+        # Work on a copy; the engine reads its path from the environment at import time.
+        path = os.path.join(directory, "baseline.db")
+        shutil.copyfile(BASELINE, path)
+        os.environ["TUITASK_DB_PATH"] = path
+        sys.exit(asyncio.run(verify(path)))
@@ -0,0 +1,76 @@
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+
+PROBE = "CREATE TABLE IF NOT EXISTS write_probe (name TEXT PRIMARY KEY, n INTEGER NOT NULL DEFAULT 0)"
+
+
+def locked_error():
+    from sqlalchemy.exc import OperationalError
+    return OperationalError("INSERT INTO write_probe", {}, sqlite3.OperationalError("database is locked"))
+
+
+async def verify(path: str) -> int:
+    from sqlmodel import text
+    from tuitask.db.engine import engine
+    from tuitask.db.writer import WriteQueue
+
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(PROBE)
+    queue = WriteQueue(batch_ms=50)
+    # A second connection, outside the app's pool, to look at what is committed.
+    observer = sqlite3.connect(path)
+
+    def committed() -> dict[str, int]:
+        return dict(observer.execute("SELECT name, n FROM write_probe").fetchall())
+
+    async def bump(session, name: str) -> None:
+        await session.exec(text(
+            "INSERT INTO write_probe (name, n) VALUES (:name, 1) "
+            "ON CONFLICT (name) DO UPDATE SET n = n + 1"
+        ), params={"name": name})
+
+    seen_mid_batch: list[dict[str, int]] = []
+
+    async def first(session):
+        await bump(session, "first")
+
+    async def second(session):
+        seen_mid_batch.append(committed())
+        if len(seen_mid_batch) == 1:
+            raise locked_error()  # the whole batch is retried
+        await bump(session, "second")
+
+    async def failing(session):
+        await bump(session, "failing")
+        raise ValueError("op error")
+
+    futures = [queue.submit_nowait(first), queue.submit_nowait(second)]
+    await asyncio.gather(*futures)
+    after_retry = committed()
+    failed = queue.submit_nowait(failing)
+    await asyncio.gather(failed, queue.submit_nowait(first), return_exceptions=True)
+    await queue.close()
+    await engine.dispose()
+
+    results = {
+        "batch invisible to other connections until commit": all(not rows for rows in seen_mid_batch),
+        "retried batch writes each op once": after_retry == {"first": 1, "second": 1},
+        "a failing op rolls back only itself": isinstance(failed.exception(), ValueError)
+        and committed() == {"first": 2, "second": 1},
+    }
+    observer.close()
+    for name, ok in results.items():
+        print(f"  {'ok  ' if ok else 'FAIL'}  {name}")
+    return 0 if all(results.values()) else 1
+
+
+if __name__ == "__main__":
+    print("Checking write-queue batches are single transactions ...")
+    with tempfile.TemporaryDirectory() as directory:
+        # The engine reads its path from the environment at import time.
+        path = os.path.join(directory, "writer.db")
+        os.environ["TUITASK_DB_PATH"] = path
+        sys.exit(asyncio.run(verify(path)))